@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seleniumを使う投稿モジュール（Note / Zenn）の共通処理
+"""
+
+from .waits import (
+    DEFAULT_TIMEOUT,
+    SHORT_TIMEOUT,
+    wait_until,
+    wait_for_page_ready,
+    wait_for_url_change,
+    wait_for_any_element,
+    wait_for_clickable,
+    wait_for_invisible,
+    wait_for_text,
+)
+from .dom import SelectorCache, find_first_element, find_button, list_buttons, selector_to_locator
+from .blocking import BLOCKED_URL_PATTERNS, get_blocked_url_patterns, apply_resource_blocking
+from .network import NetworkMonitor, enable_performance_logging
+from .driver_manager import resolve_chromedriver, start_chrome, invalidate_driver_cache
+from .text_input import insert_text, set_value
+from .options import build_chrome_options
+from .pool import BrowserPool, get_browser_pool
+from .artifacts import ArtifactRecorder, prune_artifacts
+
+__all__ = [
+    'DEFAULT_TIMEOUT',
+    'SHORT_TIMEOUT',
+    'wait_until',
+    'wait_for_page_ready',
+    'wait_for_url_change',
+    'wait_for_any_element',
+    'wait_for_clickable',
+    'wait_for_invisible',
+    'wait_for_text',
+    'SelectorCache',
+    'find_first_element',
+    'find_button',
+    'list_buttons',
+    'selector_to_locator',
+    'BLOCKED_URL_PATTERNS',
+    'get_blocked_url_patterns',
+    'apply_resource_blocking',
+    'NetworkMonitor',
+    'enable_performance_logging',
+    'resolve_chromedriver',
+    'start_chrome',
+    'invalidate_driver_cache',
+    'insert_text',
+    'set_value',
+    'build_chrome_options',
+    'BrowserPool',
+    'get_browser_pool',
+    'ArtifactRecorder',
+    'prune_artifacts',
+]
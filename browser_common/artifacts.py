@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium投稿のデバッグ用スクリーンショット（アーティファクト）
+失敗時（または明示的に指定した場合）だけ撮影し、実行ごとのディレクトリに保存する
+"""
+
+import base64
+import itertools
+import os
+import re
+import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from local_cache import get_cache_dir
+
+# 撮影した画像の書き込み用（投稿処理を待たせない）
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='artifact-writer')
+
+# ArtifactRecorder が作成する実行ごとのディレクトリ名（<名前>-<YYYYMMDD>-<HHMMSS>-<pid>-<連番>）。
+# 名前には 'note-prepare' のようにハイフンを含められる（連番のない以前の形式も対象）
+RUN_DIR_PATTERN = re.compile(r'^[\w.-]+-\d{8}-\d{6}-\d+(?:-\d+)?$')
+
+# 同じプロセス・同じ秒に作成した記録のディレクトリを分ける連番
+_run_numbers = itertools.count(1)
+
+
+def get_artifacts_root() -> Path:
+    """アーティファクトの保存先（環境変数 BROWSER_ARTIFACTS_DIR、デフォルト: ~/.sns-auto-post/artifacts）"""
+    artifacts_dir = os.getenv('BROWSER_ARTIFACTS_DIR')
+    if artifacts_dir:
+        path = Path(artifacts_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    return get_cache_dir('artifacts')
+
+
+def _dir_size(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.rglob('*') if file.is_file())
+
+
+def prune_artifacts(
+    root: Optional[Path] = None,
+    max_age_days: Optional[float] = None,
+    max_total_mb: Optional[float] = None
+) -> int:
+    """
+    古いアーティファクトを削除（実行ごとのディレクトリ単位）
+
+    期限切れのものを削除した後、合計サイズが上限を超えていれば古い順に削除する。
+    保存先は環境変数で既存のフォルダを指定できるため、ArtifactRecorder が作成した
+    名前（RUN_DIR_PATTERN）のディレクトリ以外は削除しない。
+
+    Args:
+        root: 保存先（省略時は get_artifacts_root()）
+        max_age_days: 保存期間（日、省略時は環境変数 BROWSER_ARTIFACTS_MAX_AGE_DAYS、デフォルト: 7）
+        max_total_mb: 合計サイズの上限（MB、省略時は環境変数 BROWSER_ARTIFACTS_MAX_MB、デフォルト: 200）
+
+    Returns:
+        int: 削除したディレクトリ数
+    """
+    root = root or get_artifacts_root()
+    if max_age_days is None:
+        max_age_days = float(os.getenv('BROWSER_ARTIFACTS_MAX_AGE_DAYS', '7'))
+    if max_total_mb is None:
+        max_total_mb = float(os.getenv('BROWSER_ARTIFACTS_MAX_MB', '200'))
+
+    runs = sorted(
+        (path for path in root.iterdir() if path.is_dir() and RUN_DIR_PATTERN.match(path.name)),
+        key=lambda path: path.stat().st_mtime
+    )
+    now = time.time()
+    removed = 0
+
+    remaining = []
+    for run_dir in runs:
+        if now - run_dir.stat().st_mtime > max_age_days * 86400:
+            shutil.rmtree(run_dir)
+            removed += 1
+        else:
+            remaining.append((run_dir, _dir_size(run_dir)))
+
+    total = sum(size for _, size in remaining)
+    limit = max_total_mb * 1024 * 1024
+    for run_dir, size in remaining:
+        if total <= limit:
+            break
+        shutil.rmtree(run_dir)
+        total -= size
+        removed += 1
+
+    return removed
+
+
+def _write_base64(path: Path, data: str) -> None:
+    path.write_bytes(base64.b64decode(data))
+
+
+class ArtifactRecorder:
+    """
+    1回の投稿処理のスクリーンショットを管理
+
+    - capture(): 失敗時など、必ず撮影する
+    - checkpoint(): 途中経過。capture_all=True（または環境変数 BROWSER_ARTIFACTS=all）の場合のみ撮影
+    - 撮影はCDPの Page.captureScreenshot（JPEG/WebP）で行い、ファイルへの書き込みは別スレッドで行う
+    - 保存先は実行ごとのディレクトリ（<保存先>/<名前>-<日時>/）。最初に撮影したときに作成する
+    """
+
+    def __init__(self, name: str, capture_all: Optional[bool] = None):
+        """
+        Args:
+            name: 実行ディレクトリ名の接頭辞（'note'、'zenn' など）
+            capture_all: Trueの場合は途中経過も撮影（省略時は環境変数 BROWSER_ARTIFACTS=all で有効）
+        """
+        if capture_all is None:
+            capture_all = os.getenv('BROWSER_ARTIFACTS', 'failure').lower() == 'all'
+        self.name = name
+        self.capture_all = capture_all
+        self.image_format = os.getenv('BROWSER_SCREENSHOT_FORMAT', 'jpeg').lower()
+        self.quality = int(os.getenv('BROWSER_SCREENSHOT_QUALITY', '60'))
+        self.run_dir: Optional[Path] = None
+        self._pending: List[Future] = []
+        self._started_at = datetime.now().strftime('%Y%m%d-%H%M%S')
+        self._run_number = next(_run_numbers)
+
+    def _get_run_dir(self) -> Path:
+        if self.run_dir is None:
+            self.run_dir = get_artifacts_root() / f"{self.name}-{self._started_at}-{os.getpid()}-{self._run_number}"
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+        return self.run_dir
+
+    def checkpoint(self, driver, label: str) -> Optional[Path]:
+        """途中経過のスクリーンショット（capture_all の場合のみ）"""
+        if not self.capture_all:
+            return None
+        return self.capture(driver, label)
+
+    def capture(self, driver, label: str) -> Optional[Path]:
+        """
+        スクリーンショットを撮影（書き込みはバックグラウンド）
+
+        Args:
+            driver: WebDriver
+            label: ファイル名（拡張子なし）
+
+        Returns:
+            保存先のパス（撮影できなかった場合はNone）
+        """
+        extension = self.image_format if self.image_format in ('jpeg', 'webp', 'png') else 'jpeg'
+        try:
+            params = {'format': extension}
+            if extension != 'png':
+                params['quality'] = self.quality
+            data = driver.execute_cdp_cmd('Page.captureScreenshot', params)['data']
+        except (AttributeError, KeyError, WebDriverException):
+            # CDPが使えない場合はWebDriver標準のPNG
+            try:
+                data = driver.get_screenshot_as_base64()
+                extension = 'png'
+            except WebDriverException as e:
+                print(f"⚠️  スクリーンショットを撮影できません: {e}")
+                return None
+
+        path = self._get_run_dir() / f"{label}.{'jpg' if extension == 'jpeg' else extension}"
+        self._pending.append(_writer.submit(_write_base64, path, data))
+        print(f"📸 スクリーンショットを保存: {path}")
+        return path
+
+    def close(self) -> None:
+        """書き込みの完了を待ち、古いアーティファクトを削除"""
+        for future in self._pending:
+            try:
+                future.result()
+            except OSError as e:
+                print(f"⚠️  スクリーンショットの保存に失敗: {e}")
+        self._pending = []
+
+        if self.run_dir is not None:
+            try:
+                prune_artifacts(self.run_dir.parent)
+            except OSError as e:
+                print(f"⚠️  古いスクリーンショットの削除に失敗: {e}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+投稿の自動操作に不要なリソース（画像・Webフォント・動画・解析タグ・広告）の読み込みを止める
+CDPの Network.setBlockedURLs でブロックし、ページ遷移の時間とメモリ使用量を減らす
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+# URLパターン（* はワイルドカード。クエリ文字列付きのURLにも一致させるため末尾にも * を付ける）
+IMAGE_PATTERNS = ('*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.ico*')
+FONT_PATTERNS = ('*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*')
+MEDIA_PATTERNS = ('*.mp4*', '*.webm*', '*.mp3*', '*.m3u8*')
+TRACKER_PATTERNS = (
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*googleadservices.com*',
+    '*connect.facebook.net*',
+    '*analytics.twitter.com*',
+    '*static.ads-twitter.com*',
+    '*hotjar.com*',
+    '*clarity.ms*',
+    '*newrelic.com*',
+    '*nr-data.net*',
+)
+
+BLOCKED_URL_PATTERNS = IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS
+
+# 投稿先ごとに既定で許可するホスト（エディタ本体・静的ファイル・画像のCDN）
+SITE_ALLOW: Dict[str, Tuple[str, ...]] = {
+    'note': ('note.com', 'st-note.com'),
+    'zenn': ('zenn.dev', 'zenn.studio'),
+}
+
+# 許可リストのうちホストとして扱う書式（例: note.com）
+_HOST_PATTERN = re.compile(r'^[a-z0-9-]+(\.[a-z0-9-]+)+$', re.IGNORECASE)
+
+
+def is_resource_blocking_enabled() -> bool:
+    """
+    環境変数 BROWSER_BLOCK_RESOURCES=true の場合のみリソースをブロックする（デフォルト: false）
+
+    エディタの表示・操作に必要なフォントやスクリプトまで止める場合があるため、明示的に有効にした場合のみ
+    """
+    return os.getenv('BROWSER_BLOCK_RESOURCES', 'false').lower() == 'true'
+
+
+def _pattern_host(pattern: str) -> Optional[str]:
+    """パターンが対象とするホスト（'*hotjar.com*' → 'hotjar.com'、拡張子だけのパターンはNone）"""
+    body = pattern.strip('*')
+    return None if body.startswith('.') else body
+
+
+def _matches_host(pattern: str, host: str) -> bool:
+    """パターンが host（またはそのサブドメイン）のURLに一致しうるかどうか"""
+    pattern_host = _pattern_host(pattern)
+    if pattern_host is None:
+        # 拡張子だけのパターンはどのホストのURLにも一致する
+        return True
+    return pattern_host == host or pattern_host.endswith('.' + host) or host.endswith('.' + pattern_host)
+
+
+def get_blocked_url_patterns(allow: Optional[Iterable[str]] = None, site: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    ブロックするURLパターンを取得
+
+    CDPのブロックリスト（Network.setBlockedURLs）には例外を書けないため、許可リストは
+    URLではなくブロックリストのパターンに適用し、一致するパターンをブロックリストから外す。
+
+    - 文字列（例: 'png'、'woff2'）: その文字列を含むパターンを外す
+    - ホスト（例: 'note.com'）: そのホストのURLに一致しうるパターンを外す。拡張子だけのパターン
+      （'*.png*' など）はどのホストにも一致するため外れ、別のホストの解析タグ・広告だけがブロックされる
+
+    Args:
+        allow: 許可する文字列・ホスト（環境変数 BROWSER_BLOCK_ALLOW のカンマ区切りの値も加える）
+        site: 投稿先（'note' / 'zenn'）。SITE_ALLOW のエディタのホストを許可リストに加える
+
+    Returns:
+        Tuple[str, ...]: ブロックするURLパターン
+    """
+    allowed: List[str] = [entry.strip() for entry in (allow or []) if entry.strip()]
+    allowed += [entry.strip() for entry in os.getenv('BROWSER_BLOCK_ALLOW', '').split(',') if entry.strip()]
+    allowed += SITE_ALLOW.get(site or '', ())
+
+    hosts = [entry.lower() for entry in allowed if _HOST_PATTERN.match(entry)]
+    return tuple(
+        pattern for pattern in BLOCKED_URL_PATTERNS
+        if not any(entry in pattern for entry in allowed)
+        and not any(_matches_host(pattern, host) for host in hosts)
+    )
+
+
+def enable_resource_blocking(chrome_options: Options, patterns: Iterable[str]) -> None:
+    """
+    Chromeオプションにブロックするパターンを設定し、ページ読み込みを eager にする
+
+    eager では DOMContentLoaded の時点で driver.get が戻る（画像等の読み込み完了を待たない）。
+    ブロックは起動後に apply_resource_blocking で適用する。
+
+    Args:
+        chrome_options: WebDriver起動前のChromeオプション
+        patterns: ブロックするURLパターン
+    """
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.blocked_url_patterns = tuple(patterns)
+
+
+def get_blocked_url_patterns_of(chrome_options: Options) -> Tuple[str, ...]:
+    """enable_resource_blocking で設定したパターンを取得（未設定なら空）"""
+    return getattr(chrome_options, 'blocked_url_patterns', ())
+
+
+def apply_resource_blocking(driver, chrome_options: Options) -> bool:
+    """
+    起動したChromeにブロックリストを適用（同じタブでのページ遷移には引き続き適用される）
+
+    Args:
+        driver: WebDriver
+        chrome_options: 起動に使ったChromeオプション
+
+    Returns:
+        bool: 適用したかどうか
+    """
+    patterns = get_blocked_url_patterns_of(chrome_options)
+    if not patterns:
+        return False
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except (AttributeError, WebDriverException) as e:
+        print(f"⚠️  リソースのブロックを設定できません: {e}")
+        return False
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1回のexecute_scriptで要素を探すユーティリティ
+候補セレクタを1つずつfind_elementで試すとWebDriverへの往復が候補数だけ発生するため、
+候補の評価をブラウザ側でまとめて行う
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from local_cache import load_json, save_json
+
+Locator = Tuple[str, str]
+
+# 要素が表示されているかどうか（WebElement.is_displayed の簡易版）
+_IS_VISIBLE_JS = """
+function isVisible(el) {
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0
+        && style.visibility !== 'hidden' && style.display !== 'none';
+}
+"""
+
+_FIND_FIRST_JS = _IS_VISIBLE_JS + """
+const locators = arguments[0];
+const visibleOnly = arguments[1];
+for (let i = 0; i < locators.length; i++) {
+    const [kind, value] = locators[i];
+    let nodes = [];
+    try {
+        if (kind === 'xpath') {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < result.snapshotLength; j++) {
+                nodes.push(result.snapshotItem(j));
+            }
+        } else {
+            nodes = Array.from(document.querySelectorAll(value));
+        }
+    } catch (e) {
+        continue;
+    }
+    for (const el of nodes) {
+        if (!visibleOnly || isVisible(el)) {
+            return [el, i];
+        }
+    }
+}
+return null;
+"""
+
+_LIST_BUTTONS_JS = _IS_VISIBLE_JS + """
+return Array.from(document.querySelectorAll('button')).map(el => ({
+    element: el,
+    text: (el.innerText || el.textContent || '').trim(),
+    type: el.getAttribute('type'),
+    visible: isVisible(el)
+}));
+"""
+
+
+def _to_js_locator(locator: Locator) -> List[str]:
+    by, value = locator
+    if by == By.XPATH:
+        return ['xpath', value]
+    if by == By.CSS_SELECTOR:
+        return ['css', value]
+    if by == By.TAG_NAME:
+        return ['css', value]
+    raise ValueError(f"未対応のロケーターです: {by}")
+
+
+def selector_to_locator(selector: str) -> Locator:
+    """'//' で始まる文字列はXPath、それ以外はCSSセレクタとしてロケーターに変換"""
+    if selector.startswith('//') or selector.startswith('('):
+        return (By.XPATH, selector)
+    return (By.CSS_SELECTOR, selector)
+
+
+def find_first_element(
+    driver,
+    locators: List[Locator],
+    visible: bool = False
+) -> Tuple[Optional[WebElement], Optional[Locator]]:
+    """
+    候補ロケーターを先頭から評価し、最初に一致した要素を返す（WebDriverへの往復は1回）
+
+    Args:
+        driver: WebDriver
+        locators: (By.CSS_SELECTOR or By.XPATH, 値) のリスト（先頭ほど優先）
+        visible: Trueの場合、表示されている要素のみ対象
+
+    Returns:
+        (見つかった要素, 一致したロケーター)。見つからない場合は (None, None)
+    """
+    result = driver.execute_script(_FIND_FIRST_JS, [_to_js_locator(locator) for locator in locators], visible)
+    if not result:
+        return None, None
+    element, index = result
+    return element, locators[index]
+
+
+def list_buttons(driver) -> List[Dict]:
+    """
+    ページ内のすべての<button>のテキスト・type・表示状態をまとめて取得（往復は1回）
+
+    Returns:
+        List[Dict]: {'element': WebElement, 'text': str, 'type': str, 'visible': bool} のリスト
+    """
+    return driver.execute_script(_LIST_BUTTONS_JS) or []
+
+
+def find_button(driver, text: str, exact: bool = True, visible: bool = True) -> Optional[WebElement]:
+    """
+    テキストでボタンを探す
+
+    Args:
+        text: ボタンのテキスト
+        exact: Trueは完全一致、Falseは部分一致
+        visible: Trueの場合、表示されているボタンのみ対象
+
+    Returns:
+        見つかったボタン（なければNone）
+    """
+    for button in list_buttons(driver):
+        if visible and not button['visible']:
+            continue
+        matched = button['text'] == text if exact else text in button['text']
+        if matched:
+            return button['element']
+    return None
+
+
+def describe_buttons(driver, visible: bool = True) -> str:
+    """デバッグ表示用にページ内のボタンのテキストを列挙"""
+    buttons = [button for button in list_buttons(driver) if button['visible'] or not visible]
+    return '\n'.join(f"  ボタン{i}: '{button['text']}'" for i, button in enumerate(buttons))
+
+
+class SelectorCache:
+    """
+    前回うまくいったセレクタ・URLを記録し、次回はそれを最初に試す
+
+    UIの変更で候補の順番が変わっても、2回目以降は1回目の候補で見つかるようにする
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data: Dict[str, str] = load_json(self.path, default={})
+
+    def order(self, name: str, candidates: List[str]) -> List[str]:
+        """前回うまくいった候補を先頭にした候補リストを返す"""
+        last = self.data.get(name)
+        if last in candidates:
+            return [last] + [candidate for candidate in candidates if candidate != last]
+        return list(candidates)
+
+    def remember(self, name: str, value: str) -> None:
+        """うまくいった候補を記録（変化があった場合のみ保存）"""
+        if self.data.get(name) == value:
+            return
+        self.data[name] = value
+        try:
+            save_json(self.path, self.data)
+        except OSError as e:
+            print(f"⚠️  セレクタキャッシュを保存できません: {e}")
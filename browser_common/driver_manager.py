@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromeDriverの解決とキャッシュ
+毎回 ChromeDriverManager().install() でネットワークに問い合わせず、
+一度解決したドライバーのパスをローカルのChromeバージョンと紐付けて再利用する
+"""
+
+import os
+import sys
+import re
+import shutil
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from local_cache import get_cache_dir, load_json, save_json
+
+# キャッシュしたドライバーを再確認せずに使う期間
+DRIVER_CACHE_TTL = timedelta(days=7)
+
+# Chromeのバージョン確認に使うコマンド（Windows以外）
+CHROME_COMMANDS = (
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+)
+
+
+def _get_cache_path() -> Path:
+    return get_cache_dir('browser') / 'chromedriver.json'
+
+
+def get_chrome_version(binary_location: Optional[str] = None) -> Optional[str]:
+    """
+    ローカルにインストールされたChromeのバージョンを取得
+
+    Windowsではレジストリから読み取る（プロセス起動なし）。
+    それ以外は `chrome --version` を実行する。
+
+    Args:
+        binary_location: Chrome実行ファイルのパス（省略時は標準の場所を探す）
+
+    Returns:
+        バージョン文字列（例: '120.0.6099.109'）。取得できない場合はNone
+    """
+    if sys.platform == 'win32':
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Google\Chrome\BLBeacon') as key:
+                version, _ = winreg.QueryValueEx(key, 'version')
+                return version
+        except OSError:
+            return None
+
+    commands = [binary_location] if binary_location else list(CHROME_COMMANDS)
+    for command in commands:
+        if not (os.path.exists(command) or shutil.which(command)):
+            continue
+        try:
+            result = subprocess.run(
+                [command, '--version'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)', result.stdout)
+        if match:
+            return match.group(1)
+
+    return None
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    return version.split('.')[0] if version else None
+
+
+def invalidate_driver_cache() -> None:
+    """キャッシュしたドライバー情報を削除（Chrome更新でバージョンが合わなくなった場合）"""
+    cache_path = _get_cache_path()
+    if cache_path.exists():
+        cache_path.unlink()
+
+
+def resolve_chromedriver(binary_location: Optional[str] = None) -> Optional[str]:
+    """
+    ChromeDriverのパスを解決
+
+    優先順位:
+      1. 環境変数 CHROMEDRIVER_PATH（固定したドライバー）
+      2. キャッシュ（TTL内、ファイルが存在し、Chromeのメジャーバージョンが一致）
+      3. webdriver-manager でダウンロード・解決（結果をキャッシュ）
+      4. オフライン等で失敗した場合は期限切れのキャッシュ
+      5. どれもなければNone（Selenium Managerに任せる）
+
+    Args:
+        binary_location: Chrome実行ファイルのパス
+
+    Returns:
+        ChromeDriverのパス（Selenium Managerに任せる場合はNone）
+    """
+    pinned_path = os.getenv('CHROMEDRIVER_PATH')
+    if pinned_path and os.path.exists(pinned_path):
+        return pinned_path
+
+    cache_path = _get_cache_path()
+    cache = load_json(cache_path, default={})
+    cached_path = cache.get('driver_path')
+    cached_usable = bool(cached_path) and os.path.exists(cached_path)
+
+    if cached_usable:
+        resolved_at = datetime.fromisoformat(cache.get('resolved_at', '1970-01-01T00:00:00'))
+        if datetime.now() - resolved_at < DRIVER_CACHE_TTL:
+            # Windowsではバージョン確認が安価なので、Chrome更新を毎回検出する
+            if sys.platform != 'win32':
+                return cached_path
+            if _major(get_chrome_version(binary_location)) in (None, _major(cache.get('chrome_version'))):
+                return cached_path
+
+    chrome_version = get_chrome_version(binary_location)
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        if cached_usable:
+            print(f"⚠️  ChromeDriverの更新確認に失敗したため、キャッシュを使用します: {e}")
+            return cached_path
+        print(f"⚠️  ChromeDriverを解決できません。Selenium Managerに任せます: {e}")
+        return None
+
+    save_json(cache_path, {
+        'driver_path': driver_path,
+        'chrome_version': chrome_version,
+        'resolved_at': datetime.now().isoformat(timespec='seconds')
+    })
+    return driver_path
+
+
+def start_chrome(chrome_options: Options) -> webdriver.Chrome:
+    """
+    キャッシュしたChromeDriverでChromeを起動
+
+    Chromeの自動更新でドライバーのバージョンが合わなくなっていた場合は、
+    キャッシュを破棄して1回だけ解決し直す
+
+    Args:
+        chrome_options: Chromeオプション
+
+    Returns:
+        webdriver.Chrome
+    """
+    binary_location = chrome_options.binary_location or None
+    driver_path = resolve_chromedriver(binary_location)
+
+    try:
+        return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    except SessionNotCreatedException as e:
+        if not driver_path or driver_path == os.getenv('CHROMEDRIVER_PATH'):
+            raise
+        print(f"⚠️  ChromeDriverのバージョンが合いません。再解決します: {e.msg}")
+        invalidate_driver_cache()
+        driver_path = resolve_chromedriver(binary_location)
+        return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
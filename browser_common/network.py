@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chrome DevTools Protocol（CDP）のネットワークイベント監視
+パフォーマンスログからリクエストの開始・完了を追跡する
+"""
+
+import json
+import re
+import time
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from browser_common.waits import DEFAULT_TIMEOUT, POLL_INTERVAL, wait_for_resources_idle
+
+# リクエスト開始・終了を表すCDPイベント
+REQUEST_STARTED = 'Network.requestWillBeSent'
+RESPONSE_RECEIVED = 'Network.responseReceived'
+REQUEST_FINISHED = ('Network.loadingFinished', 'Network.loadingFailed')
+
+# これより長く続くリクエストはロングポーリング等とみなし、アイドル判定から除外（秒）
+LONG_REQUEST_SECONDS = 5
+
+
+def enable_performance_logging(chrome_options: Options) -> None:
+    """
+    ChromeのパフォーマンスログでCDPのNetworkイベントを取得できるようにする
+
+    Args:
+        chrome_options: WebDriver起動前のChromeオプション
+    """
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+class NetworkMonitor:
+    """
+    パフォーマンスログからCDPのNetworkイベントを収集
+
+    driver.get_log('performance') は読み出したログを消費するため、
+    ネットワーク関連の処理はこのクラスを経由してイベントを共有する
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.events: List[Dict] = []
+        # 実行中のリクエスト {requestId: 開始を検知した時刻}
+        self.inflight: Dict[str, float] = {}
+        # 検知したリクエスト {requestId: {'url', 'method', 'status', 'finished'}}（検知順）
+        self.requests: Dict[str, Dict] = {}
+        # パフォーマンスログが無効な場合はResource Timingで代用
+        self.available = True
+
+    def poll(self) -> List[Dict]:
+        """
+        新しいNetworkイベントを読み込む
+
+        Returns:
+            List[Dict]: 今回読み込んだイベント（{'method': str, 'params': dict}）
+        """
+        if not self.available:
+            return []
+
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException:
+            self.available = False
+            return []
+
+        new_events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method', '')
+            if not method.startswith('Network.'):
+                continue
+
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == REQUEST_STARTED:
+                self.inflight[request_id] = time.monotonic()
+                request = params.get('request', {})
+                self.requests[request_id] = {
+                    'url': request.get('url', ''),
+                    'method': request.get('method', ''),
+                    'status': None,
+                    'finished': False
+                }
+            elif method == RESPONSE_RECEIVED and request_id in self.requests:
+                self.requests[request_id]['status'] = params.get('response', {}).get('status')
+            elif method in REQUEST_FINISHED:
+                self.inflight.pop(request_id, None)
+                if request_id in self.requests:
+                    self.requests[request_id]['finished'] = method == 'Network.loadingFinished'
+
+            new_events.append({'method': method, 'params': params})
+
+        self.events.extend(new_events)
+        return new_events
+
+    def wait_for_idle(self, idle_time: float = 0.5, timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """
+        実行中のリクエストがない状態が idle_time 秒続くまで待機
+
+        Args:
+            idle_time: アイドルとみなす継続時間（秒）
+            timeout: 最大待機時間（秒）
+
+        Returns:
+            bool: アイドルになったかどうか
+        """
+        self.poll()
+        if not self.available:
+            return wait_for_resources_idle(self.driver, idle_time, timeout)
+
+        deadline = time.monotonic() + timeout
+        idle_since = None
+
+        while time.monotonic() < deadline:
+            self.poll()
+            now = time.monotonic()
+            active = [
+                started for started in self.inflight.values()
+                if now - started < LONG_REQUEST_SECONDS
+            ]
+
+            if active:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = now
+            elif now - idle_since >= idle_time:
+                return True
+
+            time.sleep(POLL_INTERVAL)
+
+        return False
+
+    def find_requests(self, url_pattern: str, methods: Optional[List[str]] = None) -> List[Dict]:
+        """
+        URLが正規表現に一致する完了済みのリクエストを新しい順に取得
+
+        Args:
+            url_pattern: URLの正規表現
+            methods: 対象のHTTPメソッド（例: ['POST', 'PUT']、省略時はすべて）
+
+        Returns:
+            List[Dict]: {'request_id', 'url', 'method', 'status'} のリスト
+        """
+        self.poll()
+        pattern = re.compile(url_pattern)
+        matches = []
+        for request_id, request in reversed(list(self.requests.items())):
+            if not request['finished'] or not pattern.search(request['url']):
+                continue
+            if methods and request['method'] not in methods:
+                continue
+            matches.append({
+                'request_id': request_id,
+                'url': request['url'],
+                'method': request['method'],
+                'status': request['status']
+            })
+        return matches
+
+    def get_response_body(self, request_id: str) -> Optional[str]:
+        """
+        レスポンス本文を取得（CDPの Network.getResponseBody）
+
+        ページ遷移後やブラウザのキャッシュから消えた後は取得できない
+
+        Returns:
+            レスポンス本文（取得できない場合はNone）
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except (AttributeError, WebDriverException):
+            return None
+        if result.get('base64Encoded'):
+            return None
+        return result.get('body')
+
+    def get_response_json(self, request_id: str) -> Optional[Dict]:
+        """レスポンス本文をJSONとして取得（JSONでない場合はNone）"""
+        body = self.get_response_body(request_id)
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
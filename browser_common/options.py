@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seleniumを使う投稿モジュール共通のChromeオプション
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+from selenium.webdriver.chrome.options import Options
+
+from browser_common.blocking import (
+    enable_resource_blocking,
+    get_blocked_url_patterns,
+    is_resource_blocking_enabled,
+)
+from browser_common.network import enable_performance_logging
+
+
+def build_chrome_options(
+    headless: bool = False,
+    user_data_dir: Optional[Path] = None,
+    performance_logging: bool = False,
+    block_resources: Optional[bool] = None,
+    allow: Optional[Iterable[str]] = None,
+    site: Optional[str] = None
+) -> Options:
+    """
+    Chromeオプションを作成
+
+    Args:
+        headless: Trueの場合、ヘッドレスモードで実行（環境変数 BROWSER_HEADLESS=true でも有効）
+        user_data_dir: ログイン状態などを保持するプロファイルのディレクトリ
+        performance_logging: TrueでCDPのNetworkイベントをパフォーマンスログに記録
+        block_resources: Trueで画像・フォント・解析タグ等をブロックし、ページ読み込みを eager にする
+                         （省略時は環境変数 BROWSER_BLOCK_RESOURCES、デフォルト: false）
+        allow: ブロックから外す文字列・ホスト（エディタが必要とするリソース用、browser_common.blocking 参照）
+        site: 投稿先（'note' / 'zenn'）。エディタのホストを既定でブロックから外す
+
+    Returns:
+        Options
+    """
+    chrome_options = Options()
+
+    # Windows環境でのChrome実行パスを明示的に指定
+    if sys.platform == 'win32':
+        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+        if os.path.exists(chrome_path):
+            chrome_options.binary_location = chrome_path
+        else:
+            # 32bit版のパスも試す
+            chrome_path_x86 = r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+            if os.path.exists(chrome_path_x86):
+                chrome_options.binary_location = chrome_path_x86
+
+    # 環境変数からヘッドレスモード設定を読み込み
+    if os.getenv('BROWSER_HEADLESS', 'false').lower() == 'true':
+        headless = True
+
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+
+    if performance_logging:
+        enable_performance_logging(chrome_options)
+
+    if user_data_dir:
+        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+
+    if block_resources is None:
+        block_resources = is_resource_blocking_enabled()
+    if block_resources:
+        enable_resource_blocking(chrome_options, get_blocked_url_patterns(allow, site))
+
+    return chrome_options
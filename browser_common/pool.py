@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seleniumのブラウザプール
+Note / Zenn の投稿で起動済みのChromeを使い回し、投稿のたびに起動・終了しないようにする
+"""
+
+import os
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from browser_common.blocking import apply_resource_blocking, get_blocked_url_patterns_of
+from browser_common.driver_manager import start_chrome
+
+# psutilはオプション（インストールされていない場合はメモリ使用量による再起動を行わない）
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PoolKey = Tuple
+
+
+def _options_key(chrome_options: Options) -> PoolKey:
+    """同じ設定（プロファイル・ヘッドレス等）のChromeだけを使い回すためのキー"""
+    return (
+        chrome_options.binary_location or '',
+        tuple(sorted(chrome_options.arguments)),
+        repr(sorted(chrome_options.to_capabilities().get('goog:loggingPrefs', {}).items())),
+        chrome_options.page_load_strategy,
+        get_blocked_url_patterns_of(chrome_options),
+    )
+
+
+def _get_user_data_dir(arguments) -> Optional[str]:
+    for argument in arguments:
+        if argument.startswith('--user-data-dir='):
+            return argument.split('=', 1)[1]
+    return None
+
+
+class _PooledBrowser:
+    """プール内のChrome1つ分の状態"""
+
+    def __init__(self, driver, key: PoolKey):
+        self.driver = driver
+        self.key = key
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class BrowserPool:
+    """
+    起動済みChromeのプール
+
+    - Chromeオプション（プロファイル・ヘッドレス等）が同じものだけを使い回す
+    - プロファイル（--user-data-dir）は同時に1つのChromeでしか使えないため、
+      使用中なら返却されるまで待つ
+    - 返却時にタブを1つに戻して about:blank を開く
+    - 一定回数使ったもの、メモリ使用量が上限を超えたものは終了して次回起動し直す
+    """
+
+    def __init__(self, max_size: int = 2, max_uses: int = 20, max_rss_mb: Optional[int] = 1500):
+        """
+        Args:
+            max_size: 同時に起動しておくChromeの最大数
+            max_uses: 1つのChromeを使い回す最大回数
+            max_rss_mb: Chrome（子プロセス含む）のメモリ使用量の上限（MB、psutilが必要）
+        """
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self._idle: List[_PooledBrowser] = []
+        self._in_use: Dict[int, _PooledBrowser] = {}
+        self._starting = 0
+        self._condition = threading.Condition()
+
+    def _count(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._starting
+
+    def _profile_in_use(self, user_data_dir: Optional[str]) -> bool:
+        if not user_data_dir:
+            return False
+        return any(
+            _get_user_data_dir(browser.key[1]) == user_data_dir
+            for browser in self._in_use.values()
+        )
+
+    def acquire(self, chrome_options: Options, timeout: float = 300):
+        """
+        Chromeを借りる（同じ設定の待機中Chromeがあれば再利用、なければ起動）
+
+        Args:
+            chrome_options: Chromeオプション
+            timeout: 空きを待つ最大時間（秒）
+
+        Returns:
+            WebDriver
+        """
+        key = _options_key(chrome_options)
+        user_data_dir = _get_user_data_dir(chrome_options.arguments)
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                browser = self._take_idle(key)
+                if browser:
+                    if self._is_healthy(browser):
+                        browser.uses += 1
+                        self._in_use[id(browser.driver)] = browser
+                        print("♻️  起動済みのブラウザを再利用します")
+                        return browser.driver
+                    self._quit(browser)
+                    continue
+
+                if not self._profile_in_use(user_data_dir):
+                    # 上限に達していれば、使われていない別設定のChromeを終了して枠を空ける
+                    if self._count() >= self.max_size and self._idle:
+                        self._quit(self._idle.pop(0))
+                    if self._count() < self.max_size:
+                        self._starting += 1
+                        break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception("ブラウザプールの空きを待機中にタイムアウトしました")
+                self._condition.wait(remaining)
+
+        try:
+            driver = start_chrome(chrome_options)
+            # ブロックリストはタブ単位の設定。返却時もタブは閉じないので再利用時も有効
+            apply_resource_blocking(driver, chrome_options)
+        finally:
+            with self._condition:
+                self._starting -= 1
+                self._condition.notify_all()
+
+        browser = _PooledBrowser(driver, key)
+        browser.uses = 1
+        with self._condition:
+            self._in_use[id(driver)] = browser
+        return driver
+
+    def release(self, driver, healthy: bool = True) -> None:
+        """
+        Chromeを返却
+
+        Args:
+            driver: acquireで借りたWebDriver
+            healthy: Falseの場合（エラー発生時など）は再利用せずに終了する
+        """
+        with self._condition:
+            browser = self._in_use.pop(id(driver), None)
+
+        if browser is None:
+            # プール管理外のdriver
+            driver.quit()
+            return
+
+        recycle = not healthy or browser.uses >= self.max_uses or self._over_rss_limit(browser)
+        if not recycle:
+            try:
+                self._reset(browser.driver)
+            except WebDriverException:
+                recycle = True
+
+        with self._condition:
+            if recycle:
+                self._quit(browser)
+            else:
+                browser.last_used = time.monotonic()
+                self._idle.append(browser)
+            self._condition.notify_all()
+
+    @contextmanager
+    def driver(self, chrome_options: Options):
+        """
+        with文でChromeを借りる。例外が発生した場合は再利用せずに終了する
+
+        Args:
+            chrome_options: Chromeオプション
+        """
+        driver = self.acquire(chrome_options)
+        healthy = False
+        try:
+            yield driver
+            healthy = True
+        finally:
+            self.release(driver, healthy=healthy)
+
+    def prewarm(self, chrome_options: Options) -> None:
+        """投稿前にChromeを起動しておく（起動時間を投稿処理と重ねるため）"""
+        self.release(self.acquire(chrome_options))
+
+    def shutdown(self) -> None:
+        """プール内のすべてのChromeを終了"""
+        with self._condition:
+            browsers = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for browser in browsers:
+            self._quit(browser)
+
+    def _take_idle(self, key: PoolKey) -> Optional[_PooledBrowser]:
+        for index, browser in enumerate(self._idle):
+            if browser.key == key:
+                return self._idle.pop(index)
+        return None
+
+    def _is_healthy(self, browser: _PooledBrowser) -> bool:
+        try:
+            browser.driver.execute_script("return 1")
+            return bool(browser.driver.window_handles)
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver) -> None:
+        """余分なタブを閉じ、about:blankに戻し、未読のパフォーマンスログを捨てる"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get('about:blank')
+        try:
+            driver.get_log('performance')
+        except WebDriverException:
+            pass
+
+    def _over_rss_limit(self, browser: _PooledBrowser) -> bool:
+        if psutil is None or not self.max_rss_mb:
+            return False
+        try:
+            process = psutil.Process(browser.driver.service.process.pid)
+            rss = sum(child.memory_info().rss for child in process.children(recursive=True))
+        except (AttributeError, psutil.Error):
+            return False
+        return rss > self.max_rss_mb * 1024 * 1024
+
+    def _quit(self, browser: _PooledBrowser) -> None:
+        try:
+            browser.driver.quit()
+            print("🔒 ブラウザを閉じました")
+        except WebDriverException:
+            pass
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    プロセス内で共有するブラウザプールを取得
+
+    環境変数で設定を変更可能:
+      BROWSER_POOL_SIZE: 同時に起動しておくChromeの最大数（デフォルト: 2）
+      BROWSER_POOL_MAX_USES: 1つのChromeを使い回す最大回数（デフォルト: 20）
+      BROWSER_POOL_MAX_RSS_MB: メモリ使用量の上限MB（デフォルト: 1500、psutilが必要）
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                max_size=int(os.getenv('BROWSER_POOL_SIZE', '2')),
+                max_uses=int(os.getenv('BROWSER_POOL_MAX_USES', '20')),
+                max_rss_mb=int(os.getenv('BROWSER_POOL_MAX_RSS_MB', '1500'))
+            )
+            # プロセス終了時にすべてのChromeを終了
+            atexit.register(_pool.shutdown)
+        return _pool
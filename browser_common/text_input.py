@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+クリップボードを使わない一括テキスト入力
+send_keys はBMP外の文字（絵文字など）を送れず、クリップボード経由の貼り付けは
+システムのクリップボード（ヘッドレスLinuxでは使えない・マシン全体で共有）に依存するため、
+エディタへの入力はブラウザ内で完結させる
+"""
+
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from browser_common.waits import SHORT_TIMEOUT, wait_for_text
+
+# 入力欄にフォーカスして既存の内容を全選択（入力内容で置き換えるため）
+# 戻り値: textarea/input の場合はTrue、contenteditableの場合はFalse
+_FOCUS_AND_SELECT_ALL_JS = """
+const el = arguments[0];
+el.focus();
+if (!el.isContentEditable) {
+    el.select();
+    return true;
+}
+const range = document.createRange();
+range.selectNodeContents(el);
+const selection = window.getSelection();
+selection.removeAllRanges();
+selection.addRange(range);
+return false;
+"""
+
+# 貼り付けイベントを合成して送る（エディタの貼り付け処理にそのまま渡る）
+# 戻り値: エディタが貼り付けを処理した（preventDefaultした）かどうか
+_DISPATCH_PASTE_JS = """
+const el = arguments[0];
+const data = new DataTransfer();
+data.setData('text/plain', arguments[1]);
+if (arguments[2]) {
+    data.setData('text/html', arguments[2]);
+}
+const event = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+el.dispatchEvent(event);
+return event.defaultPrevented;
+"""
+
+# textarea/input の値をネイティブのsetterで設定し、inputイベントを送る
+# （Reactなどの制御コンポーネントは value への直接代入を検知しないため）
+# 戻り値: 設定後の値の長さ（contenteditableの場合は -1）
+_SET_VALUE_JS = """
+const el = arguments[0];
+if (el.isContentEditable) {
+    return -1;
+}
+const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value.length;
+"""
+
+
+def _js_length(text: str) -> int:
+    """JavaScriptの文字列長（UTF-16のコードユニット数）"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _insert_with_cdp(driver, text: str) -> bool:
+    """CDPの Input.insertText でフォーカス中の要素に入力（IMEの確定と同じ扱い）"""
+    try:
+        driver.execute_cdp_cmd('Input.insertText', {'text': text})
+        return True
+    except (AttributeError, WebDriverException):
+        # Chrome以外のドライバーにはCDPがない
+        return False
+
+
+def insert_text(
+    driver,
+    element: WebElement,
+    text: str,
+    html: Optional[str] = None,
+    timeout: float = SHORT_TIMEOUT
+) -> str:
+    """
+    入力欄の内容を text で置き換える（1回の操作で全文を入力）
+
+    contenteditableのエディタには貼り付けイベントを合成して送り、エディタ側の
+    貼り付け処理（Markdown記法の変換など）に任せる。エディタが処理しなかった場合や
+    textarea/input の場合はCDPの Input.insertText で入力する。貼り付けを処理したのに
+    反映されない場合も、全選択し直してから Input.insertText で置き換える。
+
+    Args:
+        driver: WebDriver
+        element: 入力欄（textarea / input / contenteditable）
+        text: 入力するテキスト
+        html: 貼り付けイベントに添えるHTML（省略可）
+        timeout: 入力が反映されるまでの最大待機時間（秒）
+
+    Returns:
+        str: 使用した入力方法（'paste' / 'cdp'）
+
+    Raises:
+        Exception: どの方法でも入力が反映されなかった場合
+    """
+    if not text:
+        return 'cdp'
+
+    is_field = driver.execute_script(_FOCUS_AND_SELECT_ALL_JS, element)
+
+    # textarea/input は全文が入ったことを確認できる。contenteditableは記法の変換で
+    # 文字数が変わるため、空でなくなったことだけを確認する
+    min_length = _js_length(text) if is_field else 1
+
+    if not is_field and driver.execute_script(_DISPATCH_PASTE_JS, element, text, html):
+        if wait_for_text(driver, element, min_length=min_length, timeout=timeout):
+            return 'paste'
+        # エディタが貼り付けを処理したが反映が遅い場合、貼り付けで入った途中の内容に
+        # 追記しないよう、全選択し直してから置き換える
+        print("⚠️  貼り付けが反映されないため、別の方法で入力し直します")
+        driver.execute_script(_FOCUS_AND_SELECT_ALL_JS, element)
+
+    if _insert_with_cdp(driver, text):
+        if wait_for_text(driver, element, min_length=min_length, timeout=timeout):
+            return 'cdp'
+
+    raise Exception("入力内容がエディタに反映されません")
+
+
+def set_value(driver, element: WebElement, text: str, timeout: float = SHORT_TIMEOUT) -> str:
+    """
+    textarea/input の値を text で置き換える（1回の操作で全文を設定し、長さを読み戻して確認）
+
+    Markdownをそのまま入力するエディタ向け。値を直接設定してinput/changeイベントを送る。
+    値が反映されなかった場合やcontenteditableの場合は insert_text で入力する。
+
+    Args:
+        driver: WebDriver
+        element: 入力欄
+        text: 入力するテキスト
+        timeout: insert_text にフォールバックした場合の最大待機時間（秒）
+
+    Returns:
+        str: 使用した入力方法（'value' / 'paste' / 'cdp'）
+
+    Raises:
+        Exception: 入力内容が反映されなかった場合
+    """
+    length = driver.execute_script(_SET_VALUE_JS, element, text)
+    if length == _js_length(text):
+        return 'value'
+    return insert_text(driver, element, text, timeout=timeout)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium用の待機ユーティリティ
+固定時間のtime.sleepではなく、要素・URL・ネットワークの状態変化を待つ
+"""
+
+import os
+import time
+from typing import Callable, List, Optional, Tuple
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from browser_common.dom import find_first_element
+
+# 標準の待機時間（秒）。環境変数 BROWSER_WAIT_TIMEOUT で変更可能
+DEFAULT_TIMEOUT = float(os.getenv('BROWSER_WAIT_TIMEOUT', '15'))
+
+# 出るかどうか分からないモーダルなどを待つ短い待機時間（秒）
+SHORT_TIMEOUT = 3
+
+# 状態確認の間隔（秒）
+POLL_INTERVAL = 0.1
+
+Locator = Tuple[str, str]
+
+
+def wait_until(driver, condition: Callable, timeout: float = DEFAULT_TIMEOUT):
+    """
+    条件が満たされるまで待機（タイムアウトしても例外にしない）
+
+    Args:
+        driver: WebDriver
+        condition: driverを受け取り、満たされたら真の値を返す関数
+        timeout: 最大待機時間（秒）
+
+    Returns:
+        条件関数の戻り値（タイムアウト時はNone）
+    """
+    try:
+        return WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=POLL_INTERVAL,
+            ignored_exceptions=[StaleElementReferenceException]
+        ).until(condition)
+    except TimeoutException:
+        return None
+
+
+def wait_for_page_ready(driver, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    document.readyState が interactive 以上になるまで待機
+
+    Returns:
+        bool: 読み込みが完了したかどうか
+    """
+    return bool(wait_until(
+        driver,
+        lambda d: d.execute_script("return document.readyState") in ('interactive', 'complete'),
+        timeout
+    ))
+
+
+def wait_for_url_change(driver, old_url: str, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    URLが old_url から変わるまで待機
+
+    Returns:
+        bool: URLが変わったかどうか
+    """
+    return bool(wait_until(driver, EC.url_changes(old_url), timeout))
+
+
+def wait_for_any_element(
+    driver,
+    locators: List[Locator],
+    timeout: float = DEFAULT_TIMEOUT,
+    visible: bool = False
+) -> Tuple[Optional[WebElement], Optional[Locator]]:
+    """
+    複数の候補ロケーターのいずれかに一致する要素が現れるまで待機
+
+    Args:
+        driver: WebDriver
+        locators: (By.XXX, 値) のリスト（先頭ほど優先）
+        timeout: 最大待機時間（秒）
+        visible: Trueの場合、表示されている要素のみ対象
+
+    Returns:
+        (見つかった要素, 一致したロケーター)。タイムアウト時は (None, None)
+    """
+    # 候補の評価は1回のexecute_scriptでまとめて行う
+    def find_any(d):
+        element, locator = find_first_element(d, locators, visible=visible)
+        return (element, locator) if element else False
+
+    result = wait_until(driver, find_any, timeout)
+    return result if result else (None, None)
+
+
+def wait_for_clickable(driver, locator: Locator, timeout: float = DEFAULT_TIMEOUT) -> Optional[WebElement]:
+    """
+    要素がクリック可能になるまで待機
+
+    Returns:
+        クリック可能になった要素（タイムアウト時はNone）
+    """
+    return wait_until(driver, EC.element_to_be_clickable(locator), timeout)
+
+
+def wait_for_invisible(driver, target, timeout: float = SHORT_TIMEOUT) -> bool:
+    """
+    要素（またはロケーターに一致する要素）が非表示・削除されるまで待機
+
+    Args:
+        target: WebElement または (By.XXX, 値)
+
+    Returns:
+        bool: 非表示になったかどうか
+    """
+    return bool(wait_until(driver, EC.invisibility_of_element(target), timeout))
+
+
+def wait_for_text(driver, element: WebElement, min_length: int = 1, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    入力欄（textarea/input/contenteditable）の内容が指定の長さ以上になるまで待機
+
+    Returns:
+        bool: 内容が入ったかどうか
+    """
+    def has_text(d):
+        length = d.execute_script(
+            "const el = arguments[0];"
+            "return ('value' in el && el.tagName !== 'DIV') ? el.value.length : el.innerText.length;",
+            element
+        )
+        return length >= min_length
+
+    return bool(wait_until(driver, has_text, timeout))
+
+
+def wait_for_resources_idle(driver, idle_time: float = 0.5, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    Resource Timing の件数が idle_time 秒間増えなくなるまで待機
+
+    パフォーマンスログ（CDP）が使えない場合のネットワークアイドル判定
+
+    Returns:
+        bool: アイドルになったかどうか
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = time.monotonic()
+
+    while time.monotonic() < deadline:
+        try:
+            count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        except WebDriverException:
+            return False
+
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            stable_since = now
+        elif now - stable_since >= idle_time:
+            return True
+
+        time.sleep(POLL_INTERVAL)
+
+    return False
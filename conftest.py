@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+テスト共通のフィクスチャ
+"""
+
+import pytest
+
+from note_platform import note_api
+from note_platform.mock_server import start_mock_server
+
+
+@pytest.fixture
+def mock_server(tmp_path, monkeypatch):
+    """Note APIのローカル代替サーバー（NOTE_API_BASE_URL・ログイン情報・キャッシュの保存先を設定）"""
+    server, base_url = start_mock_server()
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path))
+    monkeypatch.setenv('NOTE_API_BASE_URL', base_url)
+    monkeypatch.setenv('NOTE_EMAIL', 'mock@example.com')
+    monkeypatch.setenv('NOTE_PASSWORD', 'password')
+    note_api.reset_client()
+    yield server
+    note_api.reset_client()
+    server.shutdown()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ローカルキャッシュ・状態ファイルの共通処理
+
+各プラットフォームの同期状態やキャッシュをJSONで保存する際に使用する
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """
+    キャッシュディレクトリを取得（存在しなければ作成）
+
+    環境変数 SNS_AUTO_POST_CACHE_DIR で変更可能（デフォルト: ~/.sns-auto-post）
+
+    Args:
+        *parts: サブディレクトリ名（例: 'qiita'）
+
+    Returns:
+        Path: キャッシュディレクトリのパス
+    """
+    base_dir = os.getenv('SNS_AUTO_POST_CACHE_DIR')
+    cache_dir = Path(base_dir) if base_dir else Path.home() / '.sns-auto-post'
+    cache_dir = cache_dir.joinpath(*parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def load_json(path: Path, default: Any = None) -> Any:
+    """
+    JSONファイルを読み込む
+
+    Args:
+        path: ファイルパス
+        default: ファイルが存在しない・壊れている場合に返す値
+
+    Returns:
+        読み込んだデータ（失敗時はdefault）
+    """
+    path = Path(path)
+    if not path.exists():
+        return default
+
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        print(f"⚠️  キャッシュファイルを読み込めません（無視します）: {path}")
+        return default
+
+
+def save_json(path: Path, data: Any) -> None:
+    """
+    JSONファイルをアトミックに書き込む
+
+    一時ファイルに書き込んでから置き換えるため、途中で中断しても
+    既存のファイルが壊れることはない
+
+    Args:
+        path: ファイルパス
+        data: 保存するデータ
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
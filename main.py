@@ -16,180 +16,10 @@ from x_platform.post_x import post_to_x
 from note_platform.post_note import post_to_note
 from qiita_platform.post_qiita import post_to_qiita
 from zenn_platform.post_zenn import post_to_zenn
-from zenn_platform.post_zenn_github import post_to_zenn_github
+from zenn_platform.post_zenn_github import get_repo_path, post_to_zenn_github
+from zenn_platform.push_queue import print_push_status
 from gemini_formatter import GeminiFormatter
-
-
-def read_text_file(file_path: str) -> str:
-    """
-    テキストファイルを読み込む（UTF-8）
-
-    Args:
-        file_path: 読み込むファイルのパス
-
-    Returns:
-        str: ファイルの内容
-
-    Raises:
-        FileNotFoundError: ファイルが見つからない場合
-        Exception: その他のエラー
-    """
-    try:
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
-
-        return path.read_text(encoding='utf-8').strip()
-    except Exception as e:
-        raise Exception(f"ファイル読み込みエラー ({file_path}): {e}")
-
-
-def parse_post_file(file_path: str) -> dict:
-    """
-    統合投稿ファイルをパースする
-
-    ファイル形式:
-    [X]
-    X投稿のテキスト
-
-    [Note Title]
-    Noteのタイトル
-
-    [Note Content]
-    Noteの本文
-    複数行もOK
-
-    [Qiita Title]
-    Qiitaのタイトル
-
-    [Qiita Content]
-    Qiitaの本文（マークダウン）
-    複数行もOK
-
-    [Qiita Tags]
-    Python, API, 自動化
-
-    [Zenn Title]
-    Zennのタイトル
-
-    [Zenn Content]
-    Zennの本文（マークダウン）
-    複数行もOK
-
-    [Zenn Emoji]
-    📝
-
-    [Zenn Topics]
-    Python, API, 自動化
-
-    Args:
-        file_path: 投稿ファイルのパス
-
-    Returns:
-        dict: {'x_text': str, 'note_title': str, 'note_content': str,
-               'qiita_title': str, 'qiita_content': str, 'qiita_tags': List[str],
-               'zenn_title': str, 'zenn_content': str, 'zenn_emoji': str, 'zenn_topics': List[str]}
-              各値はNoneの可能性あり
-
-    Raises:
-        FileNotFoundError: ファイルが見つからない場合
-        Exception: その他のエラー
-    """
-    try:
-        content = read_text_file(file_path)
-        result = {
-            'x_text': None,
-            'note_title': None,
-            'note_content': None,
-            'qiita_title': None,
-            'qiita_content': None,
-            'qiita_tags': None,
-            'zenn_title': None,
-            'zenn_content': None,
-            'zenn_emoji': None,
-            'zenn_topics': None
-        }
-
-        # セクションで分割
-        current_section = None
-        section_content = []
-
-        for line in content.split('\n'):
-            # セクション見出しをチェック（[で始まり]で終わる行）
-            stripped_line = line.strip()
-
-            if stripped_line.startswith('[') and stripped_line.endswith(']'):
-                # 前のセクションを保存
-                if current_section:
-                    result[current_section] = '\n'.join(section_content).strip()
-
-                # 認識するセクション見出しのみ処理
-                if stripped_line == '[X]':
-                    current_section = 'x_text'
-                    section_content = []
-                elif stripped_line == '[Note Title]':
-                    current_section = 'note_title'
-                    section_content = []
-                elif stripped_line == '[Note Content]':
-                    current_section = 'note_content'
-                    section_content = []
-                elif stripped_line == '[Qiita Title]':
-                    current_section = 'qiita_title'
-                    section_content = []
-                elif stripped_line == '[Qiita Content]':
-                    current_section = 'qiita_content'
-                    section_content = []
-                elif stripped_line == '[Qiita Tags]':
-                    current_section = 'qiita_tags'
-                    section_content = []
-                elif stripped_line == '[Zenn Title]':
-                    current_section = 'zenn_title'
-                    section_content = []
-                elif stripped_line == '[Zenn Content]':
-                    current_section = 'zenn_content'
-                    section_content = []
-                elif stripped_line == '[Zenn Emoji]':
-                    current_section = 'zenn_emoji'
-                    section_content = []
-                elif stripped_line == '[Zenn Topics]':
-                    current_section = 'zenn_topics'
-                    section_content = []
-                else:
-                    # 認識しないセクション見出しが来たら終了
-                    current_section = None
-                    section_content = []
-            else:
-                # セクションの内容
-                if current_section:
-                    section_content.append(line)
-
-        # 最後のセクションを保存
-        if current_section:
-            result[current_section] = '\n'.join(section_content).strip()
-
-        # 空文字列をNoneに変換
-        for key in result:
-            if result[key] == '':
-                result[key] = None
-
-        # Qiitaタグをカンマ区切りの文字列からリストに変換
-        if result['qiita_tags']:
-            result['qiita_tags'] = [tag.strip() for tag in result['qiita_tags'].split(',') if tag.strip()]
-            # タグが空リストならNoneに変換
-            if not result['qiita_tags']:
-                result['qiita_tags'] = None
-
-        # Zennトピックをカンマ区切りの文字列からリストに変換
-        if result['zenn_topics']:
-            result['zenn_topics'] = [topic.strip() for topic in result['zenn_topics'].split(',') if topic.strip()]
-            # トピックが空リストならNoneに変換
-            if not result['zenn_topics']:
-                result['zenn_topics'] = None
-
-        return result
-
-    except Exception as e:
-        raise Exception(f"投稿ファイルパースエラー ({file_path}): {e}")
+from post_file import read_text_file, parse_post_file
 
 
 def post_to_all_platforms(
@@ -209,8 +39,10 @@ def post_to_all_platforms(
     zenn_type: str = "tech",
     zenn_slug: str = None,
     zenn_use_github: bool = False,
+    zenn_defer_push: bool = False,
     dry_run: bool = False,
     note_headless: bool = False,
+    note_backend: str = None,
     zenn_headless: bool = False,
     use_gemini: bool = False
 ):
@@ -234,8 +66,10 @@ def post_to_all_platforms(
         zenn_type: Zenn記事タイプ（"tech" or "idea"、デフォルト: "tech"）
         zenn_slug: Zenn記事のスラッグ（省略時は自動生成）
         zenn_use_github: TrueでGitHub連携方式、FalseでSelenium方式
+        zenn_defer_push: Trueの場合、GitHub連携方式でコミット後すぐに戻りバックグラウンドでプッシュ
         dry_run: Trueの場合、実際には投稿しない
         note_headless: Noteをヘッドレスモードで実行
+        note_backend: Noteの投稿方式（'browser' / 'api'、省略時は環境変数 NOTE_BACKEND）
         zenn_headless: Zennをヘッドレスモードで実行（Selenium方式のみ）
         use_gemini: Trueの場合、Gemini APIで文章を整形
 
@@ -302,7 +136,8 @@ def post_to_all_platforms(
                 title=note_title,
                 content=note_content,
                 headless=note_headless,
-                dry_run=dry_run
+                dry_run=dry_run,
+                backend=note_backend
             )
             results['note'] = note_result
 
@@ -363,7 +198,8 @@ def post_to_all_platforms(
                     topics=zenn_topics,
                     published=zenn_published,
                     slug=zenn_slug,
-                    dry_run=dry_run
+                    dry_run=dry_run,
+                    defer_push=True if zenn_defer_push else None
                 )
             else:
                 # Selenium方式
@@ -506,6 +342,11 @@ def main():
         action='store_true',
         help='Noteをヘッドレスモードで実行'
     )
+    parser.add_argument(
+        '--note-backend',
+        choices=['browser', 'api'],
+        help='Noteの投稿方式（browser: ブラウザ操作、api: JSON APIを直接呼ぶ。デフォルト: NOTE_BACKEND または browser）'
+    )
 
     # Qiita投稿オプション（個別指定）
     parser.add_argument(
@@ -600,6 +441,16 @@ def main():
         action='store_true',
         help='ZennをGitHub連携方式で投稿（デフォルトはSelenium方式）'
     )
+    parser.add_argument(
+        '--zenn-defer-push',
+        action='store_true',
+        help='Zenn（GitHub連携方式）をコミット後すぐに終了し、バックグラウンドでプッシュ'
+    )
+    parser.add_argument(
+        '--zenn-status',
+        action='store_true',
+        help='Zenn連携リポジトリのバックグラウンドプッシュの状態を表示して終了'
+    )
     parser.add_argument(
         '--zenn-headless',
         action='store_true',
@@ -620,6 +471,15 @@ def main():
 
     args = parser.parse_args()
 
+    # バックグラウンドプッシュの状態表示
+    if args.zenn_status:
+        try:
+            print_push_status(get_repo_path())
+        except Exception as e:
+            print(f"❌ エラー: {e}")
+            sys.exit(1)
+        return
+
     # ファイルから読み込む（ファイルが指定されている場合）
     x_text = None
     note_title = None
@@ -771,8 +631,10 @@ def main():
             zenn_type=args.zenn_type if hasattr(args, 'zenn_type') else 'tech',
             zenn_slug=args.zenn_slug if hasattr(args, 'zenn_slug') else None,
             zenn_use_github=args.zenn_github if hasattr(args, 'zenn_github') else False,
+            zenn_defer_push=args.zenn_defer_push,
             dry_run=args.dry_run,
             note_headless=args.note_headless,
+            note_backend=args.note_backend,
             zenn_headless=args.zenn_headless if hasattr(args, 'zenn_headless') else False,
             use_gemini=args.use_gemini
         )
@@ -4,5 +4,17 @@ Seleniumを使ったNote.com投稿を管理
 """
 
 from .post_note import post_to_note
+from .note_api import NoteApiClient, NoteApiError, NotePostIncompleteError, post_to_note_api
+from .drafts import prepare_note_draft, prepare_note_drafts, publish_note_draft, publish_due_note_drafts
 
-__all__ = ['post_to_note']
+__all__ = [
+    'post_to_note',
+    'post_to_note_api',
+    'NoteApiClient',
+    'NoteApiError',
+    'NotePostIncompleteError',
+    'prepare_note_draft',
+    'prepare_note_drafts',
+    'publish_note_draft',
+    'publish_due_note_drafts',
+]
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note記事の2段階投稿（下書きの準備 → 公開）
+時間のかかるエディタでの入力・ハッシュタグの選択を事前に済ませておき、公開時は「投稿する」のクリックだけを行う
+"""
+
+import os
+import re
+import sys
+import io
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from browser_common.artifacts import ArtifactRecorder
+from browser_common.dom import find_button, find_first_element
+from browser_common.network import NetworkMonitor
+from browser_common.pool import get_browser_pool
+from browser_common.waits import wait_for_any_element, wait_until
+from local_cache import get_cache_dir, load_json, save_json
+from note_platform.note_api import (
+    NOTE_KEY_PATTERN,
+    NoteApiError,
+    extract_note_url,
+    get_client,
+    markdown_to_note_html,
+)
+from note_platform.post_note import (
+    FINAL_PUBLISH_LOCATOR,
+    NOTE_API_PATTERN,
+    _apply_hashtags,
+    _login,
+    _open_and_fill_editor,
+    _publish_from_settings,
+    build_note_chrome_options,
+    get_selector_cache,
+)
+
+# 環境変数読み込み
+load_dotenv()
+
+# 下書きの状態
+STATUS_PREPARED = 'prepared'
+STATUS_PUBLISHED = 'published'
+STATUS_FAILED = 'failed'
+
+
+def get_drafts_path() -> Path:
+    """準備済みの下書きの記録（~/.sns-auto-post/note/drafts.json）"""
+    return get_cache_dir('note') / 'drafts.json'
+
+
+def _load_drafts() -> Dict[str, Dict]:
+    return load_json(get_drafts_path(), default={})
+
+
+def _save_draft(record: Dict) -> None:
+    drafts = _load_drafts()
+    drafts[record['key']] = record
+    save_json(get_drafts_path(), drafts)
+
+
+def _get_credentials():
+    email = os.getenv('NOTE_EMAIL')
+    password = os.getenv('NOTE_PASSWORD')
+
+    if not all([email, password]):
+        raise ValueError('NOTE_EMAILとNOTE_PASSWORDを.envに設定してください')
+    return email, password
+
+
+def _find_draft_key(driver, network: NetworkMonitor) -> Optional[str]:
+    """エディタのURL、または記事作成・保存APIのレスポンスから記事キーを取得"""
+    match = re.search(r'/notes/(n[0-9a-z]+)', driver.current_url)
+    if match:
+        return match.group(1)
+
+    for request in network.find_requests(NOTE_API_PATTERN, methods=['POST', 'PUT']):
+        data = (network.get_response_json(request['request_id']) or {}).get('data')
+        key = data.get('key') if isinstance(data, dict) else None
+        if isinstance(key, str) and NOTE_KEY_PATTERN.match(key):
+            return key
+    return None
+
+
+def _open_publish_settings(driver, key: str, email: str, password: str) -> None:
+    """下書きの公開設定画面を直接開く（セッションが切れていればログインしてから開き直す）"""
+    publish_url = f"https://editor.note.com/notes/{key}/publish/"
+    driver.get(publish_url)
+    state = wait_until(
+        driver,
+        lambda d: 'login' if '/login' in d.current_url else bool(
+            find_first_element(d, [FINAL_PUBLISH_LOCATOR], visible=True)[0]
+        )
+    )
+    if state == 'login':
+        _login(driver, email, password)
+        driver.get(publish_url)
+
+    if not wait_for_any_element(driver, [FINAL_PUBLISH_LOCATOR], visible=True)[0]:
+        raise Exception("公開設定画面を開けませんでした")
+
+
+def _prepare_with_browser(
+    title: str,
+    content: str,
+    hashtags: Optional[List[str]],
+    max_hashtags: Optional[int],
+    headless: bool,
+    reuse_session: bool
+) -> Dict:
+    email, password = _get_credentials()
+    pool = get_browser_pool()
+    artifacts = ArtifactRecorder('note-prepare')
+    driver = None
+    failed = False
+
+    try:
+        driver = pool.acquire(build_note_chrome_options(headless, reuse_session))
+        network = NetworkMonitor(driver)
+
+        _open_and_fill_editor(driver, get_selector_cache(), email, password, title, content)
+
+        # 自動保存を待ち、下書き保存ボタンがあれば明示的に保存
+        network.wait_for_idle()
+        save_button = find_button(driver, '下書き保存', exact=False)
+        if save_button:
+            save_button.click()
+            network.wait_for_idle()
+
+        key = _find_draft_key(driver, network)
+        if not key:
+            raise Exception("下書きの記事キーを取得できませんでした")
+
+        # ハッシュタグも公開設定画面で選択して保存しておき、公開時は「投稿する」のクリックだけにする
+        _open_publish_settings(driver, key, email, password)
+        network.wait_for_idle()
+        selected = _apply_hashtags(driver, hashtags, max_hashtags)
+        save_button = find_button(driver, '下書き保存', exact=False)
+        if save_button:
+            save_button.click()
+        network.wait_for_idle()
+        return {'key': key, 'hashtags_selected': selected}
+
+    except Exception:
+        failed = True
+        if driver:
+            artifacts.capture(driver, 'error')
+        raise
+
+    finally:
+        if driver:
+            pool.release(driver, healthy=not failed)
+        artifacts.close()
+
+
+def _prepare_with_api(title: str, content: str, record: Dict) -> Dict:
+    email, password = _get_credentials()
+    client = get_client()
+    client.ensure_login(email, password)
+
+    body_html = markdown_to_note_html(content)
+    note = client.create_note()
+    if not note.get('id') or not note.get('key'):
+        raise NoteApiError("下書きの作成に失敗しました（記事IDがありません）")
+
+    # 公開時に本文を送り直す必要があるため、HTMLを記録しておく。下書きの保存に失敗・中断しても
+    # 作成した記事を見失わないよう、保存の前に記録する（公開時は本文も送るため、そのまま公開できる）
+    draft = {'key': note['key'], 'id': note['id'], 'body_html': body_html}
+    _save_draft({**record, **draft, 'status': STATUS_FAILED, 'error': '下書きの保存が完了していません'})
+    client.save_draft(note['id'], title, body_html)
+    return draft
+
+
+def prepare_note_draft(
+    title: str,
+    content: str,
+    hashtags: Optional[List[str]] = None,
+    max_hashtags: Optional[int] = None,
+    scheduled_at: Optional[str] = None,
+    backend: Optional[str] = None,
+    headless: bool = False,
+    reuse_session: bool = True
+) -> Dict:
+    """
+    下書きを作成してタイトル・本文を入力し、公開に必要な情報を記録（準備フェーズ）
+
+    Args:
+        title: 記事のタイトル
+        content: 記事の本文（マークダウン形式）
+        hashtags: 選択するハッシュタグ（browserは準備時に選択、apiは公開時に送る）
+        max_hashtags: 選択するハッシュタグの最大数
+        scheduled_at: 公開予定日時（ISO形式、publish_due_note_drafts で使用）
+        backend: 'browser' または 'api'（省略時は環境変数 NOTE_BACKEND、デフォルト: browser）
+        headless: Trueの場合、ヘッドレスモードで実行（browserのみ）
+        reuse_session: ログイン状態を保存した専用プロファイルを使う（browserのみ）
+
+    Returns:
+        下書きの記録
+        {
+            'key': str, 'title': str, 'hashtags': List[str], 'max_hashtags': int,
+            'scheduled_at': str, 'backend': str, 'status': 'prepared', 'prepared_at': str, ...
+        }
+
+    Raises:
+        Exception: 下書きの作成に失敗した場合
+    """
+    backend = (backend or os.getenv('NOTE_BACKEND', 'browser')).lower()
+    if scheduled_at:
+        # 書式の確認（不正な場合はValueError）
+        datetime.fromisoformat(scheduled_at)
+
+    print(f"📝 下書きを準備中: {title}")
+    if hashtags and max_hashtags is not None:
+        hashtags = hashtags[:max_hashtags]
+    record = {
+        'title': title,
+        'content_length': len(content),
+        'hashtags': hashtags,
+        'max_hashtags': max_hashtags,
+        'scheduled_at': scheduled_at,
+        'backend': backend,
+        'prepared_at': datetime.now().isoformat(timespec='seconds')
+    }
+    if backend == 'api':
+        draft = _prepare_with_api(title, content, record)
+    else:
+        draft = _prepare_with_browser(title, content, hashtags, max_hashtags, headless, reuse_session)
+
+    record.update(draft, status=STATUS_PREPARED)
+    record.pop('error', None)
+    _save_draft(record)
+    print(f"✅ 下書きを準備しました: {record['key']}")
+    return record
+
+
+def prepare_note_drafts(posts: List[Dict], **kwargs) -> List[Dict]:
+    """
+    複数の下書きをまとめて準備（ブラウザ・APIセッションは使い回す）
+
+    Args:
+        posts: {'title', 'content', 'hashtags', 'max_hashtags', 'scheduled_at'} のリスト
+        **kwargs: prepare_note_draft に渡す共通の引数（backend, headless など）
+
+    Returns:
+        List[Dict]: 準備に成功した下書きの記録（失敗したものは {'title', 'error'}）
+    """
+    results = []
+    for post in posts:
+        try:
+            results.append(prepare_note_draft(**post, **kwargs))
+        except Exception as e:
+            print(f"❌ 下書きの準備に失敗しました: {post.get('title')}: {e}")
+            results.append({'title': post.get('title'), 'error': str(e)})
+    return results
+
+
+def list_note_drafts(status: Optional[str] = None) -> List[Dict]:
+    """記録されている下書きを公開予定日時順に取得"""
+    drafts = [
+        record for record in _load_drafts().values()
+        if status is None or record.get('status') == status
+    ]
+    return sorted(drafts, key=lambda record: (record.get('scheduled_at') or '', record.get('prepared_at') or ''))
+
+
+def _publish_with_browser(record: Dict, headless: bool, reuse_session: bool) -> str:
+    email, password = _get_credentials()
+    pool = get_browser_pool()
+    artifacts = ArtifactRecorder('note-publish')
+    driver = None
+    failed = False
+
+    try:
+        driver = pool.acquire(build_note_chrome_options(headless, reuse_session))
+        network = NetworkMonitor(driver)
+
+        _open_publish_settings(driver, record['key'], email, password)
+        network.wait_for_idle()
+
+        # 準備時にハッシュタグを選択済みの下書きは「投稿する」のクリックだけを行う
+        # （以前の形式の記録は、ここでハッシュタグを選択する）
+        return _publish_from_settings(
+            driver,
+            network,
+            record.get('hashtags'),
+            record.get('max_hashtags'),
+            select_hashtags='hashtags_selected' not in record
+        )
+
+    except Exception:
+        failed = True
+        if driver:
+            artifacts.capture(driver, 'error')
+        raise
+
+    finally:
+        if driver:
+            pool.release(driver, healthy=not failed)
+        artifacts.close()
+
+
+def _publish_with_api(record: Dict) -> str:
+    email, password = _get_credentials()
+    client = get_client()
+    client.ensure_login(email, password)
+
+    hashtags = record.get('hashtags')
+    if hashtags and record.get('max_hashtags') is not None:
+        hashtags = hashtags[:record['max_hashtags']]
+
+    published = client.publish(record['id'], record['title'], record['body_html'], hashtags)
+    note_username = client.urlname or os.getenv('NOTE_USERNAME', '')
+    return extract_note_url(published, note_username) or "https://note.com/my/notes"
+
+
+def publish_note_draft(key: str, headless: bool = False, reuse_session: bool = True) -> Dict:
+    """
+    準備済みの下書きを公開（公開フェーズ）
+
+    Args:
+        key: 下書きの記事キー（prepare_note_draft の戻り値の 'key'）
+        headless: Trueの場合、ヘッドレスモードで実行（browserのみ）
+        reuse_session: ログイン状態を保存した専用プロファイルを使う（browserのみ）
+
+    Returns:
+        投稿情報の辞書（post_to_note と同じ形式）
+
+    Raises:
+        ValueError: 記録にない下書きの場合
+        Exception: 公開に失敗した場合
+    """
+    record = _load_drafts().get(key)
+    if not record:
+        raise ValueError(f"準備済みの下書きが見つかりません: {key}")
+    if record.get('status') == STATUS_PUBLISHED:
+        print(f"ℹ️  公開済みです: {record.get('url')}")
+        return {'success': True, 'url': record.get('url'), 'title': record['title'], 'dry_run': False}
+
+    print(f"🚀 下書きを公開中: {record['title']}")
+    try:
+        if record.get('backend') == 'api':
+            note_url = _publish_with_api(record)
+        else:
+            note_url = _publish_with_browser(record, headless, reuse_session)
+    except Exception as e:
+        record.update({'status': STATUS_FAILED, 'error': str(e)})
+        _save_draft(record)
+        raise Exception(f"Note下書きの公開に失敗しました: {e}")
+
+    record.update({
+        'status': STATUS_PUBLISHED,
+        'url': note_url,
+        'published_at': datetime.now().isoformat(timespec='seconds')
+    })
+    record.pop('error', None)
+    _save_draft(record)
+    print(f"✅ 記事を公開しました: {note_url}")
+
+    return {
+        'success': True,
+        'url': note_url,
+        'title': record['title'],
+        'content_length': record.get('content_length'),
+        'dry_run': False
+    }
+
+
+def publish_due_note_drafts(now: Optional[datetime] = None, **kwargs) -> List[Dict]:
+    """
+    公開予定日時を過ぎた下書きをすべて公開
+
+    Args:
+        now: 基準日時（省略時は現在時刻）
+        **kwargs: publish_note_draft に渡す引数
+
+    Returns:
+        List[Dict]: 公開結果（失敗したものは {'key', 'error'}）
+    """
+    now = now or datetime.now()
+    results = []
+    for record in list_note_drafts(status=None):
+        if record.get('status') == STATUS_PUBLISHED or not record.get('scheduled_at'):
+            continue
+        if datetime.fromisoformat(record['scheduled_at']) > now:
+            continue
+        try:
+            results.append(publish_note_draft(record['key'], **kwargs))
+        except Exception as e:
+            print(f"❌ {e}")
+            results.append({'key': record['key'], 'error': str(e)})
+    return results
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+    from post_file import parse_post_file
+
+    parser = argparse.ArgumentParser(description='Note記事の2段階投稿（下書きの準備 → 公開）')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    prepare_parser = subparsers.add_parser('prepare', help='投稿ファイルから下書きを準備')
+    prepare_parser.add_argument('files', nargs='+', help='投稿ファイル（[Note Title] / [Note Content]）')
+    prepare_parser.add_argument('--at', nargs='*', default=[], help='公開予定日時（ISO形式、ファイルと同じ順番）')
+    prepare_parser.add_argument('--hashtags', nargs='+', help='公開時に選択するハッシュタグ')
+    prepare_parser.add_argument('--max-hashtags', type=int, help='公開時に選択するハッシュタグの最大数')
+    prepare_parser.add_argument('--backend', choices=['browser', 'api'], help='投稿方式')
+    prepare_parser.add_argument('--headless', action='store_true', help='ヘッドレスモードで実行')
+
+    subparsers.add_parser('list', help='準備済みの下書きを表示')
+
+    publish_parser = subparsers.add_parser('publish', help='準備済みの下書きを公開')
+    publish_parser.add_argument('keys', nargs='+', help='下書きの記事キー')
+    publish_parser.add_argument('--headless', action='store_true', help='ヘッドレスモードで実行')
+
+    due_parser = subparsers.add_parser('publish-due', help='公開予定日時を過ぎた下書きをすべて公開')
+    due_parser.add_argument('--headless', action='store_true', help='ヘッドレスモードで実行')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'prepare':
+            posts = []
+            for index, file_path in enumerate(args.files):
+                parsed = parse_post_file(file_path)
+                if not parsed['note_title'] or not parsed['note_content']:
+                    print(f"⏭️  Noteのタイトル・本文がありません: {file_path}")
+                    continue
+                posts.append({
+                    'title': parsed['note_title'],
+                    'content': parsed['note_content'],
+                    'hashtags': args.hashtags,
+                    'max_hashtags': args.max_hashtags,
+                    'scheduled_at': args.at[index] if index < len(args.at) else None
+                })
+            results = prepare_note_drafts(posts, backend=args.backend, headless=args.headless)
+            if any('error' in result for result in results):
+                sys.exit(1)
+
+        elif args.command == 'list':
+            for record in list_note_drafts():
+                print(f"{record['key']}  {record.get('status'):<9}  {record.get('scheduled_at') or '-':<19}  {record['title']}")
+
+        elif args.command == 'publish':
+            for key in args.keys:
+                publish_note_draft(key, headless=args.headless)
+
+        else:
+            results = publish_due_note_drafts(headless=args.headless)
+            print(f"✅ {len(results)}件の下書きを処理しました")
+            if any('error' in result for result in results):
+                sys.exit(1)
+
+    except Exception as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
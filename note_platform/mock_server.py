@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note APIのローカル代替サーバー
+HTTP API方式（note_api.py）のテスト・ベンチマーク用に、エディタが使うJSON APIを再現する
+
+使用例:
+  python note_platform/mock_server.py --port 8765
+  NOTE_API_BASE_URL=http://127.0.0.1:8765 python note_platform/post_note.py "タイトル" "本文" --backend api
+"""
+
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+SESSION_COOKIE = '_note_session_v5'
+
+
+class MockNoteState:
+    """代替サーバーが保持するアカウント・記事・呼び出し回数"""
+
+    def __init__(self, email: str, password: str, urlname: str):
+        self.email = email
+        self.password = password
+        self.urlname = urlname
+        self.sessions = set()
+        self.notes: Dict[int, Dict] = {}
+        self.calls: Dict[str, int] = {}
+        # 失敗させる呼び出し → 返すステータスコード（テストで障害を再現する）
+        self.fail_status: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+
+class MockNoteHandler(BaseHTTPRequestHandler):
+    """text_notes / sessions / current_user のエンドポイント"""
+
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def state(self) -> MockNoteState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, data: Dict, cookie: Optional[str] = None) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if cookie:
+            self.send_header('Set-Cookie', f'{SESSION_COOKIE}={cookie}; Path=/; HttpOnly')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get('Content-Length', 0))
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return {}
+
+    def _logged_in(self) -> bool:
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE and value in self.state.sessions:
+                return True
+        return False
+
+    def _inject_failure(self, name: str) -> bool:
+        """fail_status に指定した呼び出しであればエラーを返す"""
+        status = self.state.fail_status.get(name)
+        if not status:
+            return False
+        self._send(status, {'error': {'message': f'mock failure: {name}'}})
+        return True
+
+    def _unauthorized(self) -> None:
+        self._send(401, {'error': {'code': 'unauthorized', 'message': 'ログインしてください'}})
+
+    def _note_data(self, note: Dict) -> Dict:
+        data = dict(note)
+        data['user'] = {'urlname': self.state.urlname}
+        if note['status'] == 'published':
+            data['note_url'] = f"https://note.com/{self.state.urlname}/n/{note['key']}"
+        return data
+
+    def _route(self) -> Tuple[str, Dict]:
+        url = urlparse(self.path)
+        return url.path.rstrip('/'), parse_qs(url.query)
+
+    def do_GET(self):
+        path, _ = self._route()
+        if path == '/api/v2/current_user':
+            self.state.count('current_user')
+            if not self._logged_in():
+                return self._unauthorized()
+            return self._send(200, {'data': {'urlname': self.state.urlname}})
+        self._send(404, {'error': {'message': 'not found'}})
+
+    def do_POST(self):
+        path, query = self._route()
+        payload = self._read_json()
+
+        if path == '/api/v1/sessions/sign_in':
+            self.state.count('sign_in')
+            if payload.get('login') != self.state.email or payload.get('password') != self.state.password:
+                return self._send(401, {'error': {'message': 'メールアドレスまたはパスワードが違います'}})
+            token = secrets.token_hex(16)
+            with self.state.lock:
+                self.state.sessions.add(token)
+            return self._send(201, {'data': {'urlname': self.state.urlname}}, cookie=token)
+
+        if not self._logged_in():
+            return self._unauthorized()
+
+        if path == '/api/v1/text_notes':
+            self.state.count('create')
+            with self.state.lock:
+                note_id = len(self.state.notes) + 1
+                note = {'id': note_id, 'key': f'n{secrets.token_hex(6)}', 'status': 'draft', 'name': '', 'body': ''}
+                self.state.notes[note_id] = note
+            return self._send(201, {'data': self._note_data(note)})
+
+        if path == '/api/v1/text_notes/draft_save':
+            self.state.count('draft_save')
+            if self._inject_failure('draft_save'):
+                return
+            note = self.state.notes.get(int(query.get('id', ['0'])[0]))
+            if not note:
+                return self._send(404, {'error': {'message': 'not found'}})
+            note.update({'name': payload.get('name', ''), 'body': payload.get('body', '')})
+            return self._send(200, {'data': {'result': True}})
+
+        self._send(404, {'error': {'message': 'not found'}})
+
+    def do_PUT(self):
+        path, _ = self._route()
+        payload = self._read_json()
+
+        if not self._logged_in():
+            return self._unauthorized()
+
+        prefix = '/api/v1/text_notes/'
+        if path.startswith(prefix) and path[len(prefix):].isdigit():
+            self.state.count('publish')
+            if self._inject_failure('publish'):
+                return
+            note = self.state.notes.get(int(path[len(prefix):]))
+            if not note:
+                return self._send(404, {'error': {'message': 'not found'}})
+            note.update({
+                'name': payload.get('name', note['name']),
+                'body': payload.get('body', note['body']),
+                'hashtags': payload.get('hashtags', []),
+                'status': payload.get('status', note['status'])
+            })
+            return self._send(200, {'data': self._note_data(note)})
+
+        self._send(404, {'error': {'message': 'not found'}})
+
+
+def start_mock_server(
+    port: int = 0,
+    email: str = 'mock@example.com',
+    password: str = 'password',
+    urlname: str = 'mock_user'
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    代替サーバーをバックグラウンドスレッドで起動
+
+    Args:
+        port: 待ち受けポート（0の場合は空いているポート）
+        email: ログインを受け付けるメールアドレス
+        password: ログインを受け付けるパスワード
+        urlname: 記事URLに使うユーザー名
+
+    Returns:
+        (サーバー, ベースURL)。終了時は server.shutdown() を呼ぶ
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), MockNoteHandler)
+    server.daemon_threads = True
+    server.state = MockNoteState(email, password, urlname)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Note APIのローカル代替サーバー（テスト・ベンチマーク用）')
+    parser.add_argument('--port', type=int, default=8765, help='待ち受けポート（デフォルト: 8765）')
+    parser.add_argument('--email', default='mock@example.com', help='ログインを受け付けるメールアドレス')
+    parser.add_argument('--password', default='password', help='ログインを受け付けるパスワード')
+
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server(args.port, args.email, args.password)
+    print(f"🧪 Note APIの代替サーバーを起動しました: {base_url}")
+    print(f"   NOTE_API_BASE_URL={base_url} を設定して --backend api で投稿してください（Ctrl+Cで終了）")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note投稿モジュール（HTTP API方式）
+ブラウザを使わず、エディタが使うJSON APIで記事を作成・公開する
+ログインのセッション（Cookie）は保存して次回以降も再利用する
+"""
+
+import os
+import re
+import sys
+import io
+import html
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from local_cache import get_cache_dir, load_json, save_json
+
+# 環境変数読み込み
+load_dotenv()
+
+# Note.comのベースURL（テスト・ベンチマーク時は NOTE_API_BASE_URL でローカルの代替サーバーを指定）
+NOTE_BASE_URL = 'https://note.com'
+
+# 記事キー（公開URL https://note.com/{ユーザー名}/n/{記事キー} の末尾）
+NOTE_KEY_PATTERN = re.compile(r'^n[0-9a-z]{8,}$')
+
+# リトライ対象のステータスコードとメソッド
+# （記事作成のPOST・公開のPUTはサーバー側で処理済みの場合に重複する恐れがあるため対象外）
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(['HEAD', 'GET', 'OPTIONS'])
+
+# (接続タイムアウト, 読み込みタイムアウト) 秒
+TIMEOUT = (5, 30)
+
+
+class NoteApiError(Exception):
+    """Note APIの呼び出しに失敗した場合の例外"""
+
+
+class NotePostIncompleteError(NoteApiError):
+    """
+    下書きの作成後に失敗した場合の例外（ブラウザでの投稿に切り替えると記事が重複する）
+
+    Attributes:
+        note_id: 作成した記事のID
+        key: 作成した記事のキー
+        edit_url: 記事の編集ページ（公開・削除を手動で行う）
+    """
+
+    def __init__(self, message: str, note_id, key: Optional[str]):
+        self.note_id = note_id
+        self.key = key
+        self.edit_url = f"https://editor.note.com/notes/{key}/edit/" if key else "https://note.com/notes"
+        super().__init__(f"{message}（記事ID: {note_id}、キー: {key}、編集ページ: {self.edit_url}）")
+
+
+def get_base_url() -> str:
+    return os.getenv('NOTE_API_BASE_URL', NOTE_BASE_URL).rstrip('/')
+
+
+def get_session_path() -> Path:
+    """ログインセッション（Cookie）の保存先"""
+    return get_cache_dir('note') / 'api_session.json'
+
+
+def extract_note_url(payload: Dict, note_username: str = '') -> Optional[str]:
+    """
+    記事APIのレスポンスから公開URLを組み立てる
+
+    Args:
+        payload: text_notes APIのレスポンス（{'data': {'key': ..., 'user': {'urlname': ...}}}）
+        note_username: ユーザー名（レスポンスに含まれない場合に使用）
+
+    Returns:
+        公開URL（記事キーまたはユーザー名が分からない場合はNone）
+    """
+    data = payload.get('data', payload) if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        return None
+
+    note_url = data.get('note_url')
+    if isinstance(note_url, str) and '/n/' in note_url:
+        return note_url.split('?')[0]
+
+    key = data.get('key')
+    if not isinstance(key, str) or not NOTE_KEY_PATTERN.match(key):
+        return None
+
+    user = data.get('user')
+    username = (user.get('urlname') if isinstance(user, dict) else None) or note_username
+    if not username:
+        return None
+    return f"https://note.com/{username}/n/{key}"
+
+
+def _format_inline(text: str) -> str:
+    """インラインのMarkdown記法（リンク・太字・インラインコード）をHTMLに変換"""
+    text = html.escape(text, quote=False)
+    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
+    text = re.sub(r'\[([^\]]+)\]\((https?://[^)\s]+)\)', r'<a href="\2">\1</a>', text)
+    return text
+
+
+def _block(tag: str, inner: str) -> str:
+    # エディタが出力するHTMLと同様に、ブロック要素ごとに一意のname/idを付ける
+    block_id = str(uuid.uuid4())
+    return f'<{tag} name="{block_id}" id="{block_id}">{inner}</{tag}>'
+
+
+def markdown_to_note_html(content: str) -> str:
+    """
+    Markdown形式の本文をNoteのエディタが保存するHTMLに変換
+
+    見出し（##, ###）・箇条書き・番号付きリスト・引用・コードブロック・段落に対応
+
+    Args:
+        content: 記事の本文（マークダウン形式）
+
+    Returns:
+        str: 本文のHTML
+    """
+    blocks = []
+    paragraph: List[str] = []
+    list_items: List[str] = []
+    list_tag = None
+    code_lines: Optional[List[str]] = None
+
+    def flush_paragraph():
+        if paragraph:
+            blocks.append(_block('p', '<br>'.join(_format_inline(line) for line in paragraph)))
+            paragraph.clear()
+
+    def flush_list():
+        nonlocal list_tag
+        if list_items:
+            items = ''.join(_block('li', _format_inline(item)) for item in list_items)
+            blocks.append(_block(list_tag, items))
+            list_items.clear()
+        list_tag = None
+
+    for line in content.splitlines():
+        if code_lines is not None:
+            if line.strip().startswith('```'):
+                blocks.append(_block('pre', f'<code>{html.escape(chr(10).join(code_lines), quote=False)}</code>'))
+                code_lines = None
+            else:
+                code_lines.append(line)
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            flush_paragraph()
+            flush_list()
+            code_lines = []
+            continue
+
+        heading = re.match(r'^(#{1,6})\s+(.*)$', stripped)
+        bullet = re.match(r'^[-*+]\s+(.*)$', stripped)
+        numbered = re.match(r'^\d+\.\s+(.*)$', stripped)
+
+        if heading:
+            flush_paragraph()
+            flush_list()
+            # Noteの見出しは大（h2）と小（h3）の2種類
+            blocks.append(_block('h2' if len(heading.group(1)) <= 2 else 'h3', _format_inline(heading.group(2))))
+        elif bullet or numbered:
+            flush_paragraph()
+            tag = 'ul' if bullet else 'ol'
+            if list_tag != tag:
+                flush_list()
+                list_tag = tag
+            list_items.append((bullet or numbered).group(1))
+        elif stripped.startswith('>'):
+            flush_paragraph()
+            flush_list()
+            blocks.append(_block('blockquote', _block('p', _format_inline(stripped.lstrip('>').strip()))))
+        elif not stripped:
+            flush_paragraph()
+            flush_list()
+        else:
+            flush_list()
+            paragraph.append(stripped)
+
+    if code_lines is not None:
+        blocks.append(_block('pre', f'<code>{html.escape(chr(10).join(code_lines), quote=False)}</code>'))
+    flush_paragraph()
+    flush_list()
+
+    return ''.join(blocks)
+
+
+class NoteApiClient:
+    """
+    Note.comのエディタ用JSON APIのクライアント
+
+    コネクションプーリング（Keep-Alive）付きのSessionで通信し、
+    ログインで得たCookieを保存して次回以降のログインを省略する
+    """
+
+    def __init__(self, base_url: Optional[str] = None, session_path: Optional[Path] = None):
+        """
+        Args:
+            base_url: Note.comのベースURL（省略時は NOTE_API_BASE_URL または https://note.com）
+            session_path: ログインセッションの保存先（省略時は ~/.sns-auto-post/note/api_session.json）
+        """
+        self.base_url = (base_url or get_base_url()).rstrip('/')
+        self.session_path = session_path or get_session_path()
+        self.session = self._create_session()
+        self.urlname: Optional[str] = None
+        self._logged_in = False
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=4)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest',
+            'Origin': self.base_url,
+            'Referer': f'{self.base_url}/'
+        })
+        return session
+
+    def _request(self, method: str, path: str, expected=(200, 201), **kwargs) -> Dict:
+        try:
+            response = self.session.request(method, f'{self.base_url}{path}', timeout=TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            raise NoteApiError(f"Note APIへの接続に失敗しました: {e}")
+
+        if response.status_code not in expected:
+            message = response.text[:200]
+            try:
+                error = response.json().get('error', {})
+                message = error.get('message', message) if isinstance(error, dict) else error
+            except ValueError:
+                pass
+            raise NoteApiError(f"API Error (Status {response.status_code}): {message}")
+
+        try:
+            return response.json()
+        except ValueError:
+            raise NoteApiError(f"Note APIのレスポンスがJSONではありません: {path}")
+
+    def _restore_session(self) -> bool:
+        """保存済みのCookieを読み込む"""
+        saved = load_json(self.session_path, default={})
+        cookies = saved.get('cookies')
+        if not cookies:
+            return False
+        self.session.cookies.update(cookies)
+        self.urlname = saved.get('urlname')
+        return True
+
+    def _save_session(self) -> None:
+        # Cookieはパスワードと同等の情報のため本人のみ読み書き可能にする。save_json は
+        # mkstemp（権限0600で作成）の一時ファイルに書いてから置き換えるため、書き込み中も他のユーザーは読めない
+        save_json(self.session_path, {
+            'cookies': requests.utils.dict_from_cookiejar(self.session.cookies),
+            'urlname': self.urlname
+        })
+
+    def _check_session(self) -> bool:
+        """現在のCookieでログイン済みかどうか"""
+        try:
+            data = self._request('GET', '/api/v2/current_user', expected=(200,)).get('data') or {}
+        except NoteApiError:
+            return False
+        self.urlname = data.get('urlname') or self.urlname
+        return True
+
+    def login(self, email: str, password: str) -> None:
+        """
+        メールアドレスとパスワードでログインし、セッションを保存
+
+        Raises:
+            NoteApiError: ログインに失敗した場合
+        """
+        self.session.cookies.clear()
+        data = self._request(
+            'POST',
+            '/api/v1/sessions/sign_in',
+            json={'login': email, 'password': password}
+        ).get('data') or {}
+        self.urlname = data.get('urlname') or self.urlname
+        self._logged_in = True
+        self._save_session()
+
+    def ensure_login(self, email: str, password: str) -> None:
+        """保存済みのセッションが有効ならそれを使い、無効な場合のみログイン"""
+        with self._lock:
+            if self._logged_in:
+                return
+            if self._restore_session() and self._check_session():
+                print("🔑 保存済みのNoteセッションを使用します")
+                self._logged_in = True
+                return
+            print("🔑 Noteにログイン中...")
+            self.login(email, password)
+            print("✅ ログイン成功")
+
+    def create_note(self) -> Dict:
+        """
+        空の下書きを作成
+
+        Returns:
+            {'id': int, 'key': str, ...}
+        """
+        return self._request('POST', '/api/v1/text_notes', json={'template_key': None}).get('data') or {}
+
+    def save_draft(self, note_id, title: str, body_html: str) -> None:
+        """下書きを保存"""
+        self._request(
+            'POST',
+            f'/api/v1/text_notes/draft_save?id={note_id}&is_temp_saved=true',
+            json={'name': title, 'body': body_html, 'body_length': len(body_html), 'index': False, 'is_lead_form': False}
+        )
+
+    def publish(self, note_id, title: str, body_html: str, hashtags: Optional[List[str]] = None) -> Dict:
+        """
+        下書きを公開
+
+        Args:
+            note_id: 記事ID
+            title: タイトル
+            body_html: 本文のHTML
+            hashtags: ハッシュタグ（'#'の有無は問わない）
+
+        Returns:
+            text_notes APIのレスポンス
+        """
+        return self._request(
+            'PUT',
+            f'/api/v1/text_notes/{note_id}',
+            json={
+                'name': title,
+                'body': body_html,
+                'body_length': len(body_html),
+                'status': 'published',
+                'hashtags': [f"#{tag.lstrip('#')}" for tag in (hashtags or [])],
+                'price': 0,
+                'index': False,
+                'is_refund': False,
+                'limited': False,
+                'magazine_ids': [],
+                'magazine_keys': []
+            }
+        )
+
+
+_client: Optional[NoteApiClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> NoteApiClient:
+    """プロセス内で共有するNote APIクライアントを取得（同じコネクションプール・ログイン状態を使い回す）"""
+    global _client
+
+    with _client_lock:
+        if _client is None or _client.base_url != get_base_url():
+            _client = NoteApiClient()
+        return _client
+
+
+def reset_client() -> None:
+    """共有クライアントを破棄（接続先やアカウントを切り替える場合など）"""
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.session.close()
+        _client = None
+
+
+def post_to_note_api(
+    title: str,
+    content: str,
+    hashtags: Optional[List[str]] = None,
+    dry_run: bool = False
+) -> Dict:
+    """
+    HTTP APIでNote.comに記事を投稿（ブラウザを使わない）
+
+    Args:
+        title: 記事のタイトル
+        content: 記事の本文（マークダウン形式）
+        hashtags: ハッシュタグ
+        dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+
+    Returns:
+        投稿情報の辞書（post_to_note と同じ形式に 'backend': 'api' を追加）
+
+    Raises:
+        ValueError: ログイン情報が設定されていない場合
+        NotePostIncompleteError: 下書きの作成後（保存・公開）に失敗した場合
+        NoteApiError: ログイン・下書きの作成に失敗した場合
+    """
+    email = os.getenv('NOTE_EMAIL')
+    password = os.getenv('NOTE_PASSWORD')
+
+    if not all([email, password]):
+        raise ValueError('NOTE_EMAILとNOTE_PASSWORDを.envに設定してください')
+
+    body_html = markdown_to_note_html(content)
+
+    if dry_run:
+        print("🔍 [DRY RUN] 実際には投稿しません")
+        return {
+            'success': True,
+            'title': title,
+            'content_length': len(content),
+            'dry_run': True,
+            'backend': 'api'
+        }
+
+    client = get_client()
+    client.ensure_login(email, password)
+
+    print("📝 下書きを作成中...")
+    note = client.create_note()
+    note_id = note.get('id')
+    if not note_id:
+        raise NoteApiError("下書きの作成に失敗しました（記事IDがありません）")
+
+    # ここから先の失敗は、作成した記事の情報を付けて呼び出し側に知らせる（再投稿すると重複するため）
+    try:
+        client.save_draft(note_id, title, body_html)
+
+        print("🚀 記事を公開中...")
+        published = client.publish(note_id, title, body_html, hashtags)
+
+        note_username = client.urlname or os.getenv('NOTE_USERNAME', '')
+        note_url = extract_note_url(published, note_username)
+        if not note_url and note.get('key') and note_username:
+            note_url = f"https://note.com/{note_username}/n/{note['key']}"
+        if not note_url:
+            note_url = "https://note.com/my/notes"
+    except Exception as e:
+        raise NotePostIncompleteError(f"下書きの作成後に失敗しました: {e}", note_id, note.get('key')) from e
+
+    print(f"✅ 記事を公開しました！")
+    print(f"📍 公開URL: {note_url}")
+
+    return {
+        'success': True,
+        'url': note_url,
+        'title': title,
+        'content_length': len(content),
+        'dry_run': False,
+        'backend': 'api'
+    }
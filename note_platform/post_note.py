@@ -6,21 +6,15 @@ Seleniumを使用したブラウザ自動操作でNote.comに記事を投稿
 """
 
 import os
+import re
 import sys
 import io
-import time
-import pyperclip
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.action_chains import ActionChains
 
 # Windows環境での標準出力エンコーディング設定
 if sys.platform == 'win32':
@@ -30,11 +24,608 @@ if sys.platform == 'win32':
 # プロジェクトルートのパスを追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from browser_common.waits import (
+    DEFAULT_TIMEOUT,
+    SHORT_TIMEOUT,
+    wait_until,
+    wait_for_any_element,
+    wait_for_clickable,
+    wait_for_invisible,
+    wait_for_url_change,
+)
+from browser_common.artifacts import ArtifactRecorder
+from browser_common.dom import (
+    SelectorCache,
+    describe_buttons,
+    find_button,
+    find_first_element,
+    selector_to_locator,
+)
+from browser_common.network import NetworkMonitor
+from browser_common.text_input import insert_text
+from browser_common.options import build_chrome_options
+from browser_common.pool import get_browser_pool
+from local_cache import get_cache_dir
+from note_platform.note_api import NoteApiError, NotePostIncompleteError, extract_note_url, post_to_note_api
+
 # 環境変数読み込み
 load_dotenv()
 
+# 表示中のモーダル（コンテスト詳細・シェアなど）
+MODAL_LOCATOR = (By.CSS_SELECTOR, "[role='dialog'], [aria-modal='true']")
+
+# 記事作成ページのタイトル入力欄
+TITLE_INPUT_LOCATOR = (By.CSS_SELECTOR, "textarea[placeholder*='タイトル'], input[placeholder*='タイトル']")
+
+# 記事の作成・下書き保存・公開のAPI（エディタが送信するXHR）
+NOTE_API_PATTERN = r'note\.com/api/v\d+/text_notes'
+
+# 公開設定画面の「投稿する」ボタン
+FINAL_PUBLISH_LOCATOR = (By.XPATH, "//button[normalize-space(.)='投稿する']")
+
+# 記事作成ページの候補URL
+CREATE_URLS = [
+    "https://note.com/notes/create",
+    "https://note.com/post",
+    "https://note.com/new"
+]
+
+# タイトル入力欄の候補セレクタ
+TITLE_SELECTORS = [
+    "textarea[placeholder*='タイトル']",
+    "input[placeholder*='タイトル']",
+    "//textarea[contains(@placeholder, 'タイトル')]",
+    "//input[contains(@placeholder, 'タイトル')]",
+    "h1[contenteditable='true']",
+    "div[contenteditable='true'][role='textbox']"
+]
+
+# 本文入力欄の候補セレクタ
+CONTENT_SELECTORS = [
+    "textarea[placeholder*='本文']",
+    "div[contenteditable='true'][data-placeholder*='本文']",
+    "//textarea[contains(@placeholder, '本文')]",
+    "//div[@contenteditable='true' and contains(@data-placeholder, '本文')]",
+    "div[contenteditable='true']"
+]
+
+
+def get_user_data_dir() -> Path:
+    """
+    ログイン状態を保存するChromeプロファイルのディレクトリを取得
+
+    環境変数 NOTE_USER_DATA_DIR で変更可能（デフォルト: ~/.sns-auto-post/note/chrome-profile）
+    """
+    user_data_dir = os.getenv('NOTE_USER_DATA_DIR')
+    if user_data_dir:
+        return Path(user_data_dir)
+    return get_cache_dir('note', 'chrome-profile')
+
+
+def build_note_chrome_options(headless: bool = False, reuse_session: bool = True):
+    """
+    Note投稿用のChromeオプションを作成
+
+    ネットワークアイドルの判定・記事キーの取得にCDPのNetworkイベントを使う。
+    reuse_session時はログイン状態を保持する専用プロファイルを使用する。
+    """
+    user_data_dir = get_user_data_dir() if reuse_session else None
+    if user_data_dir:
+        print(f"🗂️  ブラウザプロファイル: {user_data_dir}")
+    return build_chrome_options(
+        headless=headless,
+        user_data_dir=user_data_dir,
+        performance_logging=True,
+        site='note'
+    )
+
+
+def get_selector_cache() -> SelectorCache:
+    """前回うまくいったURL・セレクタの記録（~/.sns-auto-post/note/selectors.json）"""
+    return SelectorCache(get_cache_dir('note') / 'selectors.json')
+
+
+def _find_by_selectors(driver, cache: SelectorCache, name: str, selectors):
+    """
+    候補セレクタから要素を1回の往復で探し、見つかったセレクタを記録
+
+    Returns:
+        (要素, セレクタ)。見つからない場合は (None, None)
+    """
+    ordered = cache.order(name, selectors)
+    element, locator = find_first_element(driver, [selector_to_locator(s) for s in ordered])
+    if not element:
+        return None, None
+    cache.remember(name, locator[1])
+    return element, locator[1]
+
+
+def _find_published_note_url(network: NetworkMonitor, note_username: str) -> Optional[str]:
+    """
+    エディタが送信した保存・公開APIのレスポンスから公開URLを取得（新しいレスポンスから順に確認）
+
+    Returns:
+        公開URL（見つからない場合はNone）
+    """
+    for request in network.find_requests(NOTE_API_PATTERN, methods=['POST', 'PUT']):
+        status = request['status'] or 0
+        if not 200 <= status < 300:
+            continue
+        payload = network.get_response_json(request['request_id'])
+        note_url = extract_note_url(payload, note_username) if payload else None
+        if note_url:
+            return note_url
+    return None
+
+
+# 公開設定画面で提案されたハッシュタグをまとめて選択する
+# クリックで開いたモーダル（コンテスト詳細など）は、クリック前になかったものだけを閉じる
+_SELECT_HASHTAGS_JS = """
+const wanted = arguments[0];
+const limit = arguments[1];
+const modalSelector = arguments[2];
+function isVisible(el) {
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0
+        && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function openModals() {
+    return Array.from(document.querySelectorAll(modalSelector)).filter(isVisible);
+}
+const label = el => (el.innerText || el.textContent || '').trim();
+const normalize = text => text.replace(/^#/, '').trim().toLowerCase();
+
+let targets = Array.from(document.querySelectorAll('button'))
+    .filter(el => isVisible(el) && label(el).startsWith('#'));
+const suggested = targets.map(label);
+if (wanted) {
+    targets = targets.filter(el => wanted.includes(normalize(label(el))));
+}
+if (limit !== null) {
+    targets = targets.slice(0, limit);
+}
+
+const selected = [];
+let closedModals = 0;
+for (const el of targets) {
+    const before = new Set(openModals());
+    el.click();
+    selected.push(label(el));
+    for (const modal of openModals()) {
+        if (before.has(modal)) {
+            continue;
+        }
+        const close = modal.querySelector("button[aria-label*='閉じる'], button[class*='close']");
+        if (close) {
+            close.click();
+        } else {
+            modal.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', code: 'Escape', keyCode: 27, bubbles: true}));
+        }
+        closedModals++;
+    }
+}
+return {suggested: suggested, selected: selected, closed_modals: closedModals};
+"""
+
+
+def _select_hashtags(
+    driver,
+    hashtags: Optional[List[str]] = None,
+    max_hashtags: Optional[int] = None
+) -> Dict:
+    """
+    公開設定画面で提案されたハッシュタグを1回のスクリプト実行でまとめて選択
+
+    Args:
+        hashtags: 選択するハッシュタグ（'#'の有無・大文字小文字は問わない。省略時は提案をすべて対象）
+        max_hashtags: 選択する最大数（提案の上位から）
+
+    Returns:
+        {'suggested': List[str], 'selected': List[str], 'closed_modals': int}
+    """
+    wanted = [tag.lstrip('#').strip().lower() for tag in hashtags] if hashtags is not None else None
+    result = driver.execute_script(_SELECT_HASHTAGS_JS, wanted, max_hashtags, MODAL_LOCATOR[1])
+
+    # 非同期に開いたモーダルが残っていれば閉じる（1回だけ確認）
+    if result['selected'] and _close_modal_with_escape(driver):
+        result['closed_modals'] += 1
+
+    return result
+
+
+def _close_modal_with_escape(driver) -> bool:
+    """
+    表示中のモーダルがあればEscapeキーで閉じ、消えるまで待機
+
+    Returns:
+        bool: モーダルを閉じたかどうか
+    """
+    modal, _ = wait_for_any_element(driver, [MODAL_LOCATOR], timeout=0.5, visible=True)
+    if not modal:
+        return False
+
+    ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+    wait_for_invisible(driver, modal)
+    return True
+
+
+def _login(driver, email: str, password: str) -> None:
+    """
+    Note.comにメールアドレスとパスワードでログイン
+
+    Raises:
+        Exception: ログインに失敗した場合
+    """
+    # Note.comのログインページにアクセス
+    print("🌐 Note.comにアクセス中...")
+    driver.get("https://note.com/login")
+
+    # ログイン
+    print("🔑 ログイン中...")
+
+    # メールアドレス入力フィールドが表示されるまで待機（動的ロードのため）
+    email_selectors = [
+        "input[type='text']",
+        "input[type='email']",
+        "input[name='email']",
+        "input[placeholder*='メール']",
+        "input[placeholder*='mail']",
+        "input[placeholder*='note']"
+    ]
+    email_locators = [(By.CSS_SELECTOR, selector) for selector in email_selectors]
+    email_locators.append((By.XPATH, "//input[@type='text' or @type='email']"))
+
+    email_input, email_locator = wait_for_any_element(driver, email_locators, visible=True)
+    if not email_input:
+        raise Exception("メール入力欄が見つかりません")
+    print(f"✅ メール入力欄を発見: {email_locator[1]}")
+
+    email_input.clear()
+    email_input.send_keys(email)
+    print(f"✅ メールアドレス入力完了: {email}")
+
+    # パスワード入力フィールドを探す
+    password_input = wait_for_clickable(driver, (By.CSS_SELECTOR, "input[type='password']"), timeout=SHORT_TIMEOUT)
+    if not password_input:
+        raise Exception("パスワード入力欄が見つかりません")
+    print("✅ パスワード入力欄を発見")
+
+    password_input.clear()
+    password_input.send_keys(password)
+    print("✅ パスワード入力完了")
+
+    # ログインボタンを探す（ボタンのテキストは1回の往復でまとめて取得）
+    login_button = find_button(driver, 'ログイン')
+    if not login_button:
+        print("📋 ページ内のボタン:")
+        print(describe_buttons(driver))
+        raise Exception("ログインボタンが見つかりません")
+    print("✅ ログインボタンを発見")
+
+    login_url = driver.current_url
+    login_button.click()
+    print("✅ ログインボタンをクリックしました")
+
+    # ログイン完了（ログインページからの遷移）を待つ
+    print("⏳ ログイン処理を待機中...")
+    if not wait_for_url_change(driver, login_url, timeout=DEFAULT_TIMEOUT * 2):
+        raise Exception("ログインに失敗しました（ログインページから遷移しません）")
+    print("✅ ログイン成功")
+
+
+def _open_editor(driver, cache: SelectorCache) -> Optional[str]:
+    """
+    記事作成ページを開く（前回到達できたURLから試す）
+
+    Returns:
+        'editor': 記事作成ページに到達した
+        'login': ログインページにリダイレクトされた（未ログイン・セッション期限切れ）
+        None: どの候補URLでも記事作成ページに到達できなかった
+    """
+    def editor_or_login(d):
+        if '/login' in d.current_url:
+            return 'login'
+        if d.find_elements(*TITLE_INPUT_LOCATOR):
+            return 'editor'
+        return False
+
+    for url in cache.order('create_url', CREATE_URLS):
+        try:
+            driver.get(url)
+
+            # タイトル入力欄の表示、またはログインページへのリダイレクトを待機
+            state = wait_until(driver, editor_or_login)
+            if state == 'editor':
+                print(f"✅ 記事作成ページに到達: {url}")
+                cache.remember('create_url', url)
+                return 'editor'
+            elif state == 'login':
+                print("🔑 ログインが必要です（保存済みセッションなし・期限切れ）")
+                return 'login'
+            else:
+                print(f"⚠️  {url} は記事作成ページではありません")
+                continue
+        except Exception as e:
+            print(f"⚠️  {url} への移動に失敗: {str(e)}")
+            continue
+
+    return None
+
+
+def _open_and_fill_editor(driver, selector_cache: SelectorCache, email: str, password: str, title: str, content: str) -> None:
+    """
+    記事作成ページを開き（必要な場合のみログイン）、タイトルと本文を入力
+
+    Raises:
+        Exception: 入力欄が見つからない・入力できない場合
+    """
+    # 保存済みのセッションで記事作成ページを開く（ログイン済みならログインを省略）
+    print("📝 記事作成ページに移動中...")
+    editor_state = _open_editor(driver, selector_cache)
+
+    if editor_state != 'editor':
+        # セッションがない・期限切れの場合のみログイン
+        _login(driver, email, password)
+        print("📝 記事作成ページに移動中...")
+        editor_state = _open_editor(driver, selector_cache)
+
+    if editor_state != 'editor':
+        print("⚠️  記事作成ページに到達できませんでした")
+
+    # モーダルやポップアップを閉じる
+    try:
+        close_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, '閉じる') or contains(@class, 'close')]")
+        for btn in close_buttons:
+            try:
+                btn.click()
+                print("✅ モーダルを閉じました")
+                wait_for_invisible(driver, btn)
+            except:
+                pass
+    except:
+        pass
+
+    # タイトル入力
+    print(f"✍️  タイトルを入力中: {title}")
+
+    # タイトル入力欄を探す（候補セレクタをまとめて評価）
+    title_input, title_selector = _find_by_selectors(driver, selector_cache, 'title', TITLE_SELECTORS)
+    if not title_input:
+        raise Exception("タイトル入力欄が見つかりません")
+    print(f"✅ タイトル入力欄を発見: {title_selector}")
+
+    # タイトルを入力（send_keysは絵文字を送れないため一括入力）
+    insert_text(driver, title_input, title)
+
+    print(f"✅ タイトル入力完了: {title}")
+
+    # 本文入力
+    print(f"✍️  本文を入力中... ({len(content)}文字)")
+
+    # 本文入力欄を探す（候補セレクタをまとめて評価）
+    content_textarea, content_selector = _find_by_selectors(driver, selector_cache, 'content', CONTENT_SELECTORS)
+    if not content_textarea:
+        raise Exception("本文入力欄が見つかりません")
+    print(f"✅ 本文入力欄を発見: {content_selector}")
+
+    # 貼り付けイベントで本文を一括入力（絵文字・Markdown記法に対応）
+    # システムのクリップボードを使わないため、ヘッドレス環境や並列実行でも動作する
+    try:
+        method = insert_text(driver, content_textarea, content)
+        print(f"   📝 入力方法: {'貼り付けイベント' if method == 'paste' else 'CDP Input.insertText'}")
+    except Exception as e:
+        raise Exception(f"本文入力に失敗しました: {e}")
+
+    print(f"✅ 本文入力完了: {len(content)}文字")
+
+
+def _apply_hashtags(
+    driver,
+    hashtags: Optional[List[str]] = None,
+    max_hashtags: Optional[int] = None
+) -> List[str]:
+    """
+    公開設定画面で提案されたハッシュタグを選択し、結果を表示（失敗しても例外にしない）
+
+    Returns:
+        List[str]: 選択したハッシュタグ
+    """
+    print("🏷️  提案されたハッシュタグを選択中...")
+    try:
+        hashtag_result = _select_hashtags(driver, hashtags, max_hashtags)
+
+        if not hashtag_result['suggested']:
+            print("ℹ️  提案されたハッシュタグがありません")
+        elif hashtag_result['selected']:
+            print(f"✅ ハッシュタグを選択しました: {', '.join(hashtag_result['selected'])}")
+            if hashtag_result['closed_modals']:
+                print(f"   ℹ️  コンテスト詳細モーダルを閉じました（{hashtag_result['closed_modals']}件）")
+        else:
+            print("ℹ️  選択可能なハッシュタグが見つかりませんでした")
+
+        if hashtags:
+            suggested = {tag.lstrip('#').lower() for tag in hashtag_result['suggested']}
+            missing = [tag for tag in hashtags if tag.lstrip('#').strip().lower() not in suggested]
+            if missing:
+                print(f"   ℹ️  提案にないため選択しなかったハッシュタグ: {', '.join(missing)}")
+
+        return hashtag_result['selected']
+
+    except Exception as hashtag_error:
+        print(f"ℹ️  ハッシュタグ選択をスキップ: {hashtag_error}")
+        return []
+
+
+def _publish_from_settings(
+    driver,
+    network: NetworkMonitor,
+    hashtags: Optional[List[str]] = None,
+    max_hashtags: Optional[int] = None,
+    select_hashtags: bool = True
+) -> str:
+    """
+    公開設定画面でハッシュタグを選択して「投稿する」をクリックし、公開した記事のURLを取得
+
+    Args:
+        select_hashtags: Falseの場合はハッシュタグを選択しない（下書きの準備時に選択済み）
+
+    Returns:
+        str: 公開URL（取得できない場合はマイページのURL）
+
+    Raises:
+        Exception: 「投稿する」ボタンが見つからない場合
+    """
+    if select_hashtags:
+        _apply_hashtags(driver, hashtags, max_hashtags)
+
+    print("   （記事タイプ: 無料）")
+
+    # 公開設定画面の「投稿する」ボタンがクリック可能になるまで待つ
+    wait_for_clickable(driver, FINAL_PUBLISH_LOCATOR, timeout=SHORT_TIMEOUT)
+
+    # 表示されている「投稿する」ボタンを探す
+    final_publish_button = find_button(driver, '投稿する')
+    if not final_publish_button:
+        print("⚠️  「投稿する」ボタンが見つかりません")
+        print("📋 公開設定画面のすべてのボタン:")
+        print(describe_buttons(driver))
+        raise Exception("「投稿する」ボタンが見つかりません")
+    print("✅ 「投稿する」ボタンを発見")
+
+    # 「投稿する」ボタンをクリック
+    print("🚀 ステップ3: 「投稿する」ボタンをクリックして本番公開...")
+    publish_settings_url = driver.current_url
+    final_publish_button.click()
+
+    # 公開完了を待つ（シェアモーダルの表示またはURLの遷移）
+    print("⏳ 公開処理を待機中...")
+    wait_until(
+        driver,
+        lambda d: d.current_url != publish_settings_url or any(
+            modal.is_displayed() for modal in d.find_elements(*MODAL_LOCATOR)
+        ),
+        timeout=DEFAULT_TIMEOUT * 2
+    )
+    network.wait_for_idle()
+
+    # 公開APIのレスポンスから記事URLを取得（ページ遷移でレスポンス本文が消える前に読む）
+    note_username = os.getenv('NOTE_USERNAME', '')
+    published_url = _find_published_note_url(network, note_username)
+
+    # シェアモーダルが表示されるので閉じる
+    print("📋 ステップ4: シェアモーダルを閉じて記事URLに遷移中...")
+    try:
+        # シェアモーダルの×ボタンを探す
+        close_buttons = driver.find_elements(By.XPATH, "//button[@aria-label='閉じる' or contains(@class, 'close')]")
+        share_modal_closed = False
+
+        for close_btn in close_buttons:
+            try:
+                if close_btn.is_displayed():
+                    print("   ✅ シェアモーダルの×ボタンを発見")
+                    close_btn.click()
+                    share_modal_closed = True
+                    wait_for_invisible(driver, close_btn)
+                    break
+            except:
+                pass
+
+        # ×ボタンが見つからない場合はEscapeキーで閉じる
+        if not share_modal_closed:
+            print("   ℹ️  Escapeキーでシェアモーダルを閉じます")
+            _close_modal_with_escape(driver)
+
+        print("   ✅ シェアモーダルを閉じました")
+    except Exception as share_error:
+        print(f"   ℹ️  シェアモーダルのクローズをスキップ: {share_error}")
+
+    # 公開設定画面から記事ページへの遷移を待つ（遷移しない場合もある）
+    wait_until(driver, lambda d: '/publish' not in d.current_url, timeout=SHORT_TIMEOUT)
+
+    # 現在のURLを確認（記事URLが取得できる場合がある）
+    current_url = driver.current_url
+    print(f"📍 公開後のURL: {current_url}")
+
+    # 記事URLを取得
+    note_url = None
+
+    # ケース0: 公開APIのレスポンスから記事キーを取得できた場合
+    if published_url:
+        note_url = published_url
+        print(f"✅ 記事を公開しました！")
+        print(f"📍 公開URL: {note_url}")
+
+    # ケース1: editor.note.com/notes/{note_id}/publish/ の形式の場合
+    elif "editor.note.com/notes/" in current_url and "/publish/" in current_url:
+        # 記事IDを抽出
+        match = re.search(r'/notes/(n[a-zA-Z0-9]+)/', current_url)
+        if match and note_username:
+            note_id = match.group(1)
+            # 公開記事のURLを生成
+            note_url = f"https://note.com/{note_username}/n/{note_id}"
+            print(f"✅ 記事を公開しました！")
+            print(f"📍 公開URL: {note_url}")
+        else:
+            print(f"ℹ️  記事IDは取得できましたが、ユーザー名が設定されていません")
+
+    # ケース2: URLに記事IDが含まれている場合（既に公開記事のURL）
+    elif "/n" in current_url and "note.com" in current_url and "editor.note.com" not in current_url:
+        note_url = current_url.split('?')[0]  # クエリパラメータを除去
+        print(f"✅ 記事を公開しました！")
+        print(f"📍 公開URL: {note_url}")
+
+    # ケース2: URLから記事IDが取得できない場合、プロフィールページから取得
+    else:
+        print("📋 ステップ4: 記事URLを取得中...")
 
-def post_to_note(title: str, content: str, headless: bool = False, dry_run: bool = False) -> Dict:
+        # NOTE_USERNAMEを環境変数から取得（オプション）
+        note_username = os.getenv('NOTE_USERNAME', '')
+
+        if note_username:
+            try:
+                # ユーザーのプロフィールページに移動
+                profile_url = f"https://note.com/{note_username}"
+                print(f"   プロフィールページに移動: {profile_url}")
+                driver.get(profile_url)
+
+                # 最新の記事リンクを取得（表示されるまで待機）
+                article_link_locator = (By.CSS_SELECTOR, f"a[href*='/{note_username}/n']")
+                wait_for_any_element(driver, [article_link_locator])
+                article_links = driver.find_elements(*article_link_locator)
+                if article_links:
+                    # 最初のリンク（最新記事）のhrefを取得
+                    latest_article_url = article_links[0].get_attribute('href')
+                    if latest_article_url and '/n' in latest_article_url:
+                        note_url = latest_article_url.split('?')[0]  # クエリパラメータを除去
+                        print(f"✅ 記事を公開しました！")
+                        print(f"📍 公開URL: {note_url}")
+                else:
+                    print(f"ℹ️  プロフィールページから記事URLを取得できませんでした")
+            except Exception as profile_error:
+                print(f"ℹ️  プロフィールページからの取得に失敗: {profile_error}")
+
+        # URLが取得できなかった場合
+        if not note_url:
+            print(f"✅ 記事の公開が完了しました！")
+            print(f"📍 記事はNote.comのマイページから確認できます: https://note.com/my/notes")
+            # フォールバック: マイページのURLを返す
+            note_url = "https://note.com/my/notes"
+
+    return note_url
+
+
+def post_to_note(
+    title: str,
+    content: str,
+    headless: bool = False,
+    dry_run: bool = False,
+    reuse_session: bool = True,
+    hashtags: Optional[List[str]] = None,
+    max_hashtags: Optional[int] = None,
+    screenshots: bool = False,
+    backend: Optional[str] = None
+) -> Dict:
     """
     Note.comに記事を投稿
 
@@ -43,6 +634,14 @@ def post_to_note(title: str, content: str, headless: bool = False, dry_run: bool
         content: 記事の本文（マークダウン形式）
         headless: Trueの場合、ヘッドレスモードで実行
         dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+        reuse_session: Trueの場合、専用のChromeプロファイルにログイン状態を保存して次回以降も再利用する
+                       （ログインはセッションが切れたときだけ行う）
+        hashtags: 公開設定画面で選択するハッシュタグ（提案されたものの中から選択。省略時は提案をすべて選択）
+        max_hashtags: 選択するハッシュタグの最大数（提案の上位から）
+        screenshots: Trueの場合、失敗時以外（投稿前・投稿後）もスクリーンショットを保存
+        backend: 'browser'（Seleniumでエディタを操作）または 'api'（エディタが使うJSON APIを直接呼ぶ）
+                 省略時は環境変数 NOTE_BACKEND（デフォルト: browser）。'api' でログイン・下書きの作成に
+                 失敗した場合は 'browser' で投稿する（下書きの作成後の失敗は NotePostIncompleteError）
 
     Returns:
         投稿情報の辞書
@@ -55,6 +654,7 @@ def post_to_note(title: str, content: str, headless: bool = False, dry_run: bool
 
     Raises:
         ValueError: ログイン情報が設定されていない場合
+        NotePostIncompleteError: API方式で下書きの作成後に失敗した場合（記事ID・キーを含む）
         Exception: 投稿に失敗した場合
     """
     # ログイン情報確認
@@ -74,476 +674,71 @@ def post_to_note(title: str, content: str, headless: bool = False, dry_run: bool
             'dry_run': True
         }
 
-    # Chrome オプション設定
-    chrome_options = Options()
+    # HTTP API方式（ブラウザを起動しない）。ログイン・下書きの作成前に失敗した場合のみブラウザでの投稿にフォールバック
+    backend = (backend or os.getenv('NOTE_BACKEND', 'browser')).lower()
+    if backend == 'api':
+        api_hashtags = hashtags[:max_hashtags] if hashtags and max_hashtags is not None else hashtags
+        try:
+            return post_to_note_api(title, content, hashtags=api_hashtags)
+        except NotePostIncompleteError as e:
+            # 下書きは作成済みのため、ブラウザで投稿し直すと記事が重複する
+            print(f"❌ APIでの投稿が途中で失敗しました。編集ページで公開または削除してください: {e.edit_url}")
+            raise
+        except NoteApiError as e:
+            print(f"⚠️  APIでの投稿に失敗しました。ブラウザでの投稿に切り替えます: {e}")
 
-    # Windows環境でのChrome実行パスを明示的に指定
-    if sys.platform == 'win32':
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        if os.path.exists(chrome_path):
-            chrome_options.binary_location = chrome_path
-        else:
-            # 32bit版のパスも試す
-            chrome_path_x86 = r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
-            if os.path.exists(chrome_path_x86):
-                chrome_options.binary_location = chrome_path_x86
-
-    if headless:
-        chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-
-    # 環境変数からヘッドレスモード設定を読み込み
-    headless_env = os.getenv('BROWSER_HEADLESS', 'false').lower() == 'true'
-    if headless_env and not headless:
-        headless = True
-        chrome_options.add_argument('--headless')
+    # Chrome オプション設定
+    chrome_options = build_note_chrome_options(headless, reuse_session)
 
+    # 起動済みのChromeがあれば再利用（投稿ごとに起動・終了しない）
+    pool = get_browser_pool()
+    selector_cache = get_selector_cache()
+    # スクリーンショットは失敗時のみ（screenshots=True または BROWSER_ARTIFACTS=all で投稿前後も）
+    artifacts = ArtifactRecorder('note', capture_all=True if screenshots else None)
     driver = None
+    failed = False
 
     try:
-        # ChromeDriver 自動セットアップ
-        print("🔧 ChromeDriverをセットアップ中...")
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        print("✅ ChromeDriverのセットアップ完了")
-
-        # Note.comのログインページにアクセス
-        print("🌐 Note.comにアクセス中...")
-        driver.get("https://note.com/login")
-        time.sleep(2)
-
-        # ログイン
-        print("🔑 ログイン中...")
-
-        # ページが完全に読み込まれるまで待機
-        time.sleep(3)
-
-        # デバッグ: ページのHTMLを確認
-        print("📋 ページ要素を確認中...")
-
-        # メールアドレス入力フィールドを探す
-        email_input = None
-        selectors = [
-            "input[type='text']",
-            "input[type='email']",
-            "input[name='email']",
-            "input[placeholder*='メール']",
-            "input[placeholder*='mail']",
-            "input[placeholder*='note']"
-        ]
-
-        for selector in selectors:
-            try:
-                email_input = driver.find_element(By.CSS_SELECTOR, selector)
-                print(f"✅ メール入力欄を発見: {selector}")
-                break
-            except:
-                continue
-
-        if not email_input:
-            # XPathでも試す
-            try:
-                email_input = driver.find_element(By.XPATH, "//input[@type='text' or @type='email']")
-                print("✅ メール入力欄を発見: XPath")
-            except Exception as e:
-                raise Exception(f"メール入力欄が見つかりません: {str(e)}")
-
-        email_input.clear()
-        email_input.send_keys(email)
-        print(f"✅ メールアドレス入力完了: {email}")
-        time.sleep(1)
-
-        # パスワード入力フィールドを探す
-        try:
-            password_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-            print("✅ パスワード入力欄を発見")
-        except Exception as e:
-            raise Exception(f"パスワード入力欄が見つかりません: {str(e)}")
-
-        password_input.clear()
-        password_input.send_keys(password)
-        print("✅ パスワード入力完了")
-        time.sleep(1)
-
-        # ログインボタンを探す
-        login_button = None
-
-        # まずテキストでボタンを探す
-        all_buttons = driver.find_elements(By.TAG_NAME, "button")
-        print(f"📋 ページ内のボタン数: {len(all_buttons)}")
-
-        for i, btn in enumerate(all_buttons):
-            btn_text = btn.text.strip()
-            print(f"  ボタン{i}: text='{btn_text}' type='{btn.get_attribute('type')}'")
-            if btn_text == 'ログイン':
-                login_button = btn
-                print(f"✅ ログインボタンを発見: ボタン{i}")
-                break
-
-        if not login_button:
-            raise Exception("ログインボタンが見つかりません")
-
-        login_button.click()
-        print("✅ ログインボタンをクリックしました")
-
-        # ログイン完了を待つ
-        print("⏳ ログイン処理を待機中...")
-        time.sleep(5)
-
-        # 記事作成ページに直接移動
-        print("📝 記事作成ページに移動中...")
-
-        # 複数のURLパターンを試す
-        create_urls = [
-            "https://note.com/notes/create",
-            "https://note.com/post",
-            "https://note.com/new"
-        ]
-
-        for url in create_urls:
-            try:
-                driver.get(url)
-                time.sleep(3)
-
-                # タイトル入力欄が存在するか確認
-                try:
-                    driver.find_element(By.CSS_SELECTOR, "textarea[placeholder*='タイトル'], input[placeholder*='タイトル']")
-                    print(f"✅ 記事作成ページに到達: {url}")
-                    break
-                except:
-                    print(f"⚠️  {url} は記事作成ページではありません")
-                    continue
-            except Exception as e:
-                print(f"⚠️  {url} への移動に失敗: {str(e)}")
-                continue
-
-        # モーダルやポップアップを閉じる
-        try:
-            close_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, '閉じる') or contains(@class, 'close')]")
-            for btn in close_buttons:
-                try:
-                    btn.click()
-                    print("✅ モーダルを閉じました")
-                    time.sleep(1)
-                except:
-                    pass
-        except:
-            pass
-
-        # タイトル入力
-        print(f"✍️  タイトルを入力中: {title}")
-
-        # タイトル入力欄を探す（複数のセレクタを試す）
-        title_input = None
-        title_selectors = [
-            "textarea[placeholder*='タイトル']",
-            "input[placeholder*='タイトル']",
-            "//textarea[contains(@placeholder, 'タイトル')]",
-            "//input[contains(@placeholder, 'タイトル')]",
-            "h1[contenteditable='true']",
-            "div[contenteditable='true'][role='textbox']"
-        ]
-
-        for selector in title_selectors:
-            try:
-                if selector.startswith("//"):
-                    title_input = driver.find_element(By.XPATH, selector)
-                else:
-                    title_input = driver.find_element(By.CSS_SELECTOR, selector)
-                print(f"✅ タイトル入力欄を発見: {selector}")
-                break
-            except:
-                continue
-
-        if not title_input:
-            raise Exception("タイトル入力欄が見つかりません")
-
-        # タイトルを入力
-        try:
-            title_input.click()
-            time.sleep(0.5)
-            title_input.clear()
-            title_input.send_keys(title)
-        except:
-            # contenteditable要素の場合
-            driver.execute_script("arguments[0].textContent = arguments[1];", title_input, title)
-
-        print(f"✅ タイトル入力完了: {title}")
-        time.sleep(1)
-
-        # 本文入力
-        print(f"✍️  本文を入力中... ({len(content)}文字)")
-
-        # 本文入力欄を探す（複数のセレクタを試す）
-        content_textarea = None
-        content_selectors = [
-            "textarea[placeholder*='本文']",
-            "div[contenteditable='true'][data-placeholder*='本文']",
-            "//textarea[contains(@placeholder, '本文')]",
-            "//div[@contenteditable='true' and contains(@data-placeholder, '本文')]",
-            "div[contenteditable='true']"
-        ]
-
-        for selector in content_selectors:
-            try:
-                if selector.startswith("//"):
-                    content_textarea = driver.find_element(By.XPATH, selector)
-                else:
-                    content_textarea = driver.find_element(By.CSS_SELECTOR, selector)
-                print(f"✅ 本文入力欄を発見: {selector}")
-                break
-            except:
-                continue
-
-        if not content_textarea:
-            raise Exception("本文入力欄が見つかりません")
-
-        # クリップボード経由で本文を入力（絵文字対応）
-        try:
-            content_textarea.click()
-            time.sleep(0.5)
-            content_textarea.clear()
-
-            # クリップボードにコピー
-            print(f"   📋 クリップボードにコピー中...")
-            pyperclip.copy(content)
-
-            # Ctrl+Vで貼り付け（Windows/Linux）またはCmd+V（Mac）
-            print(f"   📝 貼り付け中...")
-            if sys.platform == 'darwin':
-                # Mac: Cmd+V
-                content_textarea.send_keys(Keys.COMMAND, 'v')
-            else:
-                # Windows/Linux: Ctrl+V
-                content_textarea.send_keys(Keys.CONTROL, 'v')
+        # Chromeを起動（プールに待機中のChromeがあれば再利用）
+        print("🔧 ブラウザを準備中...")
+        driver = pool.acquire(chrome_options)
+        network = NetworkMonitor(driver)
+        print("✅ ブラウザの準備完了")
 
-            time.sleep(1)  # 貼り付け完了を待つ
+        _open_and_fill_editor(driver, selector_cache, email, password, title, content)
 
-        except Exception as e:
-            print(f"⚠️  クリップボード貼り付けに失敗: {e}")
-            print("   フォールバック: JavaScript経由で入力を試みます...")
-            # JavaScript経由で入力（フォールバック）
-            try:
-                driver.execute_script("arguments[0].textContent = arguments[1];", content_textarea, content)
-            except Exception as e2:
-                raise Exception(f"本文入力に失敗しました: {e2}")
-
-        print(f"✅ 本文入力完了: {len(content)}文字")
-        time.sleep(2)
+        # 下書きの自動保存リクエストが落ち着くまで待つ
+        network.wait_for_idle()
 
-        # スクリーンショット保存（投稿前）
-        screenshot_path = Path.home() / "note_post_preview.png"
-        driver.save_screenshot(str(screenshot_path))
-        print(f"📸 投稿前のスクリーンショットを保存: {screenshot_path}")
+        # スクリーンショット保存（投稿前、指定時のみ）
+        artifacts.checkpoint(driver, 'preview')
 
         # 「公開に進む」ボタンをクリック
         print("📤 公開ボタンを探しています...")
         try:
-            # すべてのボタンを取得して「公開」が含まれるものを探す
-            all_buttons = driver.find_elements(By.TAG_NAME, "button")
-            publish_button = None
-
-            for btn in all_buttons:
-                btn_text = btn.text.strip()
-                if '公開' in btn_text:
-                    publish_button = btn
-                    print(f"✅ 公開ボタンを発見: '{btn_text}'")
-                    break
-
+            # 「公開」を含むボタンを探す
+            publish_button = find_button(driver, '公開', exact=False)
             if not publish_button:
                 print("📋 ページ内のすべてのボタンを確認:")
-                for i, btn in enumerate(all_buttons):
-                    print(f"  ボタン{i}: '{btn.text}'")
+                print(describe_buttons(driver, visible=False))
                 raise Exception("公開ボタンが見つかりません")
+            print("✅ 公開ボタンを発見")
 
             # 公開ボタンをクリック
             print("🚀 ステップ1: 「公開に進む」ボタンをクリック...")
             publish_button.click()
-            time.sleep(3)
 
-            # 公開設定画面が表示される
+            # 公開設定画面が表示される（「投稿する」ボタンが現れるまで待つ）
             print("📋 ステップ2: 公開設定画面を確認中...")
-            time.sleep(2)  # 画面遷移を待つ
-
-            # ハッシュタグを自動選択
-            print("🏷️  提案されたハッシュタグを選択中...")
-            try:
-                # ハッシュタグボタンを取得（CSSセレクタで#から始まるボタン、またはハッシュタグを含むボタン）
-                hashtag_buttons = driver.find_elements(By.XPATH, "//button[starts-with(., '#')]")
-
-                if hashtag_buttons:
-                    selected_tags = []
-                    for btn in hashtag_buttons:
-                        try:
-                            tag_text = btn.text.strip()
-                            if tag_text and btn.is_displayed():
-                                btn.click()
-                                selected_tags.append(tag_text)
-                                time.sleep(0.3)  # クリック間隔
-
-                                # コンテスト詳細モーダルが開いた場合は閉じる
-                                # Escapeキーを押してモーダルを閉じる（より確実）
-                                try:
-                                    time.sleep(0.5)  # モーダルが開くのを待つ
-                                    from selenium.webdriver.common.action_chains import ActionChains
-                                    actions = ActionChains(driver)
-                                    actions.send_keys(Keys.ESCAPE).perform()
-                                    print(f"   ℹ️  コンテスト詳細モーダルを閉じました（Escape）")
-                                    time.sleep(0.5)
-                                except:
-                                    pass
-
-                        except Exception as btn_error:
-                            # 個別のボタンクリックに失敗しても続行
-                            pass
-
-                    if selected_tags:
-                        print(f"✅ ハッシュタグを選択しました: {', '.join(selected_tags)}")
-                    else:
-                        print("ℹ️  選択可能なハッシュタグが見つかりませんでした")
-                else:
-                    print("ℹ️  提案されたハッシュタグがありません")
-
-            except Exception as hashtag_error:
-                print(f"ℹ️  ハッシュタグ選択をスキップ: {hashtag_error}")
-
-            print("   （記事タイプ: 無料）")
-
-            # 公開設定画面の「投稿する」ボタンを探す
-            time.sleep(1)
-
-            all_buttons_settings = driver.find_elements(By.TAG_NAME, "button")
-            final_publish_button = None
-
-            for btn in all_buttons_settings:
-                btn_text = btn.text.strip()
-                # 「投稿する」ボタンを探す
-                if btn_text == '投稿する':
-                    # 表示されているボタンのみ対象
-                    if btn.is_displayed():
-                        final_publish_button = btn
-                        print(f"✅ 「投稿する」ボタンを発見")
-                        break
-
-            if not final_publish_button:
-                print("⚠️  「投稿する」ボタンが見つかりません")
-                print("📋 公開設定画面のすべてのボタン:")
-                for i, btn in enumerate(all_buttons_settings):
-                    if btn.is_displayed():
-                        print(f"  ボタン{i}: '{btn.text}'")
-                raise Exception("「投稿する」ボタンが見つかりません")
-
-            # 「投稿する」ボタンをクリック
-            print("🚀 ステップ3: 「投稿する」ボタンをクリックして本番公開...")
-            final_publish_button.click()
-            time.sleep(3)
-
-            # 公開完了を待つ
-            print("⏳ 公開処理を待機中...")
-            time.sleep(5)
-
-            # シェアモーダルが表示されるので閉じる
-            print("📋 ステップ4: シェアモーダルを閉じて記事URLに遷移中...")
-            try:
-                # シェアモーダルの×ボタンを探す
-                close_buttons = driver.find_elements(By.XPATH, "//button[@aria-label='閉じる' or contains(@class, 'close')]")
-                share_modal_closed = False
-
-                for close_btn in close_buttons:
-                    try:
-                        if close_btn.is_displayed():
-                            print("   ✅ シェアモーダルの×ボタンを発見")
-                            close_btn.click()
-                            share_modal_closed = True
-                            time.sleep(2)
-                            break
-                    except:
-                        pass
-
-                # ×ボタンが見つからない場合はEscapeキーで閉じる
-                if not share_modal_closed:
-                    print("   ℹ️  Escapeキーでシェアモーダルを閉じます")
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    actions = ActionChains(driver)
-                    actions.send_keys(Keys.ESCAPE).perform()
-                    time.sleep(2)
-
-                print("   ✅ シェアモーダルを閉じました")
-            except Exception as share_error:
-                print(f"   ℹ️  シェアモーダルのクローズをスキップ: {share_error}")
-
-            # URLの遷移を待つ
-            time.sleep(2)
-
-            # 現在のURLを確認（記事URLが取得できる場合がある）
-            current_url = driver.current_url
-            print(f"📍 公開後のURL: {current_url}")
-
-            # 記事URLを取得
-            note_url = None
-            note_username = os.getenv('NOTE_USERNAME', '')
-
-            # ケース1: editor.note.com/notes/{note_id}/publish/ の形式の場合
-            if "editor.note.com/notes/" in current_url and "/publish/" in current_url:
-                # 記事IDを抽出
-                import re
-                match = re.search(r'/notes/(n[a-zA-Z0-9]+)/', current_url)
-                if match and note_username:
-                    note_id = match.group(1)
-                    # 公開記事のURLを生成
-                    note_url = f"https://note.com/{note_username}/n/{note_id}"
-                    print(f"✅ 記事を公開しました！")
-                    print(f"📍 公開URL: {note_url}")
-                else:
-                    print(f"ℹ️  記事IDは取得できましたが、ユーザー名が設定されていません")
-
-            # ケース2: URLに記事IDが含まれている場合（既に公開記事のURL）
-            elif "/n" in current_url and "note.com" in current_url and "editor.note.com" not in current_url:
-                note_url = current_url.split('?')[0]  # クエリパラメータを除去
-                print(f"✅ 記事を公開しました！")
-                print(f"📍 公開URL: {note_url}")
+            if not wait_for_any_element(driver, [FINAL_PUBLISH_LOCATOR], visible=True)[0]:
+                print("⚠️  公開設定画面の表示を確認できません")
+            network.wait_for_idle()
 
-            # ケース2: URLから記事IDが取得できない場合、プロフィールページから取得
-            else:
-                print("📋 ステップ4: 記事URLを取得中...")
-
-                # NOTE_USERNAMEを環境変数から取得（オプション）
-                note_username = os.getenv('NOTE_USERNAME', '')
-
-                if note_username:
-                    try:
-                        # ユーザーのプロフィールページに移動
-                        profile_url = f"https://note.com/{note_username}"
-                        print(f"   プロフィールページに移動: {profile_url}")
-                        driver.get(profile_url)
-                        time.sleep(3)
-
-                        # 最新の記事リンクを取得
-                        article_links = driver.find_elements(By.CSS_SELECTOR, f"a[href*='/{note_username}/n']")
-                        if article_links:
-                            # 最初のリンク（最新記事）のhrefを取得
-                            latest_article_url = article_links[0].get_attribute('href')
-                            if latest_article_url and '/n' in latest_article_url:
-                                note_url = latest_article_url.split('?')[0]  # クエリパラメータを除去
-                                print(f"✅ 記事を公開しました！")
-                                print(f"📍 公開URL: {note_url}")
-                        else:
-                            print(f"ℹ️  プロフィールページから記事URLを取得できませんでした")
-                    except Exception as profile_error:
-                        print(f"ℹ️  プロフィールページからの取得に失敗: {profile_error}")
-
-                # URLが取得できなかった場合
-                if not note_url:
-                    print(f"✅ 記事の公開が完了しました！")
-                    print(f"📍 記事はNote.comのマイページから確認できます: https://note.com/my/notes")
-                    # フォールバック: マイページのURLを返す
-                    note_url = "https://note.com/my/notes"
+            note_url = _publish_from_settings(driver, network, hashtags, max_hashtags)
 
         except Exception as e:
             print(f"⚠️  公開処理中にエラー: {str(e)}")
+            artifacts.capture(driver, 'publish_error')
             print("📝 記事の下書きは保存されました")
             note_url = driver.current_url
 
@@ -555,28 +750,25 @@ def post_to_note(title: str, content: str, headless: bool = False, dry_run: bool
             'dry_run': False
         }
 
-        # スクリーンショット保存（投稿後）
-        screenshot_path_after = Path.home() / "note_post_after.png"
-        driver.save_screenshot(str(screenshot_path_after))
-        print(f"📸 投稿後のスクリーンショットを保存: {screenshot_path_after}")
+        # スクリーンショット保存（投稿後、指定時のみ）
+        artifacts.checkpoint(driver, 'after')
 
         return result
 
     except Exception as e:
-        # エラー時もスクリーンショットを保存
+        failed = True
+
+        # エラー時のスクリーンショットを保存
         if driver:
-            screenshot_path = Path.home() / "note_post_error.png"
-            driver.save_screenshot(str(screenshot_path))
-            print(f"📸 エラー時のスクリーンショットを保存: {screenshot_path}")
+            artifacts.capture(driver, 'error')
 
         raise Exception(f"Note投稿に失敗しました: {str(e)}")
 
     finally:
-        # ブラウザを閉じる
+        # ブラウザをプールに返却（エラー時は再利用せずに終了）
         if driver:
-            time.sleep(2)
-            driver.quit()
-            print("🔒 ブラウザを閉じました")
+            pool.release(driver, healthy=not failed)
+        artifacts.close()
 
 
 def main():
@@ -619,6 +811,36 @@ def main():
         help='実際には投稿せず、シミュレーションのみ'
     )
 
+    parser.add_argument(
+        '--no-reuse-session',
+        action='store_true',
+        help='ログインセッションを専用プロファイルに保存・再利用しない'
+    )
+
+    parser.add_argument(
+        '--hashtags',
+        nargs='+',
+        help='公開設定画面で選択するハッシュタグ（提案されたものから選択、省略時は提案をすべて選択）'
+    )
+
+    parser.add_argument(
+        '--max-hashtags',
+        type=int,
+        help='選択するハッシュタグの最大数'
+    )
+
+    parser.add_argument(
+        '--screenshots',
+        action='store_true',
+        help='投稿前・投稿後のスクリーンショットも保存（デフォルトは失敗時のみ）'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=['browser', 'api'],
+        help='投稿方式（browser: ブラウザ操作、api: JSON APIを直接呼ぶ。デフォルト: NOTE_BACKEND または browser）'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -632,7 +854,12 @@ def main():
             title=args.title,
             content=args.content,
             headless=args.headless,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            reuse_session=not args.no_reuse_session,
+            hashtags=args.hashtags,
+            max_hashtags=args.max_hashtags,
+            screenshots=args.screenshots,
+            backend=args.backend
         )
 
         # 結果表示
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+統合投稿ファイルの読み込みモジュール
+
+main.py と各プラットフォームの一括処理（Qiita同期など）で共有する
+"""
+
+from pathlib import Path
+
+
+def read_text_file(file_path: str) -> str:
+    """
+    テキストファイルを読み込む（UTF-8）
+
+    Args:
+        file_path: 読み込むファイルのパス
+
+    Returns:
+        str: ファイルの内容
+
+    Raises:
+        FileNotFoundError: ファイルが見つからない場合
+        Exception: その他のエラー
+    """
+    try:
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
+
+        return path.read_text(encoding='utf-8').strip()
+    except Exception as e:
+        raise Exception(f"ファイル読み込みエラー ({file_path}): {e}")
+
+
+def parse_post_file(file_path: str) -> dict:
+    """
+    統合投稿ファイルをパースする
+
+    ファイル形式:
+    [X]
+    X投稿のテキスト
+
+    [Note Title]
+    Noteのタイトル
+
+    [Note Content]
+    Noteの本文
+    複数行もOK
+
+    [Qiita Title]
+    Qiitaのタイトル
+
+    [Qiita Content]
+    Qiitaの本文（マークダウン）
+    複数行もOK
+
+    [Qiita Tags]
+    Python, API, 自動化
+
+    [Qiita ID]
+    既存のQiita記事ID（同期で更新する場合のみ。省略可）
+
+    [Zenn Title]
+    Zennのタイトル
+
+    [Zenn Content]
+    Zennの本文（マークダウン）
+    複数行もOK
+
+    [Zenn Emoji]
+    📝
+
+    [Zenn Topics]
+    Python, API, 自動化
+
+    Args:
+        file_path: 投稿ファイルのパス
+
+    Returns:
+        dict: {'x_text': str, 'note_title': str, 'note_content': str,
+               'qiita_title': str, 'qiita_content': str, 'qiita_tags': List[str], 'qiita_id': str,
+               'zenn_title': str, 'zenn_content': str, 'zenn_emoji': str, 'zenn_topics': List[str]}
+              各値はNoneの可能性あり
+
+    Raises:
+        FileNotFoundError: ファイルが見つからない場合
+        Exception: その他のエラー
+    """
+    try:
+        content = read_text_file(file_path)
+        result = {
+            'x_text': None,
+            'note_title': None,
+            'note_content': None,
+            'qiita_title': None,
+            'qiita_content': None,
+            'qiita_tags': None,
+            'qiita_id': None,
+            'zenn_title': None,
+            'zenn_content': None,
+            'zenn_emoji': None,
+            'zenn_topics': None
+        }
+
+        # セクションで分割
+        current_section = None
+        section_content = []
+
+        for line in content.split('\n'):
+            # セクション見出しをチェック（[で始まり]で終わる行）
+            stripped_line = line.strip()
+
+            if stripped_line.startswith('[') and stripped_line.endswith(']'):
+                # 前のセクションを保存
+                if current_section:
+                    result[current_section] = '\n'.join(section_content).strip()
+
+                # 認識するセクション見出しのみ処理
+                if stripped_line == '[X]':
+                    current_section = 'x_text'
+                    section_content = []
+                elif stripped_line == '[Note Title]':
+                    current_section = 'note_title'
+                    section_content = []
+                elif stripped_line == '[Note Content]':
+                    current_section = 'note_content'
+                    section_content = []
+                elif stripped_line == '[Qiita Title]':
+                    current_section = 'qiita_title'
+                    section_content = []
+                elif stripped_line == '[Qiita Content]':
+                    current_section = 'qiita_content'
+                    section_content = []
+                elif stripped_line == '[Qiita Tags]':
+                    current_section = 'qiita_tags'
+                    section_content = []
+                elif stripped_line == '[Qiita ID]':
+                    current_section = 'qiita_id'
+                    section_content = []
+                elif stripped_line == '[Zenn Title]':
+                    current_section = 'zenn_title'
+                    section_content = []
+                elif stripped_line == '[Zenn Content]':
+                    current_section = 'zenn_content'
+                    section_content = []
+                elif stripped_line == '[Zenn Emoji]':
+                    current_section = 'zenn_emoji'
+                    section_content = []
+                elif stripped_line == '[Zenn Topics]':
+                    current_section = 'zenn_topics'
+                    section_content = []
+                else:
+                    # 認識しないセクション見出しが来たら終了
+                    current_section = None
+                    section_content = []
+            else:
+                # セクションの内容
+                if current_section:
+                    section_content.append(line)
+
+        # 最後のセクションを保存
+        if current_section:
+            result[current_section] = '\n'.join(section_content).strip()
+
+        # 空文字列をNoneに変換
+        for key in result:
+            if result[key] == '':
+                result[key] = None
+
+        # Qiitaタグをカンマ区切りの文字列からリストに変換
+        if result['qiita_tags']:
+            result['qiita_tags'] = [tag.strip() for tag in result['qiita_tags'].split(',') if tag.strip()]
+            # タグが空リストならNoneに変換
+            if not result['qiita_tags']:
+                result['qiita_tags'] = None
+
+        # Zennトピックをカンマ区切りの文字列からリストに変換
+        if result['zenn_topics']:
+            result['zenn_topics'] = [topic.strip() for topic in result['zenn_topics'].split(',') if topic.strip()]
+            # トピックが空リストならNoneに変換
+            if not result['zenn_topics']:
+                result['zenn_topics'] = None
+
+        return result
+
+    except Exception as e:
+        raise Exception(f"投稿ファイルパースエラー ({file_path}): {e}")
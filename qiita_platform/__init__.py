@@ -4,6 +4,14 @@
 Qiita投稿プラットフォームモジュール
 """
 
-from .post_qiita import post_to_qiita
+from .post_qiita import post_to_qiita, update_qiita_item
+from .session import get_session, close_session
+from .sync_qiita import sync_qiita_articles
+from .fetch_qiita import fetch_my_items
+from .tags import TagCatalog, load_tag_catalog, refresh_tag_catalog, normalize_tags
 
-__all__ = ['post_to_qiita']
+__all__ = [
+    'post_to_qiita', 'update_qiita_item', 'sync_qiita_articles', 'fetch_my_items',
+    'TagCatalog', 'load_tag_catalog', 'refresh_tag_catalog', 'normalize_tags',
+    'get_session', 'close_session'
+]
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiita記事取得モジュール
+認証ユーザーの記事一覧（いいね数・ストック数・閲覧数など）をQiita API v2から取得
+"""
+
+import os
+import sys
+import io
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from local_cache import get_cache_dir, load_json, save_json
+from qiita_platform.post_qiita import _format_api_error
+from qiita_platform.session import QIITA_API_BASE_URL, get_session, get_timeout
+
+# 環境変数読み込み
+load_dotenv()
+
+# 1ページあたりの最大件数（Qiita APIの上限）
+MAX_PER_PAGE = 100
+
+# 一覧に保存する項目
+ITEM_FIELDS = (
+    'id', 'title', 'url', 'likes_count', 'stocks_count', 'page_views_count',
+    'comments_count', 'private', 'created_at', 'updated_at'
+)
+
+
+class RateLimiter:
+    """
+    Qiita APIのレート制限ヘッダー（Rate-Remaining / Rate-Reset）を追跡
+
+    残り回数が予備数を下回ったら、リセット時刻までリクエストを待機させる
+    """
+
+    def __init__(self, reserve: int = 1):
+        self.reserve = reserve
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(self, headers) -> None:
+        """レスポンスヘッダーから残り回数とリセット時刻を更新"""
+        remaining = headers.get('Rate-Remaining')
+        reset_at = headers.get('Rate-Reset')
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset_at is not None:
+                self.reset_at = float(reset_at)
+
+    def acquire(self) -> None:
+        """リクエスト前に呼び出す。残り回数が足りなければリセットまで待機"""
+        with self._lock:
+            if self.remaining is None or self.remaining > self.reserve:
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return
+
+            wait_seconds = (self.reset_at or time.time()) - time.time()
+            if wait_seconds > 0:
+                print(f"⏳ レート制限に達しました。{int(wait_seconds) + 1}秒待機します...")
+                time.sleep(wait_seconds + 1)
+            self.remaining = None
+
+
+def _fetch_page(
+    page: int,
+    per_page: int,
+    headers: Dict,
+    cached_page: Optional[Dict],
+    rate_limiter: RateLimiter
+) -> Dict:
+    """
+    記事一覧の1ページを取得（ETagがあれば条件付きリクエスト）
+
+    Returns:
+        {'etag': str, 'items': List[Dict], 'total_count': int or None, 'not_modified': bool}
+    """
+    request_headers = dict(headers)
+    if cached_page and cached_page.get('etag'):
+        request_headers['If-None-Match'] = cached_page['etag']
+
+    rate_limiter.acquire()
+    response = get_session().get(
+        f'{QIITA_API_BASE_URL}/authenticated_user/items',
+        headers=request_headers,
+        params={'page': page, 'per_page': per_page},
+        timeout=get_timeout()
+    )
+    rate_limiter.update(response.headers)
+
+    total_count = response.headers.get('Total-Count')
+    total_count = int(total_count) if total_count is not None else None
+
+    if response.status_code == 304 and cached_page:
+        return {
+            'etag': cached_page['etag'],
+            'items': cached_page['items'],
+            'total_count': total_count,
+            'not_modified': True
+        }
+
+    if response.status_code != 200:
+        raise Exception(_format_api_error(response))
+
+    items = []
+    for item in response.json():
+        summary = {field: item.get(field) for field in ITEM_FIELDS}
+        summary['tags'] = [tag.get('name') for tag in item.get('tags', [])]
+        items.append(summary)
+
+    return {
+        'etag': response.headers.get('ETag'),
+        'items': items,
+        'total_count': total_count,
+        'not_modified': False
+    }
+
+
+def fetch_my_items(
+    per_page: int = MAX_PER_PAGE,
+    max_workers: int = 4,
+    use_cache: bool = True,
+    cache_path: Optional[Path] = None
+) -> Dict:
+    """
+    認証ユーザーの記事一覧を取得
+
+    1ページ目で Total-Count ヘッダーから総件数を取得し、残りのページを並列に取得する。
+    各ページのETagをキャッシュし、If-None-Match で変化のないページは304で済ませる。
+
+    Args:
+        per_page: 1ページあたりの件数（最大100）
+        max_workers: 同時に取得するページ数の上限
+        use_cache: Falseの場合、キャッシュを使わずに全ページを取得
+        cache_path: キャッシュファイルのパス（省略時は ~/.sns-auto-post/qiita/my_items.json）
+
+    Returns:
+        取得結果の辞書
+        {
+            'items': List[Dict],
+            'total_count': int,
+            'pages': int,
+            'not_modified_pages': int,
+            'fetched_at': str
+        }
+
+    Raises:
+        ValueError: APIトークンが設定されていない場合
+        Exception: 取得に失敗した場合
+    """
+    api_token = os.getenv('QIITA_ACCESS_TOKEN')
+
+    if not api_token:
+        raise ValueError('QIITA_ACCESS_TOKENを.envに設定してください')
+
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+
+    if cache_path is None:
+        cache_path = get_cache_dir('qiita') / 'my_items.json'
+
+    cache = load_json(cache_path, default={}) if use_cache else {}
+    # 1ページあたりの件数が変わった場合はページ単位のキャッシュが使えない
+    if cache.get('per_page') != per_page:
+        cache = {}
+    cached_pages = cache.get('pages', {})
+
+    headers = {'Authorization': f'Bearer {api_token}'}
+    rate_limiter = RateLimiter(reserve=max_workers)
+
+    try:
+        # 1ページ目で総件数を確認
+        print("📥 Qiita記事一覧を取得中...")
+        first_page = _fetch_page(1, per_page, headers, cached_pages.get('1'), rate_limiter)
+
+        total_count = first_page['total_count']
+        if total_count is None:
+            total_count = cache.get('total_count', len(first_page['items']))
+        page_count = max(1, -(-total_count // per_page))
+
+        pages = {1: first_page}
+
+        # 2ページ目以降を並列取得
+        if page_count > 1:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = {
+                    page: executor.submit(
+                        _fetch_page, page, per_page, headers, cached_pages.get(str(page)), rate_limiter
+                    )
+                    for page in range(2, page_count + 1)
+                }
+                for page, future in futures.items():
+                    pages[page] = future.result()
+
+    except Exception as e:
+        raise Exception(f"Qiita記事一覧の取得エラー: {e}")
+
+    items = []
+    for page in sorted(pages):
+        items.extend(pages[page]['items'])
+
+    not_modified_pages = sum(1 for page in pages.values() if page['not_modified'])
+    fetched_at = datetime.now().isoformat(timespec='seconds')
+
+    save_json(cache_path, {
+        'per_page': per_page,
+        'total_count': total_count,
+        'fetched_at': fetched_at,
+        'pages': {
+            str(page): {'etag': data['etag'], 'items': data['items']}
+            for page, data in pages.items()
+        }
+    })
+
+    print(f"✅ {len(items)}件の記事を取得しました（{page_count}ページ中{not_modified_pages}ページは変更なし）")
+
+    return {
+        'items': items,
+        'total_count': total_count,
+        'pages': page_count,
+        'not_modified_pages': not_modified_pages,
+        'fetched_at': fetched_at
+    }
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Qiitaの自分の記事一覧（いいね・ストック・閲覧数）を取得')
+    parser.add_argument('--workers', type=int, default=4, help='同時に取得するページ数（デフォルト: 4）')
+    parser.add_argument('--no-cache', action='store_true', help='キャッシュを使わずに全ページを取得')
+    parser.add_argument('--output', type=str, help='記事一覧をJSONで保存するファイルパス')
+
+    args = parser.parse_args()
+
+    try:
+        result = fetch_my_items(max_workers=args.workers, use_cache=not args.no_cache)
+    except Exception as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+
+    if args.output:
+        save_json(Path(args.output), result['items'])
+        print(f"💾 記事一覧を保存しました: {args.output}")
+
+    print()
+    print(f"{'いいね':>6} {'ストック':>8} {'閲覧数':>8}  タイトル")
+    for item in result['items']:
+        page_views = item.get('page_views_count')
+        page_views = '-' if page_views is None else page_views
+        print(f"{item['likes_count']:>6} {item['stocks_count']:>8} {page_views:>8}  {item['title']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,17 +21,43 @@ if sys.platform == 'win32':
 # プロジェクトルートのパスを追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from qiita_platform.session import QIITA_API_BASE_URL, get_session, get_timeout
+
 # 環境変数読み込み
 load_dotenv()
 
 
+def _format_api_error(response: requests.Response) -> str:
+    """
+    APIエラーレスポンスからエラーメッセージを生成
+
+    Args:
+        response: エラーとなったレスポンス
+
+    Returns:
+        str: エラーメッセージ
+    """
+    error_msg = f"API Error (Status {response.status_code})"
+    try:
+        error_detail = response.json()
+        if 'message' in error_detail:
+            error_msg += f": {error_detail['message']}"
+        elif 'error' in error_detail:
+            error_msg += f": {error_detail['error']}"
+    except:
+        error_msg += f": {response.text}"
+
+    return error_msg
+
+
 def post_to_qiita(
     title: str,
     content: str,
     tags: Optional[List[str]] = None,
     private: bool = False,
     tweet: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    check_tags: bool = True
 ) -> Dict:
     """
     Qiitaに記事を投稿
@@ -43,6 +69,7 @@ def post_to_qiita(
         private: Trueの場合、限定共有記事として投稿（デフォルト: False）
         tweet: Trueの場合、Twitter連携で投稿（デフォルト: False）
         dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+        check_tags: Trueの場合、ローカルのタグカタログでタグの表記を補正（キャッシュがある場合のみ）
 
     Returns:
         投稿情報の辞書
@@ -62,6 +89,11 @@ def post_to_qiita(
     if tags is None:
         tags = []
 
+    # タグの表記ゆれをローカルのカタログで補正（ネットワークアクセスなし）
+    if tags and check_tags:
+        from qiita_platform.tags import normalize_tags
+        tags = normalize_tags(tags)
+
     # Dry runモード
     if dry_run:
         print("🔍 [DRY RUN] 実際には投稿しません")
@@ -86,7 +118,7 @@ def post_to_qiita(
         raise ValueError('QIITA_ACCESS_TOKENを.envに設定してください')
 
     # Qiita API v2エンドポイント
-    url = 'https://qiita.com/api/v2/items'
+    url = f'{QIITA_API_BASE_URL}/items'
 
     # リクエストヘッダー
     headers = {
@@ -114,7 +146,8 @@ def post_to_qiita(
         print(f"  タグ: {', '.join(tags) if tags else 'なし'}")
         print(f"  限定共有: {'はい' if private else 'いいえ'}")
 
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        # 共有Session（Keep-Alive）で送信。POSTはリトライ対象外（重複投稿防止）
+        response = get_session().post(url, headers=headers, json=payload, timeout=get_timeout())
 
         # ステータスコード確認
         if response.status_code == 201:
@@ -131,17 +164,7 @@ def post_to_qiita(
             }
         else:
             # エラー処理
-            error_msg = f"API Error (Status {response.status_code})"
-            try:
-                error_detail = response.json()
-                if 'message' in error_detail:
-                    error_msg += f": {error_detail['message']}"
-                elif 'error' in error_detail:
-                    error_msg += f": {error_detail['error']}"
-            except:
-                error_msg += f": {response.text}"
-
-            raise Exception(error_msg)
+            raise Exception(_format_api_error(response))
 
     except requests.exceptions.Timeout:
         raise Exception("APIリクエストがタイムアウトしました")
@@ -153,6 +176,105 @@ def post_to_qiita(
         raise Exception(f"Qiita投稿エラー: {e}")
 
 
+def update_qiita_item(
+    item_id: str,
+    title: str,
+    content: str,
+    tags: Optional[List[str]] = None,
+    private: bool = False,
+    dry_run: bool = False,
+    check_tags: bool = True
+) -> Dict:
+    """
+    既存のQiita記事を更新（PATCH /api/v2/items/:item_id）
+
+    Args:
+        item_id: 更新する記事のID
+        title: 記事のタイトル
+        content: 記事の本文（マークダウン形式）
+        tags: タグのリスト（例: ["Python", "API"]）。デフォルトは空リスト
+        private: 限定共有記事かどうか（公開記事を限定共有に戻すことはできない）
+        dry_run: Trueの場合、実際には更新せずにシミュレーションのみ
+        check_tags: Trueの場合、ローカルのタグカタログでタグの表記を補正（キャッシュがある場合のみ）
+
+    Returns:
+        更新情報の辞書
+        {
+            'success': bool,
+            'url': str (成功時のみ),
+            'id': str,
+            'title': str,
+            'dry_run': bool
+        }
+
+    Raises:
+        ValueError: APIトークンが設定されていない場合
+        Exception: 更新に失敗した場合
+    """
+    if tags is None:
+        tags = []
+
+    # 新規投稿と同じく、タグの表記ゆれをローカルのカタログで補正（ネットワークアクセスなし）
+    if tags and check_tags:
+        from qiita_platform.tags import normalize_tags
+        tags = normalize_tags(tags)
+
+    if dry_run:
+        print(f"🔍 [DRY RUN] 記事を更新します: {item_id} ({title})")
+        return {
+            'success': True,
+            'id': item_id,
+            'title': title,
+            'dry_run': True
+        }
+
+    api_token = os.getenv('QIITA_ACCESS_TOKEN')
+
+    if not api_token:
+        raise ValueError('QIITA_ACCESS_TOKENを.envに設定してください')
+
+    url = f'{QIITA_API_BASE_URL}/items/{item_id}'
+
+    headers = {
+        'Authorization': f'Bearer {api_token}',
+        'Content-Type': 'application/json'
+    }
+
+    payload = {
+        'title': title,
+        'body': content,
+        'tags': [{"name": tag, "versions": []} for tag in tags],
+        'private': private
+    }
+
+    try:
+        print(f"📤 Qiita記事を更新中: {item_id} ({title})")
+
+        # PATCHは冪等なので共有Sessionのリトライ対象
+        response = get_session().patch(url, headers=headers, json=payload, timeout=get_timeout())
+
+        if response.status_code == 200:
+            result = response.json()
+            return {
+                'success': True,
+                'url': result.get('url', ''),
+                'id': item_id,
+                'title': title,
+                'dry_run': False
+            }
+        else:
+            raise Exception(_format_api_error(response))
+
+    except requests.exceptions.Timeout:
+        raise Exception("APIリクエストがタイムアウトしました")
+    except requests.exceptions.ConnectionError:
+        raise Exception("ネットワーク接続エラーが発生しました")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"APIリクエストエラー: {e}")
+    except Exception as e:
+        raise Exception(f"Qiita更新エラー: {e}")
+
+
 def main():
     """テスト用のメイン関数"""
     import argparse
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiita API用の共有HTTPセッション
+コネクションプーリング（Keep-Alive）とリトライ設定を持つrequests.Sessionを提供
+"""
+
+import os
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Qiita API v2のベースURL
+QIITA_API_BASE_URL = 'https://qiita.com/api/v2'
+
+# リトライ対象のステータスコード（レート制限・一時的なサーバーエラー）
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# リトライしてよいメソッド
+# POSTは重複投稿の恐れがあるため対象外。PATCHは記事全体を送るので再送しても結果は同じ
+RETRY_METHODS = frozenset(['HEAD', 'GET', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'])
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_timeout() -> Tuple[float, float]:
+    """
+    接続タイムアウトと読み込みタイムアウトを取得
+
+    環境変数 QIITA_CONNECT_TIMEOUT / QIITA_READ_TIMEOUT（秒）で変更可能
+
+    Returns:
+        (接続タイムアウト, 読み込みタイムアウト) のタプル
+    """
+    connect_timeout = float(os.getenv('QIITA_CONNECT_TIMEOUT', '5'))
+    read_timeout = float(os.getenv('QIITA_READ_TIMEOUT', '30'))
+    return (connect_timeout, read_timeout)
+
+
+def create_session(
+    api_token: Optional[str] = None,
+    max_retries: int = 3,
+    pool_maxsize: int = 10
+) -> requests.Session:
+    """
+    Qiita API用のSessionを作成
+
+    Args:
+        api_token: アクセストークン（省略時はQIITA_ACCESS_TOKENを使用）
+        max_retries: 冪等なリクエストの最大リトライ回数
+        pool_maxsize: コネクションプールの最大接続数（並列リクエスト数の上限に合わせる）
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=1,
+        pool_maxsize=pool_maxsize
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if api_token is None:
+        api_token = os.getenv('QIITA_ACCESS_TOKEN')
+
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    })
+    if api_token:
+        session.headers['Authorization'] = f'Bearer {api_token}'
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    プロセス内で共有するQiita API用Sessionを取得
+
+    初回呼び出し時に作成し、以降は同じSession（同じコネクションプール）を返す。
+    複数記事の投稿・同期でTCP/TLSハンドシェイクを使い回すために使用する。
+
+    Returns:
+        requests.Session
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def close_session() -> None:
+    """共有Sessionを閉じる（トークンを切り替える場合など）"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
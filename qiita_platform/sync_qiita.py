@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiita記事同期モジュール
+ローカルの投稿ファイルとQiita記事を対応付け、変更があった記事だけをPATCHで更新
+"""
+
+import sys
+import io
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from post_file import parse_post_file
+from local_cache import load_json, save_json
+from qiita_platform.post_qiita import post_to_qiita, update_qiita_item
+
+# 環境変数読み込み
+load_dotenv()
+
+# 同期状態ファイル名（記事ディレクトリ直下に保存）
+SYNC_STATE_FILENAME = '.qiita_sync.json'
+
+
+def compute_article_hash(title: str, content: str, tags: Optional[List[str]], private: bool) -> str:
+    """
+    記事内容のハッシュを計算（Qiitaに送信する内容のみを対象）
+
+    Args:
+        title: 記事のタイトル
+        content: 記事の本文
+        tags: タグのリスト
+        private: 限定共有記事かどうか
+
+    Returns:
+        str: SHA-256ハッシュ（16進数）
+    """
+    hasher = hashlib.sha256()
+    for part in (title, content, ','.join(tags or []), str(private)):
+        hasher.update(part.encode('utf-8'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+def load_articles(directory: Path, pattern: str = '*.txt') -> List[Dict]:
+    """
+    ディレクトリ内の投稿ファイルからQiita記事を読み込む
+
+    [Qiita Title] と [Qiita Content] の両方があるファイルのみ対象
+
+    Args:
+        directory: 投稿ファイルのディレクトリ
+        pattern: 対象ファイルのglobパターン
+
+    Returns:
+        List[Dict]: {'key': 相対パス, 'title', 'content', 'tags', 'qiita_id'} のリスト
+    """
+    articles = []
+    for path in sorted(Path(directory).glob(pattern)):
+        if not path.is_file():
+            continue
+
+        parsed = parse_post_file(str(path))
+        if not (parsed['qiita_title'] and parsed['qiita_content']):
+            continue
+
+        articles.append({
+            'key': path.relative_to(directory).as_posix(),
+            'title': parsed['qiita_title'],
+            'content': parsed['qiita_content'],
+            'tags': parsed['qiita_tags'] or [],
+            'qiita_id': parsed['qiita_id']
+        })
+
+    return articles
+
+
+def sync_qiita_articles(
+    directory: str,
+    pattern: str = '*.txt',
+    create_missing: bool = False,
+    private: bool = False,
+    max_workers: int = 4,
+    mark_synced: bool = False,
+    dry_run: bool = False
+) -> Dict:
+    """
+    ディレクトリ内の記事をQiitaと同期
+
+    前回同期時のハッシュと比較し、内容が変わった記事だけをPATCHで更新する。
+    記事ファイルとQiita記事IDの対応は、ディレクトリ直下の .qiita_sync.json
+    または投稿ファイルの [Qiita ID] セクションで管理する。
+
+    Args:
+        directory: 投稿ファイルのディレクトリ
+        pattern: 対象ファイルのglobパターン
+        create_missing: TrueのときID未登録の記事を新規投稿する
+        private: 限定共有記事として送信
+        max_workers: 同時に送信するリクエスト数の上限
+        mark_synced: Trueの場合、送信せずに現在の内容を同期済みとして記録
+                     （既存記事を初めて同期対象にする場合に使用）
+        dry_run: Trueの場合、実際には送信しない
+
+    Returns:
+        同期結果の辞書
+        {
+            'updated': List[str],
+            'created': List[str],
+            'unchanged': List[str],
+            'skipped': List[str],
+            'failed': List[Dict],
+            'dry_run': bool
+        }
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise ValueError(f'指定されたディレクトリが存在しません: {directory}')
+
+    state_path = directory / SYNC_STATE_FILENAME
+    state = load_json(state_path, default={'items': {}})
+    synced_items = state.setdefault('items', {})
+
+    summary = {
+        'updated': [],
+        'created': [],
+        'unchanged': [],
+        'skipped': [],
+        'failed': [],
+        'dry_run': dry_run
+    }
+
+    # 送信が必要な記事を抽出（リクエストはこの時点では発生しない）
+    tasks = []
+    for article in load_articles(directory, pattern):
+        key = article['key']
+        entry = synced_items.get(key, {})
+        item_id = article['qiita_id'] or entry.get('id')
+        article_hash = compute_article_hash(article['title'], article['content'], article['tags'], private)
+
+        if item_id and entry.get('hash') == article_hash and entry.get('id') == item_id:
+            summary['unchanged'].append(key)
+            continue
+
+        if not item_id and not create_missing:
+            summary['skipped'].append(key)
+            continue
+
+        if mark_synced:
+            if item_id:
+                synced_items[key] = {
+                    'id': item_id,
+                    'hash': article_hash,
+                    'url': entry.get('url'),
+                    'synced_at': datetime.now().isoformat(timespec='seconds')
+                }
+                summary['unchanged'].append(key)
+            else:
+                summary['skipped'].append(key)
+            continue
+
+        tasks.append((article, item_id, article_hash))
+
+    print(f"🔄 Qiita同期: 送信{len(tasks)}件 / 変更なし{len(summary['unchanged'])}件 / "
+          f"スキップ{len(summary['skipped'])}件")
+
+    def sync_one(article: Dict, item_id: Optional[str], article_hash: str) -> Dict:
+        if item_id:
+            return update_qiita_item(
+                item_id=item_id,
+                title=article['title'],
+                content=article['content'],
+                tags=article['tags'],
+                private=private,
+                dry_run=dry_run
+            )
+        return post_to_qiita(
+            title=article['title'],
+            content=article['content'],
+            tags=article['tags'],
+            private=private,
+            dry_run=dry_run
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(sync_one, article, item_id, article_hash): (article, item_id, article_hash)
+            for article, item_id, article_hash in tasks
+        }
+
+        for future in as_completed(futures):
+            article, item_id, article_hash = futures[future]
+            key = article['key']
+
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ 同期失敗: {key}: {e}")
+                summary['failed'].append({'key': key, 'error': str(e)})
+                continue
+
+            summary['updated' if item_id else 'created'].append(key)
+
+            if dry_run:
+                continue
+
+            # 結果の記録はメインスレッドのみで行う
+            synced_items[key] = {
+                'id': result.get('id') or item_id,
+                'hash': article_hash,
+                'url': result.get('url'),
+                'synced_at': datetime.now().isoformat(timespec='seconds')
+            }
+
+    if not dry_run:
+        save_json(state_path, state)
+
+    return summary
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='ローカルの投稿ファイルをQiitaと同期（変更があった記事のみ更新）')
+    parser.add_argument('directory', type=str, help='投稿ファイルのディレクトリ')
+    parser.add_argument('--pattern', type=str, default='*.txt', help='対象ファイルのglobパターン（デフォルト: *.txt）')
+    parser.add_argument('--create-missing', action='store_true', help='記事IDが未登録のファイルを新規投稿する')
+    parser.add_argument('--private', action='store_true', help='限定共有記事として送信')
+    parser.add_argument('--workers', type=int, default=4, help='同時リクエスト数（デフォルト: 4）')
+    parser.add_argument('--mark-synced', action='store_true', help='送信せずに現在の内容を同期済みとして記録')
+    parser.add_argument('--dry-run', action='store_true', help='実際には送信しない')
+
+    args = parser.parse_args()
+
+    try:
+        summary = sync_qiita_articles(
+            directory=args.directory,
+            pattern=args.pattern,
+            create_missing=args.create_missing,
+            private=args.private,
+            max_workers=args.workers,
+            mark_synced=args.mark_synced,
+            dry_run=args.dry_run
+        )
+    except Exception as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+
+    print(f"✅ 更新: {len(summary['updated'])}件 / 新規: {len(summary['created'])}件 / "
+          f"変更なし: {len(summary['unchanged'])}件 / スキップ: {len(summary['skipped'])}件")
+
+    if summary['failed']:
+        print(f"❌ 失敗: {len(summary['failed'])}件")
+        for failure in summary['failed']:
+            print(f"  {failure['key']}: {failure['error']}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiitaタグカタログモジュール
+/api/v2/tags から取得したタグ一覧をローカルにキャッシュし、
+投稿前のタグ検証・表記ゆれの補正をオフラインで行う
+"""
+
+import os
+import sys
+import io
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from local_cache import get_cache_dir, load_json, save_json
+from qiita_platform.post_qiita import _format_api_error
+from qiita_platform.session import QIITA_API_BASE_URL, get_session, get_timeout
+from qiita_platform.fetch_qiita import MAX_PER_PAGE, RateLimiter
+
+# 環境変数読み込み
+load_dotenv()
+
+# 全件取得するページ数の上限（items_count順で上位10,000タグ）
+FULL_REFRESH_PAGES = 100
+
+# 差分更新で取得するページ数（人気タグは件数順位が変動しやすいため先頭のみ再取得）
+INCREMENTAL_REFRESH_PAGES = 5
+
+# 全件取得をやり直す間隔
+FULL_REFRESH_INTERVAL = timedelta(days=30)
+
+# 読み込んだカタログ（キャッシュファイルのパス → (更新日時, サイズ, TagCatalog)）
+_loaded_catalogs: Dict[str, Tuple[int, int, 'TagCatalog']] = {}
+
+
+def get_catalog_path() -> Path:
+    """タグカタログのキャッシュファイルパスを取得"""
+    return get_cache_dir('qiita') / 'tags.json'
+
+
+class TagCatalog:
+    """
+    Qiitaタグの索引
+
+    タグ名を小文字化したキーでソートした配列として保持し、
+    二分探索で大文字小文字を区別しない完全一致・前方一致検索を行う
+    """
+
+    def __init__(self, tags: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            tags: {タグ名: 記事数} の辞書
+        """
+        tags = tags or {}
+        entries = sorted(tags.items(), key=lambda entry: (entry[0].casefold(), -entry[1]))
+
+        self.keys: List[str] = []
+        self.names: List[str] = []
+        self.counts: List[int] = []
+        for name, count in entries:
+            key = name.casefold()
+            # 大文字小文字違いの重複は記事数の多い表記を採用
+            if self.keys and self.keys[-1] == key:
+                continue
+            self.keys.append(key)
+            self.names.append(name)
+            self.counts.append(count)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def to_dict(self) -> Dict[str, int]:
+        """{タグ名: 記事数} の辞書に変換"""
+        return dict(zip(self.names, self.counts))
+
+    def lookup(self, tag: str) -> Optional[str]:
+        """
+        タグの正式な表記を取得（大文字小文字を区別しない）
+
+        Args:
+            tag: タグ名
+
+        Returns:
+            正式なタグ名（見つからない場合はNone）
+        """
+        key = tag.strip().casefold()
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.names[index]
+        return None
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        前方一致でタグを検索（記事数の多い順）
+
+        Args:
+            prefix: タグ名の先頭部分
+            limit: 返す件数の上限
+
+        Returns:
+            List[str]: 一致したタグ名のリスト
+        """
+        key = prefix.strip().casefold()
+        if not key:
+            return []
+
+        start = bisect.bisect_left(self.keys, key)
+        # 前方一致する範囲の終端（key + 最大文字の手前まで）
+        end = bisect.bisect_left(self.keys, key + '\U0010ffff', lo=start)
+
+        matches = sorted(range(start, end), key=lambda i: -self.counts[i])[:limit]
+        return [self.names[i] for i in matches]
+
+    def normalize_tags(self, tags: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        タグの表記をカタログの正式な表記に補正
+
+        大文字小文字違いは正式な表記に置き換え、重複は除去する。
+        カタログにないタグはそのまま残す。
+
+        Args:
+            tags: タグ名のリスト
+
+        Returns:
+            (補正後のタグリスト, カタログにないタグのリスト)
+        """
+        normalized = []
+        unknown = []
+        seen = set()
+
+        for tag in tags:
+            canonical = self.lookup(tag)
+            if canonical is None:
+                canonical = tag.strip()
+                unknown.append(canonical)
+
+            if canonical.casefold() in seen:
+                continue
+            seen.add(canonical.casefold())
+            normalized.append(canonical)
+
+        return normalized, unknown
+
+
+def load_tag_catalog(path: Optional[Path] = None) -> TagCatalog:
+    """
+    キャッシュからタグカタログを読み込む（ネットワークにはアクセスしない）
+
+    一度読み込んだカタログはキャッシュファイルの更新日時・サイズが変わるまで使い回す
+    （投稿のたびにファイルの読み込み・並べ替えを行わない）
+
+    Args:
+        path: キャッシュファイルのパス（省略時は ~/.sns-auto-post/qiita/tags.json）
+
+    Returns:
+        TagCatalog（キャッシュがない場合は空）
+    """
+    path = Path(path or get_catalog_path())
+    try:
+        stat = path.stat()
+    except OSError:
+        return TagCatalog()
+
+    key = str(path.resolve())
+    cached = _loaded_catalogs.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    data = load_json(path, default={})
+    catalog = TagCatalog(dict(zip(data.get('names', []), data.get('counts', []))))
+    _loaded_catalogs[key] = (stat.st_mtime_ns, stat.st_size, catalog)
+    return catalog
+
+
+def _fetch_tag_page(page: int, headers: Dict, rate_limiter: RateLimiter) -> List[Dict]:
+    """タグ一覧の1ページを取得"""
+    rate_limiter.acquire()
+    response = get_session().get(
+        f'{QIITA_API_BASE_URL}/tags',
+        headers=headers,
+        params={'page': page, 'per_page': MAX_PER_PAGE, 'sort': 'count'},
+        timeout=get_timeout()
+    )
+    rate_limiter.update(response.headers)
+
+    if response.status_code != 200:
+        raise Exception(_format_api_error(response))
+
+    return response.json()
+
+
+def refresh_tag_catalog(full: bool = False, max_workers: int = 4, path: Optional[Path] = None) -> TagCatalog:
+    """
+    Qiita APIからタグ一覧を取得してカタログを更新
+
+    通常は記事数上位のページだけを取得して既存のカタログにマージする（差分更新）。
+    キャッシュがない場合、full=True の場合、前回の全件取得から30日以上経過した場合は
+    上位10,000タグを取り直す。
+
+    Args:
+        full: Trueの場合、全件取得
+        max_workers: 同時に取得するページ数の上限
+        path: キャッシュファイルのパス
+
+    Returns:
+        更新後のTagCatalog
+
+    Raises:
+        Exception: 取得に失敗した場合
+    """
+    path = path or get_catalog_path()
+    data = load_json(path, default={})
+    tags = dict(zip(data.get('names', []), data.get('counts', [])))
+
+    full_refreshed_at = data.get('full_refreshed_at')
+    if not tags or not full_refreshed_at:
+        full = True
+    elif datetime.now() - datetime.fromisoformat(full_refreshed_at) > FULL_REFRESH_INTERVAL:
+        full = True
+
+    headers = {}
+    api_token = os.getenv('QIITA_ACCESS_TOKEN')
+    if api_token:
+        # 認証するとレート制限が緩和される（未認証でも取得は可能）
+        headers['Authorization'] = f'Bearer {api_token}'
+
+    page_count = FULL_REFRESH_PAGES if full else INCREMENTAL_REFRESH_PAGES
+    rate_limiter = RateLimiter(reserve=max_workers)
+
+    print(f"📥 Qiitaタグ一覧を取得中（{'全件' if full else '差分'}: 最大{page_count}ページ）...")
+
+    try:
+        # 1ページ目で最初のリクエストのレート制限ヘッダーを確認してから並列化
+        fetched = _fetch_tag_page(1, headers, rate_limiter)
+        if len(fetched) == MAX_PER_PAGE and page_count > 1:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                for page_tags in executor.map(
+                    lambda page: _fetch_tag_page(page, headers, rate_limiter),
+                    range(2, page_count + 1)
+                ):
+                    fetched.extend(page_tags)
+    except Exception as e:
+        raise Exception(f"Qiitaタグ一覧の取得エラー: {e}")
+
+    if full:
+        tags = {}
+    for tag in fetched:
+        tags[tag['id']] = tag.get('items_count', 0)
+
+    catalog = TagCatalog(tags)
+    now = datetime.now().isoformat(timespec='seconds')
+    save_json(path, {
+        'fetched_at': now,
+        'full_refreshed_at': now if full else full_refreshed_at,
+        'names': catalog.names,
+        'counts': catalog.counts
+    })
+
+    print(f"✅ タグカタログを更新しました（{len(catalog)}件）")
+    return catalog
+
+
+def normalize_tags(tags: List[str], catalog: Optional[TagCatalog] = None) -> List[str]:
+    """
+    ローカルのタグカタログでタグを検証・補正（投稿前に使用）
+
+    カタログのキャッシュがない場合は何もしない。
+
+    Args:
+        tags: タグ名のリスト
+        catalog: 使用するカタログ（省略時はキャッシュから読み込み）
+
+    Returns:
+        List[str]: 補正後のタグリスト
+    """
+    if catalog is None:
+        catalog = load_tag_catalog()
+    if not catalog or not tags:
+        return tags
+
+    normalized, unknown = catalog.normalize_tags(tags)
+
+    for tag in tags:
+        canonical = catalog.lookup(tag)
+        if canonical and canonical != tag:
+            print(f"🏷️  タグの表記を補正: {tag} → {canonical}")
+
+    for tag in unknown:
+        suggestions = catalog.prefix_search(tag, limit=3)
+        if suggestions:
+            print(f"⚠️  未登録のタグです: {tag}（候補: {', '.join(suggestions)}）")
+        else:
+            print(f"⚠️  未登録のタグです: {tag}（新しいタグとして作成されます）")
+
+    return normalized
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Qiitaタグカタログの更新・検索')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    refresh_parser = subparsers.add_parser('refresh', help='タグカタログを更新')
+    refresh_parser.add_argument('--full', action='store_true', help='上位10,000タグを全件取得')
+    refresh_parser.add_argument('--workers', type=int, default=4, help='同時に取得するページ数（デフォルト: 4）')
+
+    search_parser = subparsers.add_parser('search', help='前方一致でタグを検索')
+    search_parser.add_argument('prefix', type=str, help='タグ名の先頭部分')
+    search_parser.add_argument('--limit', type=int, default=10, help='表示件数（デフォルト: 10）')
+
+    check_parser = subparsers.add_parser('check', help='タグを検証・補正')
+    check_parser.add_argument('tags', type=str, nargs='+', help='タグのリスト（スペース区切り）')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'refresh':
+            refresh_tag_catalog(full=args.full, max_workers=args.workers)
+            return
+
+        catalog = load_tag_catalog()
+        if not catalog:
+            print("⚠️  タグカタログがありません。先に refresh を実行してください")
+            sys.exit(1)
+
+        if args.command == 'search':
+            for name in catalog.prefix_search(args.prefix, limit=args.limit):
+                print(name)
+        else:
+            print(' '.join(normalize_tags(args.tags, catalog)))
+
+    except Exception as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+デバッグ用スクリーンショット（アーティファクト）のテストスクリプト
+"""
+
+import base64
+import os
+import time
+
+from browser_common.artifacts import RUN_DIR_PATTERN, ArtifactRecorder, prune_artifacts
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {'data': base64.b64encode(b'jpeg-bytes').decode()}
+
+
+def test_capture_only_on_failure(tmp_path, monkeypatch):
+    """途中経過は撮影せず、capture() だけが実行ごとのディレクトリにJPEGを書き込む"""
+    monkeypatch.setenv('BROWSER_ARTIFACTS_DIR', str(tmp_path))
+    monkeypatch.delenv('BROWSER_ARTIFACTS', raising=False)
+    driver = FakeDriver()
+
+    recorder = ArtifactRecorder('note')
+    assert recorder.checkpoint(driver, 'preview') is None
+    assert recorder.run_dir is None
+
+    path = recorder.capture(driver, 'error')
+    recorder.close()
+
+    assert path.parent.parent == tmp_path
+    assert path.name == 'error.jpg'
+    assert path.read_bytes() == b'jpeg-bytes'
+    assert driver.commands == [('Page.captureScreenshot', {'format': 'jpeg', 'quality': 60})]
+
+
+def test_prune_artifacts(tmp_path):
+    """期限切れのディレクトリと、合計サイズの上限を超えた古いディレクトリを削除"""
+    now = time.time()
+    for name, age_days in [('note-20261001-120000-100', 10), ('note-prepare-20261002-120000-100-3', 9),
+                           ('zenn-20261017-120000-200-1', 2), ('note-20261018-120000-300-1', 1),
+                           ('photos', 30)]:
+        run_dir = tmp_path / name
+        run_dir.mkdir()
+        (run_dir / 'error.jpg').write_bytes(b'x' * 600 * 1024)
+        os.utime(run_dir, (now - age_days * 86400,) * 2)
+
+    removed = prune_artifacts(tmp_path, max_age_days=7, max_total_mb=1)
+
+    # 記録用に作成したディレクトリ以外（既存のフォルダを指定した場合など）は削除しない
+    assert removed == 3
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['note-20261018-120000-300-1', 'photos']
+
+
+def test_run_dirs_are_unique(tmp_path, monkeypatch):
+    """同じプロセス・同じ秒に作成した記録も別のディレクトリに保存し、削除の対象になる名前にする"""
+    monkeypatch.setenv('BROWSER_ARTIFACTS_DIR', str(tmp_path))
+    driver = FakeDriver()
+
+    recorders = [ArtifactRecorder('note-prepare') for _ in range(2)]
+    paths = [recorder.capture(driver, 'error') for recorder in recorders]
+    for recorder in recorders:
+        recorder.close()
+
+    assert paths[0].parent != paths[1].parent
+    assert all(RUN_DIR_PATTERN.match(path.parent.name) for path in paths)
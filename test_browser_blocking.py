@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+不要なリソースのブロック（browser_common/blocking.py）のテストスクリプト
+"""
+
+from browser_common.blocking import TRACKER_PATTERNS, get_blocked_url_patterns, get_blocked_url_patterns_of
+from browser_common.options import build_chrome_options
+
+
+def test_blocking_is_opt_in(monkeypatch):
+    """BROWSER_BLOCK_RESOURCES を設定しない場合はブロックせず、ページ読み込みも通常のまま"""
+    monkeypatch.delenv('BROWSER_BLOCK_RESOURCES', raising=False)
+    monkeypatch.delenv('BROWSER_BLOCK_ALLOW', raising=False)
+
+    options = build_chrome_options()
+
+    assert get_blocked_url_patterns_of(options) == ()
+    assert options.page_load_strategy == 'normal'
+
+
+def test_blocking_with_allow_list(monkeypatch):
+    """有効にした場合は許可した文字列を含むパターンだけブロックから外す"""
+    monkeypatch.setenv('BROWSER_BLOCK_RESOURCES', 'true')
+    monkeypatch.setenv('BROWSER_BLOCK_ALLOW', 'woff2')
+
+    options = build_chrome_options()
+    patterns = get_blocked_url_patterns_of(options)
+
+    assert options.page_load_strategy == 'eager'
+    assert '*.png*' in patterns and '*googletagmanager.com*' in patterns
+    assert '*.woff2*' not in patterns
+
+
+def test_allowed_hosts(monkeypatch):
+    """ホストを許可した場合は、そのホストのURLに一致しうるパターンをブロックから外す"""
+    monkeypatch.delenv('BROWSER_BLOCK_ALLOW', raising=False)
+
+    # 拡張子だけのパターンはエディタのホストの画像・フォントにも一致するため外れる
+    assert get_blocked_url_patterns(site='note') == TRACKER_PATTERNS
+    assert get_blocked_url_patterns(site='zenn') == TRACKER_PATTERNS
+
+    patterns = get_blocked_url_patterns(['facebook.net'])
+    assert '*connect.facebook.net*' not in patterns and '*hotjar.com*' in patterns
+    assert '*.png*' not in patterns
+
+
+def test_site_options_allow_editor_hosts(monkeypatch):
+    """Note/Zenn投稿用のオプションはエディタのホストを既定で許可する"""
+    from note_platform.post_note import build_note_chrome_options
+    from zenn_platform.post_zenn import build_zenn_chrome_options
+
+    monkeypatch.setenv('BROWSER_BLOCK_RESOURCES', 'true')
+    monkeypatch.delenv('BROWSER_BLOCK_ALLOW', raising=False)
+
+    for options in (build_note_chrome_options(reuse_session=False), build_zenn_chrome_options(reuse_session=False)):
+        patterns = get_blocked_url_patterns_of(options)
+        assert '*googletagmanager.com*' in patterns
+        assert '*.woff2*' not in patterns and '*.png*' not in patterns
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+クリップボードを使わない一括テキスト入力（browser_common/text_input.py）のテストスクリプト
+"""
+
+from browser_common import text_input
+from browser_common.text_input import insert_text
+
+
+class FakeEditor:
+    """
+    contenteditableのエディタを模したドライバー
+
+    貼り付けは処理する（preventDefaultする）が、内容は paste_delay 回スクリプトを実行するまで反映しない。
+    Input.insertText は選択範囲を置き換える（全選択されていなければ末尾に追記する）
+    """
+
+    def __init__(self, paste_delay: int):
+        self.paste_delay = paste_delay
+        self.content = ''
+        self.selected = False
+        self.pasted = None
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        if self.pasted is not None:
+            self.paste_delay -= 1
+            if self.paste_delay <= 0:
+                self.content += self.pasted
+                self.pasted = None
+        if script == text_input._FOCUS_AND_SELECT_ALL_JS:
+            self.calls.append('select')
+            self.selected = True
+            return False
+        if script == text_input._DISPATCH_PASTE_JS:
+            self.calls.append('paste')
+            self.pasted = args[1]
+            return True
+        # wait_for_text の長さの確認
+        return len(self.content)
+
+    def execute_cdp_cmd(self, command, params):
+        self.calls.append(command)
+        self.content = params['text'] if self.selected else self.content + params['text']
+        self.selected = False
+        return {}
+
+
+def test_paste():
+    """エディタが貼り付けを処理して反映した場合は、そのまま貼り付けで入力する"""
+    driver = FakeEditor(paste_delay=1)
+
+    assert insert_text(driver, object(), '本文', timeout=1) == 'paste'
+    assert driver.calls == ['select', 'paste']
+    assert driver.content == '本文'
+
+
+def test_slow_paste_falls_back_after_select_all(monkeypatch):
+    """貼り付けを処理したが反映が遅い場合は、全選択し直してからCDPで置き換える（遅れて入った内容に追記しない）"""
+    driver = FakeEditor(paste_delay=2)
+    # 反映の確認は1回だけ行ってタイムアウトする
+    monkeypatch.setattr(
+        text_input, 'wait_for_text',
+        lambda d, element, min_length, timeout: d.execute_script('') >= min_length
+    )
+
+    assert insert_text(driver, object(), '本文', timeout=1) == 'cdp'
+    assert driver.calls == ['select', 'paste', 'select', 'Input.insertText']
+    assert driver.content == '本文'
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note投稿モジュール（HTTP API方式）のテストスクリプト
+ローカルの代替サーバー（note_platform/mock_server.py）に対して投稿する
+"""
+
+import os
+import sys
+
+import pytest
+
+from note_platform import note_api, post_note
+from note_platform.note_api import markdown_to_note_html, post_to_note_api
+
+
+def test_post_to_note_api(mock_server):
+    """ログイン → 下書き作成 → 保存 → 公開、2回目は保存済みセッションを使う"""
+    result = post_to_note_api('テスト記事', '## 見出し\n\n本文です', hashtags=['Python', '#自動化'])
+
+    note = mock_server.state.notes[1]
+    assert result['success'] is True
+    assert result['backend'] == 'api'
+    assert result['url'] == f"https://note.com/mock_user/n/{note['key']}"
+    assert note['status'] == 'published'
+    assert note['name'] == 'テスト記事'
+    assert note['hashtags'] == ['#Python', '#自動化']
+
+    # プロセスを再起動した想定（クライアントを作り直しても保存済みのCookieでログインを省略）
+    note_api.reset_client()
+    post_to_note_api('2本目', '本文')
+
+    assert mock_server.state.calls['sign_in'] == 1
+    assert mock_server.state.calls['publish'] == 2
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='POSIXのファイル権限を確認')
+def test_session_file_permissions(mock_server):
+    """保存したCookieは本人のみ読み書き可能"""
+    post_to_note_api('テスト記事', '本文')
+
+    assert os.stat(note_api.get_session_path()).st_mode & 0o777 == 0o600
+
+
+def test_publish_failure_does_not_fall_back(mock_server, monkeypatch):
+    """下書きの作成後に失敗した場合はブラウザで投稿し直さず、記事のキーを含むエラーにする"""
+    def no_browser():
+        raise AssertionError('ブラウザでの投稿に切り替えました')
+
+    # 再試行の対象になるステータスコードでも、公開（PUT）は再送しない
+    mock_server.state.fail_status['publish'] = 503
+    monkeypatch.setattr(post_note, 'get_browser_pool', no_browser)
+
+    with pytest.raises(note_api.NotePostIncompleteError) as excinfo:
+        post_note.post_to_note('テスト記事', '本文', backend='api')
+
+    note = mock_server.state.notes[1]
+    assert excinfo.value.key == note['key']
+    assert note['key'] in str(excinfo.value)
+    assert mock_server.state.calls['create'] == 1
+    # 公開（PUT）はサーバー側で処理済みの可能性があるため自動では再送しない
+    assert mock_server.state.calls['publish'] == 1
+
+
+def test_login_failure(mock_server, monkeypatch):
+    monkeypatch.setenv('NOTE_PASSWORD', 'wrong')
+
+    with pytest.raises(note_api.NoteApiError):
+        post_to_note_api('テスト記事', '本文')
+
+
+def test_markdown_to_note_html():
+    html = markdown_to_note_html('## 見出し\n\n- a\n- b\n\n```\n<code>\n```\n1行目\n2行目 **太字**')
+
+    assert '<h2 ' in html and '見出し</h2>' in html
+    assert html.count('<li ') == 2
+    assert '&lt;code&gt;' in html
+    assert '1行目<br>2行目 <b>太字</b></p>' in html
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note記事の2段階投稿（下書きの準備 → 公開）のテストスクリプト
+HTTP API方式でローカルの代替サーバーに対して実行する
+"""
+
+from datetime import datetime
+
+import pytest
+
+from note_platform.drafts import (
+    list_note_drafts,
+    prepare_note_draft,
+    prepare_note_drafts,
+    publish_due_note_drafts,
+    publish_note_draft,
+)
+
+
+def test_prepare_then_publish_due(mock_server):
+    """まとめて準備した下書きのうち、公開予定日時を過ぎたものだけを公開"""
+    drafts = prepare_note_drafts([
+        {'title': '月曜の記事', 'content': '本文1', 'hashtags': ['Python'], 'scheduled_at': '2026-01-05T09:00:00'},
+        {'title': '火曜の記事', 'content': '本文2', 'scheduled_at': '2026-01-06T09:00:00'},
+    ], backend='api')
+
+    assert [draft['status'] for draft in drafts] == ['prepared', 'prepared']
+    assert all(note['status'] == 'draft' for note in mock_server.state.notes.values())
+    assert mock_server.state.notes[1]['name'] == '月曜の記事'
+
+    results = publish_due_note_drafts(now=datetime(2026, 1, 5, 12, 0))
+
+    assert len(results) == 1
+    assert results[0]['url'] == f"https://note.com/mock_user/n/{drafts[0]['key']}"
+    assert mock_server.state.notes[1]['status'] == 'published'
+    assert mock_server.state.notes[1]['hashtags'] == ['#Python']
+    assert mock_server.state.notes[2]['status'] == 'draft'
+    assert [draft['title'] for draft in list_note_drafts(status='prepared')] == ['火曜の記事']
+
+    # 公開済みの下書きは再度公開しない
+    publish_note_draft(drafts[0]['key'])
+    assert mock_server.state.calls['publish'] == 1
+
+
+def test_publish_unknown_draft(mock_server):
+    with pytest.raises(ValueError):
+        publish_note_draft('nunknown00000')
+
+
+def test_draft_save_failure_keeps_created_note(mock_server):
+    """下書きの保存に失敗しても作成した記事を記録し、そのまま公開できる（記事を重複して作らない）"""
+    mock_server.state.fail_status['draft_save'] = 400
+
+    with pytest.raises(Exception):
+        prepare_note_draft('保存失敗の記事', '本文', backend='api')
+
+    [record] = list_note_drafts(status='failed')
+    assert record['id'] == 1 and record['key'] == mock_server.state.notes[1]['key']
+
+    del mock_server.state.fail_status['draft_save']
+    result = publish_note_draft(record['key'])
+
+    assert result['url'] == f"https://note.com/mock_user/n/{record['key']}"
+    assert mock_server.state.calls['create'] == 1
+    assert mock_server.state.notes[1]['status'] == 'published'
+    assert mock_server.state.notes[1]['name'] == '保存失敗の記事'
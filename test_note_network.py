@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Note投稿の記事URL取得（ネットワークイベントからの記事キー取得）のテストスクリプト
+"""
+
+import json
+
+from browser_common.network import NetworkMonitor
+from note_platform.post_note import _find_published_note_url, extract_note_url
+
+
+def _entry(method, params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeDriver:
+    """パフォーマンスログとNetwork.getResponseBodyを再現するWebDriver"""
+
+    def __init__(self, entries, bodies):
+        self.entries = entries
+        self.bodies = bodies
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        return {'body': self.bodies[params['requestId']], 'base64Encoded': False}
+
+
+def _request(request_id, url, method, status):
+    return [
+        _entry('Network.requestWillBeSent', {'requestId': request_id, 'request': {'url': url, 'method': method}}),
+        _entry('Network.responseReceived', {'requestId': request_id, 'response': {'url': url, 'status': status}}),
+        _entry('Network.loadingFinished', {'requestId': request_id}),
+    ]
+
+
+def test_find_published_note_url():
+    """公開APIのレスポンスから記事URLを組み立てる（新しいレスポンスを優先）"""
+    entries = (
+        _request('1', 'https://note.com/api/v1/text_notes', 'POST', 201)
+        + _request('2', 'https://note.com/api/v1/text_notes/draft_save?id=123', 'POST', 200)
+        + _request('3', 'https://note.com/api/v2/creators/me', 'GET', 200)
+        + _request('4', 'https://note.com/api/v1/text_notes/123', 'PUT', 200)
+    )
+    bodies = {
+        '1': json.dumps({'data': {'id': 123, 'key': 'n0000000000aa'}}),
+        '2': json.dumps({'data': {'result': True}}),
+        '3': json.dumps({'data': {'urlname': 'other'}}),
+        '4': json.dumps({'data': {'id': 123, 'key': 'n1a2b3c4d5e6f', 'user': {'urlname': 'alice'}}}),
+    }
+    network = NetworkMonitor(FakeDriver(entries, bodies))
+
+    assert _find_published_note_url(network, '') == 'https://note.com/alice/n/n1a2b3c4d5e6f'
+    assert [r['request_id'] for r in network.find_requests(r'text_notes', methods=['POST'])] == ['2', '1']
+    assert not network.inflight
+
+
+def test_extract_note_url():
+    """記事キーが取れない・ユーザー名が分からない場合はNone"""
+    assert extract_note_url({'data': {'key': 'n1a2b3c4d5e6f'}}, 'bob') == 'https://note.com/bob/n/n1a2b3c4d5e6f'
+    assert extract_note_url({'data': {'key': 'n1a2b3c4d5e6f'}}) is None
+    assert extract_note_url({'data': {'key': '123'}}, 'bob') is None
+    assert extract_note_url({'data': {'note_url': 'https://note.com/bob/n/nabc?x=1'}}) == 'https://note.com/bob/n/nabc'
+    assert extract_note_url({'data': []}, 'bob') is None
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiita記事取得モジュールのテストスクリプト
+"""
+
+import qiita_platform.fetch_qiita as fetch_qiita
+
+
+class FakeResponse:
+    def __init__(self, status_code, data, headers):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers
+        self.text = str(data)
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """250件の記事を持つ authenticated_user/items を再現するSession"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        page = params['page']
+        per_page = params['per_page']
+        self.requests.append((page, headers.get('If-None-Match')))
+
+        etag = f'"page-{page}"'
+        response_headers = {'Total-Count': '250', 'Rate-Remaining': '900', 'Rate-Reset': '0', 'ETag': etag}
+        if headers.get('If-None-Match') == etag:
+            return FakeResponse(304, None, response_headers)
+
+        start = (page - 1) * per_page
+        items = [
+            {'id': f'id{i}', 'title': f'記事{i}', 'likes_count': i, 'stocks_count': 0, 'tags': [{'name': 'Python'}]}
+            for i in range(start, min(start + per_page, 250))
+        ]
+        return FakeResponse(200, items, response_headers)
+
+
+def test_fetch_my_items_uses_etag_cache(tmp_path, monkeypatch):
+    """2回目の取得では全ページが304になり、キャッシュの内容が返される"""
+    monkeypatch.setenv('QIITA_ACCESS_TOKEN', 'dummy')
+    session = FakeSession()
+    monkeypatch.setattr(fetch_qiita, 'get_session', lambda: session)
+    cache_path = tmp_path / 'my_items.json'
+
+    result = fetch_qiita.fetch_my_items(cache_path=cache_path)
+    assert result['total_count'] == 250
+    assert result['pages'] == 3
+    assert [item['id'] for item in result['items']] == [f'id{i}' for i in range(250)]
+    assert sorted(page for page, _ in session.requests) == [1, 2, 3]
+
+    session.requests.clear()
+    result = fetch_qiita.fetch_my_items(cache_path=cache_path)
+    assert result['not_modified_pages'] == 3
+    assert len(result['items']) == 250
+    assert all(etag is not None for _, etag in session.requests)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiita記事同期モジュールのテストスクリプト
+"""
+
+import qiita_platform.post_qiita as post_qiita
+from qiita_platform.sync_qiita import sync_qiita_articles
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self._data = data
+        self.text = str(data)
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """送信したリクエストを記録するだけのSession"""
+
+    def __init__(self):
+        self.requests = []
+
+    def patch(self, url, **kwargs):
+        self.requests.append(('PATCH', url))
+        return FakeResponse(200, {'url': url.replace('/api/v2/items/', '/items/')})
+
+    def post(self, url, **kwargs):
+        self.requests.append(('POST', url))
+        return FakeResponse(201, {'id': 'new0000000000000000', 'url': 'https://qiita.com/items/new'})
+
+
+def write_article(path, title, content, item_id=None):
+    text = f"[Qiita Title]\n{title}\n\n[Qiita Content]\n{content}\n\n[Qiita Tags]\nPython, API\n"
+    if item_id:
+        text += f"\n[Qiita ID]\n{item_id}\n"
+    path.write_text(text, encoding='utf-8')
+
+
+def test_sync_only_changed_articles(tmp_path, monkeypatch):
+    """変更された記事だけがPATCHされる"""
+    monkeypatch.setenv('QIITA_ACCESS_TOKEN', 'dummy')
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path / 'cache'))
+    session = FakeSession()
+    monkeypatch.setattr(post_qiita, 'get_session', lambda: session)
+
+    for i in range(20):
+        write_article(tmp_path / f"article{i:02d}.txt", f"記事{i}", f"本文{i}", item_id=f"id{i:02d}")
+
+    # 初回: 同期状態がないので全件PATCH
+    summary = sync_qiita_articles(str(tmp_path), max_workers=4)
+    assert len(summary['updated']) == 20
+    assert len(session.requests) == 20
+
+    # 2回目: 変更なし
+    session.requests.clear()
+    summary = sync_qiita_articles(str(tmp_path), max_workers=4)
+    assert len(summary['unchanged']) == 20
+    assert session.requests == []
+
+    # 3件だけ変更
+    for i in (1, 5, 9):
+        write_article(tmp_path / f"article{i:02d}.txt", f"記事{i}", f"本文{i}（修正）", item_id=f"id{i:02d}")
+
+    summary = sync_qiita_articles(str(tmp_path), max_workers=4)
+    assert sorted(summary['updated']) == ['article01.txt', 'article05.txt', 'article09.txt']
+    assert sorted(url for _, url in session.requests) == [
+        'https://qiita.com/api/v2/items/id01',
+        'https://qiita.com/api/v2/items/id05',
+        'https://qiita.com/api/v2/items/id09',
+    ]
+
+
+def test_sync_unmapped_articles(tmp_path, monkeypatch):
+    """記事IDがないファイルは --create-missing 指定時のみ新規投稿される"""
+    monkeypatch.setenv('QIITA_ACCESS_TOKEN', 'dummy')
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path / 'cache'))
+    session = FakeSession()
+    monkeypatch.setattr(post_qiita, 'get_session', lambda: session)
+
+    write_article(tmp_path / "new.txt", "新しい記事", "本文")
+
+    summary = sync_qiita_articles(str(tmp_path))
+    assert summary['skipped'] == ['new.txt']
+    assert session.requests == []
+
+    summary = sync_qiita_articles(str(tmp_path), create_missing=True)
+    assert summary['created'] == ['new.txt']
+    assert session.requests == [('POST', 'https://qiita.com/api/v2/items')]
+
+    # 新規投稿後はIDが記録され、以降は変更がなければ送信しない
+    session.requests.clear()
+    summary = sync_qiita_articles(str(tmp_path), create_missing=True)
+    assert summary['unchanged'] == ['new.txt']
+    assert session.requests == []
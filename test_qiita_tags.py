@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qiitaタグカタログモジュールのテストスクリプト
+"""
+
+import qiita_platform.post_qiita as post_qiita
+from qiita_platform.tags import TagCatalog, load_tag_catalog, normalize_tags
+from local_cache import save_json
+
+
+CATALOG = TagCatalog({
+    'Python': 100000,
+    'python3': 20000,
+    'PythonAnywhere': 50,
+    'JavaScript': 90000,
+    'Java': 60000,
+    'API': 30000,
+    '自動化': 5000,
+})
+
+
+def test_lookup_is_case_insensitive():
+    """大文字小文字を区別せずに正式な表記を返す"""
+    assert CATALOG.lookup('python') == 'Python'
+    assert CATALOG.lookup('PYTHON3') == 'python3'
+    assert CATALOG.lookup(' api ') == 'API'
+    assert CATALOG.lookup('自動化') == '自動化'
+    assert CATALOG.lookup('Pyth') is None
+
+
+def test_prefix_search_orders_by_items_count():
+    """前方一致検索は記事数の多い順"""
+    assert CATALOG.prefix_search('py') == ['Python', 'python3', 'PythonAnywhere']
+    assert CATALOG.prefix_search('JAVA') == ['JavaScript', 'Java']
+    assert CATALOG.prefix_search('java', limit=1) == ['JavaScript']
+    assert CATALOG.prefix_search('ruby') == []
+
+
+def test_normalize_tags():
+    """表記を補正し、重複を除去し、未登録タグはそのまま残す"""
+    normalized, unknown = CATALOG.normalize_tags(['python', 'Python', 'api', 'MyNewTag'])
+    assert normalized == ['Python', 'API', 'MyNewTag']
+    assert unknown == ['MyNewTag']
+
+
+def test_normalize_tags_without_cache(tmp_path, monkeypatch):
+    """キャッシュがない場合はタグをそのまま返す"""
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path))
+    assert normalize_tags(['python', 'api']) == ['python', 'api']
+
+    save_json(tmp_path / 'qiita' / 'tags.json', {'names': CATALOG.names, 'counts': CATALOG.counts})
+    assert len(load_tag_catalog()) == len(CATALOG)
+    assert normalize_tags(['python', 'api']) == ['Python', 'API']
+
+
+def test_catalog_is_reused_until_file_changes(tmp_path):
+    """キャッシュファイルが変わるまでは読み込んだカタログを使い回す"""
+    path = tmp_path / 'tags.json'
+    save_json(path, {'names': CATALOG.names, 'counts': CATALOG.counts})
+
+    catalog = load_tag_catalog(path)
+    assert load_tag_catalog(path) is catalog
+
+    save_json(path, {'names': ['Ruby'], 'counts': [1]})
+    reloaded = load_tag_catalog(path)
+    assert reloaded is not catalog
+    assert reloaded.lookup('ruby') == 'Ruby'
+
+
+def test_update_normalizes_tags(tmp_path, monkeypatch):
+    """記事の更新（PATCH）でも新規投稿と同じくタグの表記を補正する"""
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path))
+    monkeypatch.setenv('QIITA_ACCESS_TOKEN', 'dummy')
+    save_json(tmp_path / 'qiita' / 'tags.json', {'names': CATALOG.names, 'counts': CATALOG.counts})
+    sent = []
+
+    class FakeSession:
+        def patch(self, url, json=None, **kwargs):
+            sent.append(json)
+            return type('Response', (), {'status_code': 200, 'json': lambda self: {'url': url}})()
+
+    monkeypatch.setattr(post_qiita, 'get_session', lambda: FakeSession())
+    post_qiita.update_qiita_item('id00', '記事', '本文', tags=['python', 'Python', 'api'])
+
+    assert [tag['name'] for tag in sent[0]['tags']] == ['Python', 'API']
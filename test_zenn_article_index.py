@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn記事インデックス（zenn_platform/article_index.py）のテストスクリプト
+"""
+
+import pytest
+
+from zenn_platform.article_index import ArticleIndex, load_article_index
+from zenn_platform.post_zenn_github import create_article_content
+
+
+@pytest.fixture
+def articles_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path / 'cache'))
+    articles = tmp_path / 'repo' / 'articles'
+    articles.mkdir(parents=True)
+    return articles
+
+
+def _write(articles_dir, slug, title, content='本文', **kwargs):
+    text = create_article_content(title, content, **kwargs)
+    (articles_dir / f'{slug}.md').write_text(text, encoding='utf-8')
+    return text
+
+
+def test_build_and_lookup(articles_dir):
+    _write(articles_dir, 'python-article-0001', 'Pythonの記事', topics=['Python', 'API'])
+    _write(articles_dir, 'draft-article-0001', '下書きの記事', published=False)
+
+    index = load_article_index(articles_dir.parent)
+
+    assert index.find_by_title('Pythonの記事') == 'python-article-0001'
+    assert index.find_by_title('存在しない記事') is None
+    assert index.get('python-article-0001')['topics'] == ['Python', 'API']
+    assert index.get('draft-article-0001')['published'] is False
+
+
+def test_incremental_refresh(articles_dir, monkeypatch):
+    """保存したインデックスを使い、更新日時・サイズが変わったファイルだけを読み直す"""
+    _write(articles_dir, 'first-article-0001', '1本目')
+    _write(articles_dir, 'second-article-001', '2本目')
+    load_article_index(articles_dir.parent).save()
+
+    _write(articles_dir, 'second-article-001', '2本目（改題）', content='長くなった本文')
+    (articles_dir / 'first-article-0001.md').unlink()
+
+    read = []
+    original = ArticleIndex._entry_for
+    monkeypatch.setattr(ArticleIndex, '_entry_for', lambda self, path, text: read.append(path.name) or original(self, path, text))
+
+    index = load_article_index(articles_dir.parent)
+
+    assert read == ['second-article-001.md']
+    assert index.find_by_title('2本目（改題）') == 'second-article-001'
+    assert index.get('first-article-0001') is None
+
+
+def test_unique_slug(articles_dir):
+    _write(articles_dir, 'article-20261019-120000', '短い題')
+    _write(articles_dir, 'article-20261019-120000-2', '短い題2')
+
+    index = load_article_index(articles_dir.parent)
+
+    assert index.unique_slug('new-article-0001') == 'new-article-0001'
+    assert index.unique_slug('article-20261019-120000') == 'article-20261019-120000-3'
+    assert len(index.unique_slug('a' * 50)) == 50
@@ -4,7 +4,37 @@
 Zenn投稿モジュール（GitHub連携方式）のテストスクリプト
 """
 
-from zenn_platform.post_zenn_github import post_to_zenn_github
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zenn_platform import images, post_zenn_github, push_queue
+from zenn_platform.post_zenn_github import post_to_zenn_github, post_to_zenn_github_batch
+from zenn_platform.push_queue import get_push_status
+from zenn_platform.repo_lock import RepoLock
+
+
+def _git(cwd, *args):
+    return subprocess.run(['git'] + list(args), cwd=cwd, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def zenn_repo(tmp_path, monkeypatch):
+    """プッシュ先のベアリポジトリと、それをクローンしたZenn連携リポジトリ"""
+    remote = tmp_path / 'remote.git'
+    repo = tmp_path / 'zenn-content'
+    _git(tmp_path, 'init', '-q', '--bare', str(remote))
+    _git(tmp_path, 'clone', '-q', str(remote), str(repo))
+    _git(repo, 'config', 'user.name', 'test')
+    _git(repo, 'config', 'user.email', 'test@example.com')
+    _git(repo, 'commit', '-q', '--allow-empty', '-m', 'init')
+    _git(repo, 'push', '-q', 'origin', 'HEAD')
+    monkeypatch.setenv('ZENN_GITHUB_REPO_PATH', str(repo))
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path / 'cache'))
+    return repo, remote
 
 def test_post_to_zenn_github():
     """GitHub連携方式でZennに記事を投稿（Dry runモード）"""
@@ -77,6 +107,271 @@ def test_post_to_zenn_github():
     return True
 
 
+@pytest.mark.parametrize('git_backend', ['cli', 'plumbing'])
+@pytest.mark.parametrize('commit_mode, expected_commits', [('single', 1), ('per-article', 3)])
+def test_post_to_zenn_github_batch(zenn_repo, commit_mode, expected_commits, git_backend):
+    """3記事を1回のgit add・1回のプッシュで投稿"""
+    repo, remote = zenn_repo
+    articles = [
+        {'title': f'バッチ投稿{i}', 'content': f'本文{i}', 'slug': f'batch-article-{i:04d}', 'topics': ['Python']}
+        for i in range(3)
+    ]
+
+    result = post_to_zenn_github_batch(articles, commit_mode=commit_mode, git_backend=git_backend)
+
+    assert result['commits'] == expected_commits
+    assert [a['slug'] for a in result['articles']] == ['batch-article-0000', 'batch-article-0001', 'batch-article-0002']
+    assert (repo / 'articles' / 'batch-article-0001.md').read_text(encoding='utf-8').endswith('本文1')
+    # プッシュ済み（リモートのHEADがローカルと同じ）
+    assert _git(remote, 'rev-parse', 'HEAD') == _git(repo, 'rev-parse', 'HEAD')
+    assert _git(remote, 'rev-list', '--count', 'HEAD').strip() == str(1 + expected_commits)
+    # インデックス・作業ツリーがHEADと一致している
+    assert _git(repo, 'status', '--porcelain') == ''
+    assert _git(repo, 'log', '-1', '--format=%an <%ae>') == 'test <test@example.com>\n'
+
+
+def test_unchanged_article_skips_git(zenn_repo, monkeypatch):
+    """内容が同じ記事の再投稿ではgitを実行しない（変更した記事だけコミットする）"""
+    repo, remote = zenn_repo
+    articles = [{'title': f'再実行{i}', 'content': f'本文{i}', 'slug': f'rerun-article-{i:04d}'} for i in range(2)]
+    post_to_zenn_github_batch(articles)
+    head = _git(repo, 'rev-parse', 'HEAD')
+
+    run = subprocess.run
+    commands = []
+
+    def record_git(args, *rest, **kwargs):
+        commands.append(args[1])
+        return run(args, *rest, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', record_git)
+    result = post_to_zenn_github_batch(articles)
+    single = post_to_zenn_github('再実行0', '本文0', slug='rerun-article-0000')
+    monkeypatch.setattr(subprocess, 'run', run)
+
+    assert commands == []
+    assert result['commits'] == 0 and result['push'] is None
+    assert not single['changed'] and single['push'] is None
+    assert _git(repo, 'rev-parse', 'HEAD') == head
+
+    articles[1]['content'] = '本文1（修正）'
+    result = post_to_zenn_github_batch(articles)
+    assert [a['changed'] for a in result['articles']] == [False, True]
+    assert result['commits'] == 1
+    assert _git(repo, 'show', '--name-only', '--format=', 'HEAD').split() == ['articles/rerun-article-0001.md']
+
+
+def test_rerun_after_push_failure(zenn_repo):
+    """プッシュに失敗した記事は、再実行時に内容が同じでもプッシュする"""
+    repo, remote = zenn_repo
+    _git(repo, 'remote', 'set-url', 'origin', str(repo.parent / 'missing.git'))
+    with pytest.raises(Exception, match='git push失敗'):
+        post_to_zenn_github('プッシュ失敗', '本文', slug='push-failure-0001')
+    head = _git(repo, 'rev-parse', 'HEAD')
+
+    _git(repo, 'remote', 'set-url', 'origin', str(remote))
+    result = post_to_zenn_github('プッシュ失敗', '本文', slug='push-failure-0001')
+
+    assert not result['changed'] and result['push'] == 'pushed'
+    assert _git(repo, 'rev-parse', 'HEAD') == head
+    assert _git(remote, 'rev-parse', 'HEAD') == head
+
+    again = post_to_zenn_github('プッシュ失敗', '本文', slug='push-failure-0001')
+    assert not again['changed'] and again['push'] is None
+
+
+def test_rerun_after_commit_failure(zenn_repo):
+    """コミットに失敗した記事は、再実行時に内容が同じでもコミットする"""
+    repo, remote = zenn_repo
+    hook = repo / '.git' / 'hooks' / 'pre-commit'
+    hook.write_text('#!/bin/sh\nexit 1\n')
+    hook.chmod(0o755)
+    with pytest.raises(Exception, match='git commit失敗'):
+        post_to_zenn_github('コミット失敗', '本文', slug='commit-failure-0001', git_backend='cli')
+
+    hook.unlink()
+    result = post_to_zenn_github('コミット失敗', '本文', slug='commit-failure-0001', git_backend='cli')
+
+    assert result['changed'] and result['push'] == 'pushed'
+    assert _git(repo, 'status', '--porcelain') == ''
+    assert _git(repo, 'show', '--name-only', '--format=', 'HEAD').split() == ['articles/commit-failure-0001.md']
+    assert _git(remote, 'rev-parse', 'HEAD') == _git(repo, 'rev-parse', 'HEAD')
+
+
+def test_slug_collision_and_title_lookup(zenn_repo):
+    """スラッグを指定しない場合、同じタイトルの記事は更新し、別の記事は上書きしない"""
+    repo, remote = zenn_repo
+    articles = [{'title': '短い題', 'content': '本文A'}, {'title': '別の短い題', 'content': '本文B'}]
+
+    result = post_to_zenn_github_batch(articles)
+    slugs = [a['slug'] for a in result['articles']]
+    assert len(set(slugs)) == 2
+
+    updated = post_to_zenn_github('別の短い題', '本文B（更新）')
+    assert updated['slug'] == slugs[1]
+    assert (repo / 'articles' / f'{slugs[0]}.md').read_text(encoding='utf-8').endswith('本文A')
+
+
+@pytest.mark.parametrize('git_backend', ['cli', 'plumbing'])
+def test_local_images(zenn_repo, tmp_path, git_backend):
+    """本文中のローカル画像をハッシュ名で images/ に取り込み、記事と同じコミットに含める"""
+    repo, remote = zenn_repo
+    drafts = tmp_path / 'drafts'
+    (drafts / 'img').mkdir(parents=True)
+    (drafts / 'img' / 'figure.png').write_bytes(b'\x89PNG same image')
+    (drafts / 'copy.png').write_bytes(b'\x89PNG same image')
+    articles = [
+        {'title': '画像1', 'content': '![図](img/figure.png "図1")\n![外部](https://example.com/a.png)',
+         'slug': 'image-article-0001', 'image_base_dir': str(drafts)},
+        {'title': '画像2', 'content': '![同じ図](./copy.png =250x)', 'slug': 'image-article-0002',
+         'image_base_dir': str(drafts)},
+    ]
+
+    result = post_to_zenn_github_batch(articles, commit_mode='per-article', git_backend=git_backend)
+
+    images = list((repo / 'images').iterdir())
+    assert len(images) == 1
+    name = images[0].name
+    assert name.endswith('.png') and len(name) == 16 + 4
+    first = (repo / 'articles' / 'image-article-0001.md').read_text(encoding='utf-8')
+    second = (repo / 'articles' / 'image-article-0002.md').read_text(encoding='utf-8')
+    assert f'![図](/images/{name} "図1")' in first
+    assert '![外部](https://example.com/a.png)' in first
+    assert f'![同じ図](/images/{name} =250x)' in second
+    # 画像は最初の記事のコミットに含まれ、作業ツリーに未コミットのファイルは残らない
+    assert result['commits'] == 2
+    assert f'images/{name}' in _git(repo, 'show', '--name-only', '--format=', 'HEAD~1').split()
+    assert _git(repo, 'status', '--porcelain') == ''
+
+    with pytest.raises(Exception, match='画像ファイルが見つかりません'):
+        post_to_zenn_github('画像なし', '![図](missing.png)', image_base_dir=str(drafts))
+
+
+def test_image_not_reconverted(tmp_path, monkeypatch):
+    """変換で大きくなり元の形式で保存した画像は、次回以降は変換し直さない"""
+    opened = []
+
+    class FakeImage:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def save(self, output, **kwargs):
+            output.write(b'x' * 100)
+
+    class FakePil:
+        @staticmethod
+        def open(data):
+            opened.append(data)
+            return FakeImage()
+
+    monkeypatch.setattr(images, 'Image', FakePil)
+    source = tmp_path / 'small.png'
+    source.write_bytes(b'\x89PNG small')
+    images_dir = tmp_path / 'images'
+    images_dir.mkdir()
+
+    first = images._store_image(str(source), str(images_dir), 'webp', 80)
+    second = images._store_image(str(source), str(images_dir), 'webp', 80)
+
+    assert first == second and first.endswith('.png')
+    assert len(opened) == 1
+
+
+@pytest.mark.parametrize('git_backend', ['cli', 'plumbing'])
+def test_concurrent_posts(zenn_repo, git_backend):
+    """同時に投稿しても、コミットの失敗・記事の上書きが起きない（スラッグが重複するタイトルでも）"""
+    repo, remote = zenn_repo
+
+    def post(i):
+        return post_to_zenn_github(f'同時投稿{i}', f'本文{i}', git_backend=git_backend)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(post, range(6)))
+
+    assert all(result['push'] == 'pushed' for result in results)
+    assert len({result['slug'] for result in results}) == 6
+    assert _git(remote, 'rev-list', '--count', 'HEAD').strip() == '7'
+    for i, result in enumerate(results):
+        assert (repo / 'articles' / f"{result['slug']}.md").read_text(encoding='utf-8').endswith(f'本文{i}')
+
+
+def test_render_and_push_outside_lock(zenn_repo, monkeypatch):
+    """記事の生成・画像の取り込み・プッシュはリポジトリのロックの外で行い、他の投稿のコミットを待たない"""
+    repo, remote = zenn_repo
+    rendering = threading.Event()
+    prepare_images = post_zenn_github.prepare_images
+    push = post_zenn_github._push
+
+    def fake_prepare_images(*args, **kwargs):
+        rendering.set()
+        return prepare_images(*args, **kwargs)
+
+    def fake_push(*args, **kwargs):
+        # プッシュ中もリポジトリのロックを取得できる（他の投稿がコミットできる）
+        with RepoLock(repo, timeout=0):
+            pass
+        return push(*args, **kwargs)
+
+    monkeypatch.setattr(post_zenn_github, 'prepare_images', fake_prepare_images)
+    monkeypatch.setattr(post_zenn_github, '_push', fake_push)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # 他の投稿がコミット中でも、記事の生成は待たずに始まる
+        with RepoLock(repo):
+            future = executor.submit(post_to_zenn_github, 'ロック外の生成', '本文', slug='outside-lock')
+            assert rendering.wait(timeout=10)
+            assert not future.done()
+        result = future.result(timeout=30)
+
+    assert result['push'] == 'pushed'
+    assert _git(remote, 'rev-parse', 'HEAD') == _git(repo, 'rev-parse', 'HEAD')
+
+
+def test_deferred_push(zenn_repo, monkeypatch):
+    """コミット後すぐに戻り、続けて投稿した記事もバックグラウンドの1つのプロセスがプッシュする"""
+    repo, remote = zenn_repo
+    monkeypatch.setenv('ZENN_PUSH_DELAY', '1')
+
+    first = post_to_zenn_github('遅延プッシュ1', '本文1', slug='deferred-article-1', defer_push=True)
+    second = post_to_zenn_github('遅延プッシュ2', '本文2', slug='deferred-article-2', defer_push=True)
+
+    assert first['push'] == second['push'] == 'deferred'
+    assert get_push_status(repo)['pending'] == 2
+
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        status = get_push_status(repo)
+        if status['status'] == 'idle' and status['pending'] == 0:
+            break
+        time.sleep(0.2)
+
+    assert status['pending'] == 0
+    assert status['last_pushed'] == 2
+    assert _git(remote, 'rev-parse', 'HEAD') == _git(repo, 'rev-parse', 'HEAD')
+
+    # バックグラウンドでプッシュした記事も、内容が同じ再投稿ではコミット・プッシュしない
+    again = post_to_zenn_github('遅延プッシュ1', '本文1', slug='deferred-article-1', defer_push=True)
+    assert not again['changed'] and again['push'] is None
+
+
+def test_push_state_concurrent_updates(tmp_path, monkeypatch):
+    """投稿中のプロセスとプッシュ担当プロセスが同時に状態を更新しても、互いの更新を失わない"""
+    monkeypatch.setenv('SNS_AUTO_POST_CACHE_DIR', str(tmp_path / 'cache'))
+
+    def update(i):
+        for n in range(10):
+            push_queue._update_state(tmp_path, **{f'field{i}': n})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(update, range(8)))
+
+    state = push_queue._load_state(tmp_path)
+    assert all(state.get(f'field{i}') == 9 for i in range(8))
+
+
 if __name__ == '__main__':
     import sys
     success = test_post_to_zenn_github()
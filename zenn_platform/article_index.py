@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn連携リポジトリの記事インデックス
+articles/*.md のスラッグ・タイトル・トピック・公開設定・内容のハッシュをキャッシュに保存し、
+スラッグの重複やタイトルからの既存記事の検索を全ファイルを読まずに行う
+
+インデックスは初回に全記事から作成し、以降は更新日時・サイズが変わったファイルだけを読み直す。
+コミット・プッシュした内容も記録し、内容が同じ記事の再投稿ではgitを実行しない
+
+使用例:
+  python zenn_platform/article_index.py
+  python zenn_platform/article_index.py --title "記事のタイトル"
+"""
+
+import os
+import sys
+import io
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    if not isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    if not isinstance(sys.stderr, io.TextIOWrapper):
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from local_cache import get_cache_dir, load_json, save_json
+from zenn_platform.repo_lock import RepoLock
+
+# 環境変数読み込み
+load_dotenv()
+
+# インデックスの形式（変更した場合は全記事から作り直す）
+INDEX_VERSION = 2
+
+# Zennのスラッグの最大長
+MAX_SLUG_LENGTH = 50
+
+
+def content_hash(text: str) -> str:
+    """記事ファイルの内容のハッシュ（改行コードの違いは無視）"""
+    return hashlib.sha256(text.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+
+def _parse_value(value: str):
+    """フロントマターの値（文字列・配列・真偽値）を変換"""
+    value = value.strip()
+    if value in ('true', 'false'):
+        return value == 'true'
+    if value.startswith(('"', '[')):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value.strip('"\'')
+
+
+def parse_front_matter(text: str) -> Dict:
+    """
+    記事ファイルのフロントマター（--- で囲まれた key: value）を読み込む
+
+    create_article_content が出力する形式（1行1項目）のみに対応
+    """
+    lines = text.replace('\r\n', '\n').split('\n')
+    if not lines or lines[0].strip() != '---':
+        return {}
+
+    front_matter = {}
+    for line in lines[1:]:
+        if line.strip() == '---':
+            break
+        key, sep, value = line.partition(':')
+        if sep and key.strip():
+            front_matter[key.strip()] = _parse_value(value)
+    return front_matter
+
+
+def get_index_path(repo_path: Path) -> Path:
+    """インデックスファイルのパス（リポジトリのパスごとに別ファイル）"""
+    key = hashlib.sha1(str(Path(repo_path).resolve()).encode('utf-8')).hexdigest()[:12]
+    return get_cache_dir('zenn') / f'article_index-{key}.json'
+
+
+class ArticleIndex:
+    """
+    articles/*.md のインデックス
+
+    entries: スラッグ → {title, topics, published, hash, mtime_ns, size, committed_hash, commit}
+    commits: このインデックスに記録したコミットの通し番号（記事の commit はコミットしたときの番号）
+    pushed: プッシュを確認できたコミットの通し番号（記事の commit がこれ以下ならプッシュ済み）
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self.articles_dir = self.repo_path / 'articles'
+        self.path = get_index_path(self.repo_path)
+        self.entries: Dict[str, Dict] = {}
+        self.commits = 0
+        self.pushed = 0
+        self._titles: Dict[str, str] = {}
+        self._dirty = False
+
+        data = load_json(self.path, default={})
+        if data.get('version') == INDEX_VERSION and data.get('repo_path') == str(self.repo_path.resolve()):
+            self.entries = data.get('articles', {})
+            self.commits = data.get('commits', 0)
+            self.pushed = data.get('pushed', 0)
+
+    def _entry_for(self, path: Path, text: str) -> Dict:
+        front_matter = parse_front_matter(text)
+        stat = path.stat()
+        return {
+            'title': front_matter.get('title', ''),
+            'topics': front_matter.get('topics', []),
+            'published': front_matter.get('published', False),
+            'hash': content_hash(text),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+
+    def refresh(self) -> 'ArticleIndex':
+        """
+        ファイルの更新日時・サイズが変わった記事だけを読み直してインデックスを更新
+
+        Returns:
+            ArticleIndex: 自身（index = ArticleIndex(path).refresh() のように使う）
+        """
+        seen = set()
+        if self.articles_dir.is_dir():
+            with os.scandir(self.articles_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.md') or not entry.is_file():
+                        continue
+                    slug = entry.name[:-3]
+                    seen.add(slug)
+                    stat = entry.stat()
+                    cached = self.entries.get(slug)
+                    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                        continue
+                    path = Path(entry.path)
+                    self.entries[slug] = self._entry_for(path, path.read_text(encoding='utf-8'))
+                    # コミットした内容は引き継ぐ（書き込み後にコミットできなかった場合は hash と異なる）
+                    if cached and 'committed_hash' in cached:
+                        self.entries[slug]['committed_hash'] = cached['committed_hash']
+                        self.entries[slug]['commit'] = cached['commit']
+                    self._dirty = True
+
+        # 削除された記事
+        for slug in set(self.entries) - seen:
+            del self.entries[slug]
+            self._dirty = True
+
+        self._rebuild_titles()
+        return self
+
+    def _rebuild_titles(self) -> None:
+        self._titles = {}
+        for slug, entry in sorted(self.entries.items()):
+            self._titles.setdefault(entry['title'], slug)
+
+    def save(self) -> None:
+        """変更があればインデックスを保存"""
+        if not self._dirty:
+            return
+        save_json(self.path, {
+            'version': INDEX_VERSION,
+            'repo_path': str(self.repo_path.resolve()),
+            'commits': self.commits,
+            'pushed': self.pushed,
+            'articles': self.entries
+        })
+        self._dirty = False
+
+    def get(self, slug: str) -> Optional[Dict]:
+        """スラッグの記事情報（なければNone）"""
+        return self.entries.get(slug)
+
+    def find_by_title(self, title: str) -> Optional[str]:
+        """タイトルが一致する記事のスラッグ（なければNone）"""
+        return self._titles.get(title)
+
+    def is_unchanged(self, slug: str, text: str) -> bool:
+        """記事ファイルの内容が text と同じかどうか（refresh 済みのハッシュで比較）"""
+        entry = self.entries.get(slug)
+        return bool(entry) and entry['hash'] == content_hash(text)
+
+    def is_pushed(self, slug: str) -> bool:
+        """記事ファイルの内容がコミット・プッシュ済みかどうか（gitは実行しない）"""
+        entry = self.entries.get(slug)
+        return (
+            bool(entry)
+            and entry.get('committed_hash') == entry['hash']
+            and entry['commit'] <= self.pushed
+        )
+
+    def unique_slug(self, slug: str, reserved: Iterable[str] = ()) -> str:
+        """
+        既存の記事と重複しないスラッグ（重複する場合は -2, -3, ... を付ける）
+
+        Args:
+            slug: 元のスラッグ
+            reserved: インデックスにはまだないが使用中のスラッグ（一括投稿で先に書き込んだ記事など）
+        """
+        reserved = set(reserved)
+        if slug not in self.entries and slug not in reserved:
+            return slug
+        number = 2
+        while True:
+            suffix = f'-{number}'
+            candidate = slug[:MAX_SLUG_LENGTH - len(suffix)].rstrip('-') + suffix
+            if candidate not in self.entries and candidate not in reserved:
+                return candidate
+            number += 1
+
+    def add_commit(self) -> int:
+        """コミットの通し番号を進めて返す（記事を record する前に呼ぶ）"""
+        self.commits += 1
+        self._dirty = True
+        return self.commits
+
+    def record(self, slug: str, path: Path, text: str) -> None:
+        """コミットした記事ファイルをインデックスに反映（add_commit の番号を記録）"""
+        old_title = self.entries.get(slug, {}).get('title')
+        self.entries[slug] = self._entry_for(Path(path), text)
+        self.entries[slug]['committed_hash'] = self.entries[slug]['hash']
+        self.entries[slug]['commit'] = self.commits
+        self._dirty = True
+        if old_title is not None and old_title != self.entries[slug]['title']:
+            self._rebuild_titles()
+        else:
+            self._titles.setdefault(self.entries[slug]['title'], slug)
+
+    def mark_committed(self, slug: str) -> None:
+        """git status でコミット済みと確認した記事ファイルを記録（インデックスにない過去のコミット）"""
+        entry = self.entries[slug]
+        if entry.get('committed_hash') != entry['hash']:
+            entry['committed_hash'] = entry['hash']
+            entry['commit'] = self.commits
+            self._dirty = True
+
+    def mark_pushed(self, commit: int) -> None:
+        """通し番号 commit までのコミットをプッシュ済みとして記録"""
+        if commit > self.pushed:
+            self.pushed = commit
+            self._dirty = True
+
+    def list(self) -> List[Dict]:
+        """記事の一覧（スラッグ順）"""
+        return [dict(entry, slug=slug) for slug, entry in sorted(self.entries.items())]
+
+
+def load_article_index(repo_path: Path) -> ArticleIndex:
+    """インデックスを読み込み、変更のあった記事を反映して返す"""
+    return ArticleIndex(repo_path).refresh()
+
+
+def record_push(repo_path: Path, commit: int) -> None:
+    """
+    プッシュに成功したことを記録（リポジトリのロックの外で呼ぶ）
+
+    Args:
+        repo_path: Zenn連携リポジトリのパス
+        commit: プッシュを始める前のインデックスの commits（この番号までのコミットはHEADに含まれる）
+    """
+    with RepoLock(repo_path):
+        index = ArticleIndex(repo_path)
+        index.mark_pushed(commit)
+        index.save()
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Zenn連携リポジトリの記事インデックス')
+    parser.add_argument('repo_path', nargs='?', help='リポジトリのパス（省略時は ZENN_GITHUB_REPO_PATH）')
+    parser.add_argument('--title', type=str, help='タイトルが一致する記事のスラッグを表示')
+
+    args = parser.parse_args()
+
+    repo_path = args.repo_path or os.getenv('ZENN_GITHUB_REPO_PATH')
+    if not repo_path:
+        parser.error('リポジトリのパスを指定するか、ZENN_GITHUB_REPO_PATHを.envに設定してください')
+
+    index = load_article_index(Path(repo_path))
+    index.save()
+
+    if args.title:
+        slug = index.find_by_title(args.title)
+        if not slug:
+            print(f"❌ 記事が見つかりません: {args.title}")
+            sys.exit(1)
+        print(slug)
+        return
+
+    articles = index.list()
+    print(f"📚 {len(articles)}件の記事（インデックス: {index.path}）")
+    for article in articles:
+        status = '公開' if article['published'] else '下書き'
+        print(f"  {article['slug']}  [{status}] {article['title']}")
+
+
+if __name__ == '__main__':
+    main()
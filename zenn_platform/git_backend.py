@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn連携リポジトリのgit操作
+記事ファイルのステージ・コミット・プッシュを行うバックエンド
+
+- cli: git add / git commit を実行する（デフォルト）
+- plumbing: 一括投稿の全記事を hash-object / fast-import / update-index の各1回で
+  コミットする。記事ごとにコミットする場合もgitの起動回数は記事数に依存しない
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# (コミットメッセージ, コミットするファイル) のリスト
+Commits = List[Tuple[str, List[Path]]]
+
+
+def run_git(repo_path: Path, args: List[str], input: Optional[str] = None) -> subprocess.CompletedProcess:
+    """
+    リポジトリでgitコマンドを実行
+
+    Raises:
+        Exception: コマンドが失敗した場合（「git <サブコマンド>失敗」）
+    """
+    result = subprocess.run(
+        ['git'] + args,
+        cwd=repo_path,
+        input=input,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace'
+    )
+    if result.returncode != 0:
+        raise Exception(f"git {args[0]}失敗: {result.stderr}")
+    return result
+
+
+class CliGitBackend:
+    """git add / git commit によるコミット"""
+
+    name = 'cli'
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.repo_path.resolve())
+        return path.as_posix()
+
+    def status(self, paths: List[Path]) -> Tuple[List[Path], bool]:
+        """
+        ファイルがコミット済みかどうかと、ブランチが上流より進んでいるかを1回の git status で確認
+
+        Returns:
+            (HEADと内容が異なる・未コミットのファイル（paths の要素）, 上流ブランチにないコミットがあるかどうか)
+        """
+        if not paths:
+            return [], False
+
+        relative = {self._relative(path): path for path in paths}
+        output = run_git(
+            self.repo_path,
+            ['status', '--porcelain=v2', '-z', '--branch', '--untracked-files=all', '--'] + list(relative)
+        ).stdout
+
+        dirty = []
+        upstream = False
+        ahead = None
+        records = iter(output.split('\0'))
+        for record in records:
+            if record.startswith('# branch.upstream '):
+                upstream = True
+            elif record.startswith('# branch.ab '):
+                ahead = int(record.split()[2]) > 0
+            elif record.startswith(('1 ', '2 ', 'u ', '? ')):
+                # 1: 変更, 2: 名前の変更（元のパスが次に続く）, u: 競合, ?: 未追跡
+                fields = {'1': 8, '2': 9, 'u': 10, '?': 1}[record[0]]
+                path = record.split(' ', fields)[fields]
+                if record[0] == '2':
+                    next(records, None)
+                if path in relative:
+                    dirty.append(relative[path])
+
+        # 上流ブランチが削除されている場合（ab が出力されない）はプッシュが必要とみなす
+        return dirty, upstream and ahead is not False
+
+    def _has_staged_changes(self, paths: Optional[List[Path]] = None) -> bool:
+        """ステージ済みの変更があるかどうか（paths指定時はそのファイルのみ）"""
+        args = ['git', 'diff', '--cached', '--quiet']
+        if paths:
+            args += ['--'] + [str(path) for path in paths]
+        return subprocess.run(args, cwd=self.repo_path, capture_output=True).returncode != 0
+
+    def _commit(self, message: str, paths: List[Path]) -> bool:
+        # コミットするものがない場合はエラーではない
+        if not self._has_staged_changes(paths):
+            print("⚠️  コミットする変更がありません")
+            return False
+
+        run_git(self.repo_path, ['commit', '-m', message, '--'] + [str(path) for path in paths])
+        return True
+
+    def commit(self, commits: Commits) -> int:
+        """
+        ファイルをまとめてステージし、コミットを順に作成
+
+        Returns:
+            int: 作成したコミット数（変更がないコミットは作成しない）
+        """
+        paths = list(dict.fromkeys(path for _, files in commits for path in files))
+        if not paths:
+            return 0
+
+        run_git(self.repo_path, ['add', '--'] + [str(path) for path in paths])
+        return sum(self._commit(message, files) for message, files in commits)
+
+    def push(self) -> None:
+        run_git(self.repo_path, ['push'])
+
+
+class PlumbingGitBackend(CliGitBackend):
+    """
+    gitの低レベルコマンドによるコミット
+
+    1. hash-object --stdin-paths で全ファイルのblobを作成（git add と同じ改行コード変換）
+    2. ls-tree でHEADのblobを取得し、内容が変わらないファイルを除外（メモリ上で比較）
+    3. fast-import に全コミットを1つのストリームで渡し、ブランチを更新
+    4. update-index でインデックスをHEADに合わせる
+    """
+
+    name = 'plumbing'
+
+    def _head(self) -> Tuple[Optional[str], Optional[str]]:
+        """(ブランチのref, HEADのコミット)。detached HEADの場合はrefがNone、初回コミット前はコミットがNone"""
+        ref = subprocess.run(
+            ['git', 'symbolic-ref', '-q', 'HEAD'], cwd=self.repo_path, capture_output=True, text=True
+        ).stdout.strip() or None
+        head = subprocess.run(
+            ['git', 'rev-parse', '-q', '--verify', 'HEAD^{commit}'], cwd=self.repo_path, capture_output=True, text=True
+        ).stdout.strip() or None
+        return ref, head
+
+    def _head_blobs(self, head: Optional[str], paths: List[str]) -> Dict[str, str]:
+        """HEADでの各ファイルのblob（パス → ハッシュ）"""
+        if not head:
+            return {}
+        top_dirs = sorted({path.split('/')[0] for path in paths})
+        output = run_git(self.repo_path, ['ls-tree', '-r', '-z', head, '--'] + top_dirs).stdout
+        blobs = {}
+        for entry in output.split('\0'):
+            info, _, path = entry.partition('\t')
+            parts = info.split()
+            if len(parts) == 3 and parts[1] == 'blob':
+                blobs[path] = parts[2]
+        return blobs
+
+    def commit(self, commits: Commits) -> int:
+        ref, head = self._head()
+        if not ref:
+            # detached HEADではブランチを更新できないため通常のコミットを行う
+            return super().commit(commits)
+
+        paths = list(dict.fromkeys(self._relative(path) for _, files in commits for path in files))
+        if not paths:
+            return 0
+
+        blob_output = run_git(self.repo_path, ['hash-object', '-w', '--stdin-paths'], input='\n'.join(paths) + '\n')
+        blobs = dict(zip(paths, blob_output.stdout.split()))
+        tree = self._head_blobs(head, paths)
+        ident = run_git(self.repo_path, ['var', 'GIT_COMMITTER_IDENT']).stdout.strip()
+
+        stream = []
+        count = 0
+        for message, files in commits:
+            changes = []
+            for path in dict.fromkeys(self._relative(path) for path in files):
+                if tree.get(path) != blobs[path]:
+                    changes.append(f"M 100644 {blobs[path]} {path}\n")
+                    tree[path] = blobs[path]
+            if not changes:
+                print("⚠️  コミットする変更がありません")
+                continue
+
+            data = message.encode('utf-8')
+            stream.append(f"commit {ref}\ncommitter {ident}\n".encode('utf-8'))
+            stream.append(f"data {len(data)}\n".encode('utf-8') + data + b"\n")
+            if count == 0 and head:
+                stream.append(f"from {head}\n".encode('utf-8'))
+            stream.append(''.join(changes).encode('utf-8') + b"\n")
+            count += 1
+
+        if not count:
+            return 0
+
+        stream.append(b"done\n")
+        result = subprocess.run(
+            ['git', 'fast-import', '--quiet', '--done'],
+            cwd=self.repo_path,
+            input=b''.join(stream),
+            capture_output=True
+        )
+        if result.returncode != 0:
+            raise Exception(f"git fast-import失敗: {result.stderr.decode('utf-8', errors='replace')}")
+
+        # 作業ツリーのファイルは新しいコミットと同じ内容なので、インデックスを合わせる
+        run_git(self.repo_path, ['update-index', '--add', '--stdin'], input='\n'.join(paths) + '\n')
+        return count
+
+
+BACKENDS = {
+    CliGitBackend.name: CliGitBackend,
+    PlumbingGitBackend.name: PlumbingGitBackend,
+}
+
+
+def get_git_backend(repo_path: Path, name: Optional[str] = None) -> CliGitBackend:
+    """
+    gitのバックエンドを取得
+
+    Args:
+        repo_path: Zenn連携リポジトリのパス
+        name: 'cli' または 'plumbing'（省略時は環境変数 ZENN_GIT_BACKEND、デフォルト: cli）
+    """
+    name = (name or os.getenv('ZENN_GIT_BACKEND', 'cli')).lower()
+    if name not in BACKENDS:
+        print(f"⚠️  不明なgitバックエンドです（cliを使用します）: {name}")
+        name = 'cli'
+    return BACKENDS[name](repo_path)
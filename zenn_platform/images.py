@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn記事の画像の取り込み
+本文中のローカル画像（![alt](./figure.png)）をリポジトリの images/ に内容のハッシュ名でコピーし、
+参照を /images/<ハッシュ>.<拡張子> に書き換える。同じ画像は記事をまたいで1ファイルにまとめる
+
+ZENN_IMAGE_FORMAT=webp を設定するとPNG/JPEGをWebPに変換する（Pillowが必要、複数プロセスで並列に変換）
+"""
+
+import os
+import io
+import re
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Pillowはオプション（インストールされていない場合は画像を変換せずにコピーする）
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Markdownの画像: ![alt](パス) / ![alt](パス "タイトル") / ![alt](パス =250x)
+IMAGE_PATTERN = re.compile(r'(!\[[^\]]*\]\()(<[^>]+>|[^)\s]+)((?:\s+[^)]*)?\))')
+
+# 変換の対象にする画像の拡張子
+CONVERTIBLE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Zennにアップロードできる画像の最大サイズ（バイト）
+MAX_IMAGE_BYTES = 3 * 1024 * 1024
+
+# ファイル名に使うハッシュの長さ
+HASH_LENGTH = 16
+
+
+def get_image_format() -> Optional[str]:
+    """画像の変換先の形式（環境変数 ZENN_IMAGE_FORMAT、'webp' のみ対応。省略時は変換しない）"""
+    image_format = os.getenv('ZENN_IMAGE_FORMAT', '').lower()
+    return image_format if image_format == 'webp' else None
+
+
+def get_image_quality() -> int:
+    """変換時の画質（環境変数 ZENN_IMAGE_QUALITY、デフォルト: 80）"""
+    return int(os.getenv('ZENN_IMAGE_QUALITY', '80'))
+
+
+def is_local_image(ref: str) -> bool:
+    """リポジトリに取り込む必要があるローカル画像の参照かどうか"""
+    ref = ref.strip('<>')
+    return not (
+        re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*:', ref)  # http:, https:, data: など
+        or ref.startswith(('//', '/images/', '#'))
+    )
+
+
+def find_local_images(content: str) -> List[str]:
+    """本文中のローカル画像の参照（出現順・重複なし）"""
+    refs = [match.group(2) for match in IMAGE_PATTERN.finditer(content)]
+    return list(dict.fromkeys(ref for ref in refs if is_local_image(ref)))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _store_image(source: str, images_dir: str, image_format: Optional[str], quality: int) -> str:
+    """
+    画像を images/ に内容のハッシュ名で保存し、ファイル名を返す（プロセスプールから呼ぶ）
+
+    名前は元の画像のハッシュから決めるため、変換の有無にかかわらず同じ画像は同じ名前になる
+    """
+    source_path = Path(source)
+    data = source_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    extension = source_path.suffix.lower() or '.png'
+
+    convert = bool(image_format and Image is not None and extension in CONVERTIBLE_EXTENSIONS)
+    original_name = f"{digest}{extension}"
+    # 変換で大きくなる画像は元の形式で保存しているため、両方の名前を確認してから変換する
+    candidates = [f"{digest}.{image_format}", original_name] if convert else [original_name]
+    for name in candidates:
+        if (Path(images_dir) / name).exists():
+            return name
+
+    name = original_name
+    if convert:
+        with Image.open(io.BytesIO(data)) as image:
+            output = io.BytesIO()
+            image.save(output, format=image_format.upper(), quality=quality, method=6)
+        converted = output.getvalue()
+        # 変換で大きくなる場合は元の形式のまま保存
+        if len(converted) < len(data):
+            name = candidates[0]
+            data = converted
+
+    _write_atomic(Path(images_dir) / name, data)
+    return name
+
+
+def prepare_images(
+    articles: List[Tuple[str, Path]],
+    images_dir: Path,
+    image_format: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> List[Tuple[str, List[str]]]:
+    """
+    記事の本文中のローカル画像を images/ に取り込み、参照を書き換える
+
+    Args:
+        articles: (本文, 画像の相対パスの基準ディレクトリ) のリスト
+        images_dir: リポジトリの images ディレクトリ
+        image_format: 変換先の形式（'webp'、省略時は環境変数 ZENN_IMAGE_FORMAT）
+        max_workers: 変換に使うプロセス数（省略時はCPU数）
+
+    Returns:
+        記事ごとの (書き換えた本文, 参照している images/ 内のファイル名のリスト)
+
+    Raises:
+        Exception: 画像ファイルが見つからない場合
+    """
+    image_format = image_format or get_image_format()
+    if image_format and Image is None:
+        print("⚠️  Pillowがインストールされていないため、画像を変換せずにコピーします")
+        image_format = None
+
+    # 全記事の画像を集め、同じファイルは1回だけ処理する
+    sources: Dict[Tuple[int, str], Path] = {}
+    for i, (content, base_dir) in enumerate(articles):
+        for ref in find_local_images(content):
+            path = (Path(base_dir) / ref.strip('<>')).resolve()
+            if not path.is_file():
+                raise Exception(f"画像ファイルが見つかりません: {ref}（{path}）")
+            if path.stat().st_size > MAX_IMAGE_BYTES:
+                print(f"⚠️  3MBを超える画像はZennで表示できない場合があります: {ref}")
+            sources[(i, ref)] = path
+
+    if not sources:
+        return [(content, []) for content, _ in articles]
+
+    images_dir = Path(images_dir)
+    images_dir.mkdir(parents=True, exist_ok=True)
+    unique = sorted({str(path) for path in sources.values()})
+    args = (str(images_dir), image_format, get_image_quality())
+
+    if image_format and len(unique) > 1:
+        # 変換はCPUを使うため複数プロセスで並列に行う
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            names = dict(zip(unique, executor.map(_store_image, unique, *[[arg] * len(unique) for arg in args])))
+    else:
+        names = {source: _store_image(source, *args) for source in unique}
+
+    print(f"🖼️  画像を取り込みました: {len(unique)}件 → {images_dir}")
+
+    results = []
+    for i, (content, _) in enumerate(articles):
+        def replace(match):
+            ref = match.group(2)
+            if (i, ref) not in sources:
+                return match.group(0)
+            return f"{match.group(1)}/images/{names[str(sources[(i, ref)])]}{match.group(3)}"
+
+        rewritten = IMAGE_PATTERN.sub(replace, content)
+        used = [names[str(sources[(i, ref)])] for ref in find_local_images(content)]
+        results.append((rewritten, list(dict.fromkeys(used))))
+    return results
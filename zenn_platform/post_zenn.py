@@ -8,18 +8,10 @@ Seleniumを使用したブラウザ自動操作でZennに記事を投稿
 import os
 import sys
 import io
-import time
 from pathlib import Path
 from typing import Dict, Optional
 from dotenv import load_dotenv
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
 # Windows環境での標準出力エンコーディング設定
 if sys.platform == 'win32':
@@ -29,9 +21,127 @@ if sys.platform == 'win32':
 # プロジェクトルートのパスを追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from browser_common.artifacts import ArtifactRecorder
+from browser_common.options import build_chrome_options
+from browser_common.pool import get_browser_pool
+from browser_common.text_input import set_value
+from browser_common.waits import (
+    DEFAULT_TIMEOUT,
+    SHORT_TIMEOUT,
+    wait_for_clickable,
+    wait_for_resources_idle,
+    wait_for_url_change,
+    wait_until
+)
+from local_cache import get_cache_dir
+
 # 環境変数読み込み
 load_dotenv()
 
+ZENN_LOGIN_URL = "https://zenn.dev/enter"
+ZENN_NEW_ARTICLE_URL = "https://zenn.dev/articles/new"
+
+# 記事作成ページのタイトル入力欄
+TITLE_INPUT_LOCATOR = (By.CSS_SELECTOR, "input[placeholder*='タイトル']")
+
+
+def get_user_data_dir() -> Path:
+    """
+    ログイン状態を保存するChromeプロファイルのディレクトリを取得
+
+    環境変数 ZENN_USER_DATA_DIR で変更可能（デフォルト: ~/.sns-auto-post/zenn/chrome-profile）
+    """
+    user_data_dir = os.getenv('ZENN_USER_DATA_DIR')
+    if user_data_dir:
+        return Path(user_data_dir)
+    return get_cache_dir('zenn', 'chrome-profile')
+
+
+def build_zenn_chrome_options(headless: bool = False, reuse_session: bool = True):
+    """
+    Zenn投稿用のChromeオプションを作成
+
+    reuse_session時はログイン状態を保持する専用プロファイルを使用する。
+    """
+    user_data_dir = get_user_data_dir() if reuse_session else None
+    if user_data_dir:
+        print(f"🗂️  ブラウザプロファイル: {user_data_dir}")
+    return build_chrome_options(headless=headless, user_data_dir=user_data_dir, site='zenn')
+
+
+def _login(driver, email: str, password: str) -> None:
+    """
+    Zennにメールアドレスとパスワードでログイン
+
+    Raises:
+        Exception: ログインに失敗した場合
+    """
+    print("🔐 Zennにログイン中...")
+    if '/enter' not in driver.current_url:
+        driver.get(ZENN_LOGIN_URL)
+
+    # メールアドレスでログインボタンをクリック
+    email_login_button = wait_for_clickable(
+        driver, (By.XPATH, "//button[contains(text(), 'メールアドレスでログイン')]")
+    )
+    if not email_login_button:
+        raise Exception("「メールアドレスでログイン」ボタンが見つかりません")
+    email_login_button.click()
+
+    # メールアドレスとパスワードを入力
+    email_input = wait_for_clickable(driver, (By.CSS_SELECTOR, "input[type='email']"))
+    if not email_input:
+        raise Exception("メール入力欄が見つかりません")
+    email_input.send_keys(email)
+
+    password_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+    password_input.send_keys(password)
+
+    # ログインボタンをクリック
+    login_url = driver.current_url
+    driver.find_element(By.XPATH, "//button[@type='submit']").click()
+
+    # ログイン完了（ログインページからの遷移）を待つ
+    print("⏳ ログイン処理中...")
+    if not wait_for_url_change(driver, login_url, timeout=DEFAULT_TIMEOUT * 2):
+        raise Exception("ログインに失敗しました")
+    print("✅ ログイン成功")
+
+
+def _open_editor(driver) -> Optional[str]:
+    """
+    記事作成ページを開く
+
+    Returns:
+        'editor': 記事作成ページに到達した
+        'login': ログインページにリダイレクトされた（未ログイン・セッション期限切れ）
+        None: 記事作成ページに到達できなかった
+    """
+    def editor_or_login(d):
+        if '/enter' in d.current_url:
+            return 'login'
+        if d.find_elements(*TITLE_INPUT_LOCATOR):
+            return 'editor'
+        return False
+
+    driver.get(ZENN_NEW_ARTICLE_URL)
+    return wait_until(driver, editor_or_login)
+
+
+def _click_and_wait(driver, button) -> str:
+    """
+    公開・下書き保存ボタンをクリックし、保存が終わるまで待機
+
+    Returns:
+        str: 保存後のURL
+    """
+    before_url = driver.current_url
+    button.click()
+    # 保存後は記事の編集URLに遷移する。遷移しない場合も通信が落ち着くまで待つ
+    wait_for_url_change(driver, before_url, timeout=SHORT_TIMEOUT)
+    wait_for_resources_idle(driver)
+    return driver.current_url
+
 
 def post_to_zenn(
     title: str,
@@ -40,7 +150,8 @@ def post_to_zenn(
     topics: Optional[list] = None,
     published: bool = True,
     headless: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    reuse_session: bool = True
 ) -> Dict:
     """
     Zennに記事を投稿
@@ -53,6 +164,7 @@ def post_to_zenn(
         published: Trueの場合、公開記事として投稿（デフォルト: True）
         headless: Trueの場合、ヘッドレスモードで実行
         dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+        reuse_session: Trueの場合、専用のChromeプロファイルにログイン状態を保存して次回以降も再利用する
 
     Returns:
         投稿情報の辞書
@@ -97,198 +209,108 @@ def post_to_zenn(
         raise ValueError('ZENN_EMAILとZENN_PASSWORDを.envに設定してください')
 
     # Chrome オプション設定
-    chrome_options = Options()
-
-    # Windows環境でのChrome実行パスを明示的に指定
-    if sys.platform == 'win32':
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        if os.path.exists(chrome_path):
-            chrome_options.binary_location = chrome_path
-        else:
-            # 32bit版のパスも試す
-            chrome_path_x86 = r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
-            if os.path.exists(chrome_path_x86):
-                chrome_options.binary_location = chrome_path_x86
-
-    if headless:
-        chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-
-    # 環境変数からヘッドレスモード設定を読み込み
-    headless_env = os.getenv('BROWSER_HEADLESS', 'false').lower() == 'true'
-    if headless_env and not headless:
-        headless = True
-        chrome_options.add_argument('--headless')
+    chrome_options = build_zenn_chrome_options(headless, reuse_session)
 
+    # 起動済みのChromeがあれば再利用（投稿ごとに起動・終了しない）
+    pool = get_browser_pool()
+    # スクリーンショットは失敗時のみ（BROWSER_ARTIFACTS=all で途中経過も）
+    artifacts = ArtifactRecorder('zenn')
     driver = None
+    failed = False
 
     try:
         # WebDriverの初期化
         print("🌐 ブラウザを起動中...")
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        wait = WebDriverWait(driver, 20)
-
-        # Zennログインページにアクセス
-        print("🔐 Zennにログイン中...")
-        driver.get("https://zenn.dev/enter")
-        time.sleep(2)
-
-        # メールアドレスでログインボタンをクリック
-        email_login_button = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'メールアドレスでログイン')]"))
-        )
-        email_login_button.click()
-        time.sleep(1)
-
-        # メールアドレスとパスワードを入力
-        email_input = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']"))
-        )
-        email_input.send_keys(email)
-
-        password_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-        password_input.send_keys(password)
-
-        # ログインボタンをクリック
-        login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-        login_button.click()
-
-        print("⏳ ログイン処理中...")
-        time.sleep(5)
+        driver = pool.acquire(chrome_options)
 
-        # ログイン成功を確認
-        try:
-            wait.until(EC.url_changes("https://zenn.dev/enter"))
-            print("✅ ログイン成功")
-        except:
-            raise Exception("ログインに失敗しました")
-
-        # 新規記事作成ページに移動
+        # 保存済みのセッションで記事作成ページを開く（ログイン済みならログインを省略）
         print("📝 記事作成ページに移動中...")
-        driver.get("https://zenn.dev/articles/new")
-        time.sleep(3)
+        editor_state = _open_editor(driver)
+        if editor_state != 'editor':
+            # セッションがない・期限切れの場合のみログイン
+            if editor_state == 'login':
+                print("🔑 ログインが必要です（保存済みセッションなし・期限切れ）")
+            _login(driver, email, password)
+            print("📝 記事作成ページに移動中...")
+            editor_state = _open_editor(driver)
+        if editor_state != 'editor':
+            raise Exception("記事作成ページに到達できませんでした")
+        artifacts.checkpoint(driver, 'editor')
 
         # タイトルを入力
         print(f"✍️  タイトルを入力: {title}")
-        title_input = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='タイトル']"))
-        )
-        title_input.clear()
-        title_input.send_keys(title)
-        time.sleep(1)
+        title_input = driver.find_element(*TITLE_INPUT_LOCATOR)
+        set_value(driver, title_input, title)
 
         # 絵文字を設定（もし絵文字選択UIがある場合）
         if emoji:
-            try:
-                print(f"😀 絵文字を設定: {emoji}")
-                # 絵文字入力欄を探して設定
-                # 実際のUIに応じて調整が必要
-                time.sleep(1)
-            except:
-                print("⚠️  絵文字の設定をスキップしました")
+            # 絵文字入力欄を探して設定
+            # 実際のUIに応じて調整が必要
+            print(f"😀 絵文字を設定: {emoji}")
 
         # 本文を入力
         print(f"✍️  本文を入力（{len(content)}文字）...")
         # Zennのエディタはテキストエリアまたはコンテンツエディタブルな要素
-        try:
-            # テキストエリアを探す
-            content_area = driver.find_element(By.CSS_SELECTOR, "textarea")
-            content_area.clear()
-            content_area.send_keys(content)
-        except:
-            # contenteditable要素を探す
-            content_area = driver.find_element(By.CSS_SELECTOR, "[contenteditable='true']")
-            content_area.clear()
-            content_area.send_keys(content)
-
-        time.sleep(2)
+        # send_keysは1文字ずつキーイベントを送るため遅く、絵文字も送れないので一括で設定する
+        content_areas = (
+            driver.find_elements(By.CSS_SELECTOR, "textarea")
+            or driver.find_elements(By.CSS_SELECTOR, "[contenteditable='true']")
+        )
+        if not content_areas:
+            raise Exception("本文入力欄が見つかりません")
+        method = set_value(driver, content_areas[0], content)
+        print(f"   📝 入力方法: {method}")
 
         # トピック（タグ）を設定
         if topics:
+            # トピック入力欄を探して設定
+            # 実際のUIに応じて調整が必要
             print(f"🏷️  トピックを設定: {', '.join(topics)}")
-            try:
-                # トピック入力欄を探して設定
-                # 実際のUIに応じて調整が必要
-                time.sleep(1)
-            except:
-                print("⚠️  トピックの設定をスキップしました")
 
         # 公開設定
         if published:
             print("🌍 公開記事として投稿します")
-            try:
-                # 「公開する」ボタンを探してクリック
-                publish_button = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), '公開')]"))
-                )
-                publish_button.click()
-                time.sleep(3)
-
-                # 投稿完了を確認
-                print("⏳ 投稿処理中...")
-                time.sleep(3)
-
-                # 投稿後のURLを取得
-                current_url = driver.current_url
-                print(f"✅ 投稿完了")
-
-                return {
-                    'success': True,
-                    'url': current_url,
-                    'title': title,
-                    'emoji': emoji,
-                    'topics': topics,
-                    'published': published,
-                    'dry_run': False
-                }
-            except Exception as e:
-                raise Exception(f"公開処理に失敗しました: {e}")
+            # 「公開する」ボタンを探してクリック
+            publish_button = wait_for_clickable(driver, (By.XPATH, "//button[contains(text(), '公開')]"))
+            if not publish_button:
+                raise Exception("公開処理に失敗しました: 公開ボタンが見つかりません")
+
+            print("⏳ 投稿処理中...")
+            current_url = _click_and_wait(driver, publish_button)
+            print(f"✅ 投稿完了")
         else:
             print("💾 下書きとして保存します")
-            try:
-                # 「下書き保存」ボタンを探してクリック
-                save_button = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), '下書き')]"))
-                )
-                save_button.click()
-                time.sleep(3)
-
-                current_url = driver.current_url
-                print(f"✅ 下書き保存完了")
-
-                return {
-                    'success': True,
-                    'url': current_url,
-                    'title': title,
-                    'emoji': emoji,
-                    'topics': topics,
-                    'published': published,
-                    'dry_run': False
-                }
-            except Exception as e:
-                raise Exception(f"下書き保存に失敗しました: {e}")
+            # 「下書き保存」ボタンを探してクリック
+            save_button = wait_for_clickable(driver, (By.XPATH, "//button[contains(text(), '下書き')]"))
+            if not save_button:
+                raise Exception("下書き保存に失敗しました: 下書き保存ボタンが見つかりません")
+
+            current_url = _click_and_wait(driver, save_button)
+            print(f"✅ 下書き保存完了")
+
+        return {
+            'success': True,
+            'url': current_url,
+            'title': title,
+            'emoji': emoji,
+            'topics': topics,
+            'published': published,
+            'dry_run': False
+        }
 
     except Exception as e:
+        failed = True
         print(f"❌ エラーが発生しました: {e}")
         if driver:
-            try:
-                # エラー時のスクリーンショット保存
-                screenshot_path = f"zenn_error_{int(time.time())}.png"
-                driver.save_screenshot(screenshot_path)
-                print(f"📸 スクリーンショットを保存: {screenshot_path}")
-            except:
-                pass
+            # エラー時のスクリーンショット保存
+            artifacts.capture(driver, 'error')
         raise Exception(f"Zenn投稿エラー: {e}")
 
     finally:
+        # ブラウザをプールに返却（エラー時は再利用せずに終了）
         if driver:
-            print("🔚 ブラウザを終了します")
-            time.sleep(2)
-            driver.quit()
+            pool.release(driver, healthy=not failed)
+        artifacts.close()
 
 
 def main():
@@ -304,6 +326,7 @@ def main():
     parser.add_argument('--draft', action='store_true', help='下書きとして保存（公開しない）')
     parser.add_argument('--headless', action='store_true', help='ヘッドレスモードで実行')
     parser.add_argument('--dry-run', action='store_true', help='実際には投稿しない')
+    parser.add_argument('--no-reuse-session', action='store_true', help='ログインセッションを専用プロファイルに保存・再利用しない')
 
     args = parser.parse_args()
 
@@ -323,7 +346,8 @@ def main():
             topics=args.topics,
             published=not args.draft,
             headless=args.headless,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            reuse_session=not args.no_reuse_session
         )
 
         if result['success']:
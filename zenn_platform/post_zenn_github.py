@@ -9,7 +9,6 @@ import os
 import sys
 import io
 import re
-import subprocess
 import uuid
 from pathlib import Path
 from typing import Dict, Optional, List
@@ -24,6 +23,15 @@ if sys.platform == 'win32':
     if not isinstance(sys.stderr, io.TextIOWrapper):
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from zenn_platform.article_index import ArticleIndex, load_article_index, record_push
+from zenn_platform.git_backend import get_git_backend
+from zenn_platform.images import prepare_images
+from zenn_platform.push_queue import is_deferred_push_enabled, schedule_push
+from zenn_platform.repo_lock import PushLock, RepoLock
+
 # 環境変数読み込み
 load_dotenv()
 
@@ -119,6 +127,178 @@ published: {str(published).lower()}
     return frontmatter + content
 
 
+def get_repo_path() -> Path:
+    """
+    Zenn連携Gitリポジトリのパスを取得（環境変数 ZENN_GITHUB_REPO_PATH）
+
+    Raises:
+        ValueError: 環境変数が設定されていない・パスが存在しない場合
+    """
+    repo_path = os.getenv('ZENN_GITHUB_REPO_PATH')
+
+    if not repo_path:
+        raise ValueError('ZENN_GITHUB_REPO_PATHを.envに設定してください（Zenn連携Gitリポジトリのパス）')
+
+    repo_path = Path(repo_path)
+
+    # リポジトリパスの存在確認
+    if not repo_path.exists():
+        raise ValueError(f'指定されたリポジトリパスが存在しません: {repo_path}')
+
+    return repo_path
+
+
+def get_batch_commit_mode() -> str:
+    """
+    一括投稿時のコミット単位を取得（環境変数 ZENN_BATCH_COMMIT）
+
+    Returns:
+        'single': 全記事を1コミットにまとめる（デフォルト）
+        'per-article': 記事ごとにコミットする（プッシュは1回）
+    """
+    mode = os.getenv('ZENN_BATCH_COMMIT', 'single').lower()
+    return mode if mode in ('single', 'per-article') else 'single'
+
+
+def _render_articles(repo_path: Path, articles: List[Dict]) -> List[Dict]:
+    """
+    記事の内容（フロントマター＋本文）を生成
+
+    本文中のローカル画像は images/ に取り込み、参照を /images/... に書き換える。
+    リポジトリのロックの外で呼ぶ（画像は内容から決まるファイル名に一時ファイルから置き換えて
+    書き込むため、同じ画像を同時に取り込んでも壊れない）
+
+    Args:
+        repo_path: Zenn連携リポジトリのパス
+        articles: post_to_zenn_github と同じキーを持つ辞書のリスト（title, content は必須。
+            image_base_dir は画像の相対パスの基準ディレクトリ、省略時はカレントディレクトリ）
+
+    Returns:
+        記事ごとの、既定値を補った記事情報・生成した内容（'text'）・画像のパス（'images'）の辞書
+    """
+    images_dir = repo_path / 'images'
+    prepared = prepare_images(
+        [(article['content'], Path(article.get('image_base_dir') or '.')) for article in articles],
+        images_dir
+    )
+
+    results = []
+    for article, (content, image_names) in zip(articles, prepared):
+        rendered = {
+            'title': article['title'],
+            'emoji': article.get('emoji') or "📝",
+            'type': article.get('article_type') or "tech",
+            'topics': article.get('topics') or [],
+            'published': article.get('published', True),
+            'slug': article.get('slug'),
+            'images': [images_dir / name for name in image_names]
+        }
+        rendered['text'] = create_article_content(
+            title=rendered['title'],
+            content=content,
+            emoji=rendered['emoji'],
+            article_type=rendered['type'],
+            topics=rendered['topics'],
+            published=rendered['published']
+        )
+        results.append(rendered)
+    return results
+
+
+def _write_article(articles_dir: Path, rendered: Dict, index: ArticleIndex, pending: Dict[str, str]) -> Dict:
+    """
+    記事ファイルを書き込み、投稿情報の辞書を返す（リポジトリのロック内で呼ぶ）
+
+    スラッグの指定がない場合、同じタイトルの記事があればその記事を更新し、
+    なければ既存の記事と重複しないスラッグを生成する。
+    生成した内容（フロントマター＋本文）が既存のファイルと同じ場合は書き込まず、
+    'changed' をFalseにして返す（コミット済みかどうかは呼び出し側で確認する）
+
+    Args:
+        articles_dir: articlesディレクトリ
+        rendered: _render_articles の戻り値の要素
+        index: 記事インデックス（コミットに成功するまで書き込んだ記事は反映しない）
+        pending: この投稿で先に書き込んだ記事のタイトル → スラッグ（この記事も追加する）
+    """
+    title = rendered['title']
+    slug = rendered['slug']
+    if not slug:
+        slug = pending.get(title) or index.find_by_title(title)
+        if slug:
+            print(f"🔁 同じタイトルの記事を更新します: {slug}")
+        else:
+            slug = index.unique_slug(generate_slug(title), reserved=pending.values())
+    pending[title] = slug
+
+    # 記事ファイルのパス
+    article_file = articles_dir / f"{slug}.md"
+    article_content = rendered['text']
+
+    changed = True
+    if index.get(slug):
+        if index.is_unchanged(slug, article_content):
+            print(f"⏭️  変更がないためスキップ: {article_file.name}")
+            changed = False
+        else:
+            # ファイルが既に存在する場合は警告
+            print(f"⚠️  既存のファイルを上書きします: {article_file}")
+
+    if changed:
+        # ファイルに書き込み
+        print(f"📝 記事ファイルを作成: {article_file.name}")
+        article_file.write_text(article_content, encoding='utf-8')
+
+    return {
+        'success': True,
+        'file_path': str(article_file),
+        'slug': slug,
+        'title': title,
+        'emoji': rendered['emoji'],
+        'type': rendered['type'],
+        'topics': rendered['topics'],
+        'published': rendered['published'],
+        'images': [str(path) for path in rendered['images']],
+        'changed': changed,
+        'dry_run': False
+    }
+
+
+def _push(backend, defer_push: Optional[bool]) -> str:
+    """
+    コミットをプッシュ（defer_push時はバックグラウンドのプッシュに任せてすぐに戻る）
+
+    リポジトリのロックの外で呼ぶ。プッシュどうしはプッシュのロックで1つずつ行い、
+    その間も他の投稿はコミットできる（後からのプッシュは先にプッシュされた分を含めて送る）
+
+    Returns:
+        str: 'pushed'（プッシュ済み）または 'deferred'（バックグラウンドでプッシュ）
+    """
+    if defer_push is None:
+        defer_push = is_deferred_push_enabled()
+
+    if defer_push:
+        schedule_push(backend.repo_path)
+        return 'deferred'
+
+    print("⬆️  GitHubにプッシュ中...")
+    with PushLock(backend.repo_path):
+        # 記事インデックスに記録済みのコミットは、この時点のHEADに含まれる
+        commit = ArticleIndex(backend.repo_path).commits
+        backend.push()
+    record_push(backend.repo_path, commit)
+    print("✅ GitHubへのプッシュ完了")
+    return 'pushed'
+
+
+def _get_articles_dir(repo_path: Path) -> Path:
+    """articlesディレクトリを取得（なければ作成）"""
+    articles_dir = repo_path / 'articles'
+    if not articles_dir.exists():
+        print(f"📁 articlesディレクトリを作成: {articles_dir}")
+        articles_dir.mkdir(parents=True)
+    return articles_dir
+
+
 def post_to_zenn_github(
     title: str,
     content: str,
@@ -127,11 +307,17 @@ def post_to_zenn_github(
     topics: Optional[List[str]] = None,
     published: bool = True,
     slug: Optional[str] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    defer_push: Optional[bool] = None,
+    git_backend: Optional[str] = None,
+    image_base_dir: Optional[str] = None
 ) -> Dict:
     """
     GitHub連携でZennに記事を投稿
 
+    本文中のローカル画像（![alt](./figure.png)）はリポジトリの images/ に取り込み、
+    記事と同じコミットに含める
+
     Args:
         title: 記事のタイトル
         content: 記事の本文（マークダウン形式）
@@ -141,6 +327,10 @@ def post_to_zenn_github(
         published: Trueの場合、公開記事として投稿（デフォルト: True）
         slug: 記事のスラッグ（省略時は自動生成）
         dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+        defer_push: Trueの場合、コミット後すぐに戻りバックグラウンドでプッシュする
+            （省略時は環境変数 ZENN_PUSH_MODE=deferred の場合のみ）
+        git_backend: gitの操作方法（'cli' / 'plumbing'、省略時は環境変数 ZENN_GIT_BACKEND）
+        image_base_dir: 本文中の画像の相対パスの基準ディレクトリ（省略時はカレントディレクトリ）
 
     Returns:
         投稿情報の辞書
@@ -149,6 +339,8 @@ def post_to_zenn_github(
             'file_path': str (成功時のみ),
             'slug': str,
             'title': str,
+            'push': str（'pushed' / 'deferred'、記事に変更がない場合はNone）,
+            'changed': bool（記事の内容が変わったかどうか、成功時のみ）,
             'dry_run': bool
         }
 
@@ -160,12 +352,10 @@ def post_to_zenn_github(
     if topics is None:
         topics = []
 
-    # スラッグを生成（指定がなければ自動生成）
-    if not slug:
-        slug = generate_slug(title)
-
     # Dry runモード
     if dry_run:
+        # スラッグを生成（指定がなければ自動生成）
+        slug = slug or generate_slug(title)
         print("🔍 [DRY RUN] 実際には投稿しません")
         print(f"  スラッグ: {slug}")
         print(f"  タイトル: {title}")
@@ -187,109 +377,226 @@ def post_to_zenn_github(
         }
 
     # 環境変数から設定を取得
-    repo_path = os.getenv('ZENN_GITHUB_REPO_PATH')
+    repo_path = get_repo_path()
 
-    if not repo_path:
-        raise ValueError('ZENN_GITHUB_REPO_PATHを.envに設定してください（Zenn連携Gitリポジトリのパス）')
+    try:
+        # 記事の内容の生成・画像の取り込みは他の投稿と並行して行う
+        rendered = _render_articles(repo_path, [{
+            'title': title,
+            'content': content,
+            'emoji': emoji,
+            'article_type': article_type,
+            'topics': topics,
+            'published': published,
+            'slug': slug,
+            'image_base_dir': image_base_dir
+        }])[0]
+        batch = _commit_batch(repo_path, [rendered], 'single', defer_push, git_backend)
+        result = batch['articles'][0]
+        result['push'] = batch['push']
 
-    repo_path = Path(repo_path)
+        # 内容が同じでコミット・プッシュ済みの場合はネットワークを使わない
+        if batch['commits'] or batch['push']:
+            print(f"📄 記事ファイル: {result['file_path']}")
 
-    # リポジトリパスの存在確認
-    if not repo_path.exists():
-        raise ValueError(f'指定されたリポジトリパスが存在しません: {repo_path}')
+        return result
 
-    # articlesディレクトリの確認・作成
-    articles_dir = repo_path / 'articles'
-    if not articles_dir.exists():
-        print(f"📁 articlesディレクトリを作成: {articles_dir}")
-        articles_dir.mkdir(parents=True)
+    except Exception as e:
+        print(f"❌ エラーが発生しました: {e}")
+        raise Exception(f"Zenn投稿エラー（GitHub方式）: {e}")
 
-    # 記事ファイルのパス
-    article_file = articles_dir / f"{slug}.md"
 
-    # ファイルが既に存在する場合は警告
-    if article_file.exists():
-        print(f"⚠️  既存のファイルを上書きします: {article_file}")
+def post_to_zenn_github_batch(
+    articles: List[Dict],
+    commit_mode: Optional[str] = None,
+    dry_run: bool = False,
+    defer_push: Optional[bool] = None,
+    git_backend: Optional[str] = None
+) -> Dict:
+    """
+    複数の記事をまとめてGitHub連携で投稿（git add・プッシュは1回）
 
-    try:
-        # マークダウンコンテンツを生成
-        article_content = create_article_content(
-            title=title,
-            content=content,
-            emoji=emoji,
-            article_type=article_type,
-            topics=topics,
-            published=published
-        )
+    全記事のファイルを書き込んでから1回の git add でステージし、
+    1コミット（または記事ごとのコミット）にまとめて1回だけプッシュする。
+    内容が変わらない記事はステージもコミットもしない（全記事が同じならgitを実行しない）。
 
-        # ファイルに書き込み
-        print(f"📝 記事ファイルを作成: {article_file.name}")
-        article_file.write_text(article_content, encoding='utf-8')
+    Args:
+        articles: 記事の辞書のリスト（post_to_zenn_github と同じキー。title, content は必須、
+            image_base_dir で画像の相対パスの基準ディレクトリを指定できる）
+        commit_mode: 'single'（全記事で1コミット）または 'per-article'（記事ごと）。
+            省略時は環境変数 ZENN_BATCH_COMMIT（デフォルト: single）
+        dry_run: Trueの場合、実際には投稿せずにシミュレーションのみ
+        defer_push: Trueの場合、コミット後すぐに戻りバックグラウンドでプッシュする
+            （省略時は環境変数 ZENN_PUSH_MODE=deferred の場合のみ）
+        git_backend: gitの操作方法（'cli' / 'plumbing'、省略時は環境変数 ZENN_GIT_BACKEND）
 
-        # Gitでコミット・プッシュ
-        print("🔄 Gitでコミット・プッシュ中...")
-
-        # git add
-        result = subprocess.run(
-            ['git', 'add', str(article_file)],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        if result.returncode != 0:
-            raise Exception(f"git add失敗: {result.stderr}")
-
-        # git commit
-        commit_message = f"Add article: {title}"
-        result = subprocess.run(
-            ['git', 'commit', '-m', commit_message],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        if result.returncode != 0:
-            # コミットするものがない場合はエラーではない
-            if 'nothing to commit' in result.stdout or 'nothing to commit' in result.stderr:
-                print("⚠️  コミットする変更がありません")
-            else:
-                raise Exception(f"git commit失敗: {result.stderr}")
-
-        # git push
-        print("⬆️  GitHubにプッシュ中...")
-        result = subprocess.run(
-            ['git', 'push'],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        if result.returncode != 0:
-            raise Exception(f"git push失敗: {result.stderr}")
+    Returns:
+        {
+            'success': bool,
+            'articles': 記事ごとの投稿情報のリスト,
+            'commits': int（作成したコミット数）,
+            'push': str（'pushed' / 'deferred'、コミットがない場合はNone）,
+            'dry_run': bool
+        }
 
-        print("✅ GitHubへのプッシュ完了")
-        print(f"📄 記事ファイル: {article_file}")
-        print("🔄 Zennが自動的に記事を同期します（数分かかる場合があります）")
+    Raises:
+        ValueError: 必要な環境変数が設定されていない場合
+        Exception: 投稿に失敗した場合
+    """
+    commit_mode = commit_mode or get_batch_commit_mode()
 
-        return {
-            'success': True,
-            'file_path': str(article_file),
-            'slug': slug,
-            'title': title,
-            'emoji': emoji,
-            'type': article_type,
-            'topics': topics,
-            'published': published,
-            'dry_run': False
-        }
+    if dry_run:
+        results = [
+            post_to_zenn_github(
+                title=article['title'],
+                content=article['content'],
+                emoji=article.get('emoji') or "📝",
+                article_type=article.get('article_type') or "tech",
+                topics=article.get('topics'),
+                published=article.get('published', True),
+                slug=article.get('slug'),
+                dry_run=True
+            )
+            for article in articles
+        ]
+        return {'success': True, 'articles': results, 'commits': 0, 'push': None, 'dry_run': True}
+
+    repo_path = get_repo_path()
+
+    try:
+        rendered = _render_articles(repo_path, articles)
+        return _commit_batch(repo_path, rendered, commit_mode, defer_push, git_backend)
 
     except Exception as e:
         print(f"❌ エラーが発生しました: {e}")
-        raise Exception(f"Zenn投稿エラー（GitHub方式）: {e}")
+        raise Exception(f"Zenn一括投稿エラー（GitHub方式）: {e}")
+
+
+def _commit_batch(
+    repo_path: Path,
+    rendered: List[Dict],
+    commit_mode: str,
+    defer_push: Optional[bool],
+    git_backend: Optional[str]
+) -> Dict:
+    """
+    一括投稿の記事ファイルを書き込み、コミット・プッシュ
+
+    インデックス・記事ファイル・gitの更新は他の投稿と1つずつ順番に行い（リポジトリのロック）、
+    プッシュはロックを解放してから行う。記事インデックスはコミットに成功してから保存する。
+    内容が同じ記事でも、前回のコミット・プッシュが失敗していればコミット・プッシュをやり直す
+    """
+    with RepoLock(repo_path):
+        backend, results, commits, ahead = _commit_locked(repo_path, rendered, commit_mode, git_backend)
+
+    # プッシュは1回だけ（前回プッシュできなかったコミットもここでプッシュする）
+    push = None
+    if commits or ahead:
+        if not commits:
+            print("⬆️  未プッシュのコミットがあるためプッシュします")
+        push = _push(backend, defer_push)
+        print("🔄 Zennが自動的に記事を同期します（数分かかる場合があります）")
+
+    return {'success': True, 'articles': results, 'commits': commits, 'push': push, 'dry_run': False}
+
+
+def _commit_locked(repo_path: Path, rendered: List[Dict], commit_mode: str, git_backend: Optional[str]):
+    """
+    記事ファイルを書き込み、変更のあった記事をコミット（リポジトリのロック内で呼ぶ）
+
+    Returns:
+        (gitバックエンド, 記事ごとの投稿情報, コミット数, 上流ブランチより進んでいるか)
+    """
+    articles_dir = _get_articles_dir(repo_path)
+    index = load_article_index(repo_path)
+    pending: Dict[str, str] = {}
+    results = [_write_article(articles_dir, article, index, pending) for article in rendered]
+    # 記事ファイルと、その記事が参照する画像を同じコミットに含める
+    files = [[Path(result['file_path'])] + [Path(image) for image in result['images']] for result in results]
+
+    # すべての記事がコミット・プッシュ済みの内容と同じ場合はgitを実行しない
+    if results and all(not result['changed'] and index.is_pushed(result['slug']) for result in results):
+        print("⏭️  すべての記事に変更がありません（コミット・プッシュ済み）")
+        index.save()
+        return None, results, 0, False
+
+    # HEADとの差分と上流ブランチとの差は1回の git status で確認する
+    backend = get_git_backend(repo_path, git_backend)
+    dirty, ahead = backend.status([path for paths in files for path in paths])
+    dirty = set(dirty)
+    if not ahead:
+        # 上流ブランチとの差がなければ、インデックスに記録したコミットはすべてプッシュ済み
+        index.mark_pushed(index.commits)
+    committed = []
+    for result, paths in zip(results, files):
+        if result['changed']:
+            continue
+        if dirty.intersection(paths):
+            print(f"📝 前回コミットされなかった変更をコミットします: {Path(result['file_path']).name}")
+            result['changed'] = True
+        else:
+            committed.append(result['slug'])
+
+    # インデックスにない過去のコミットの記事は、次の再投稿からgitを実行せずに確認できるよう記録
+    if committed and ahead:
+        index.add_commit()
+    for slug in committed:
+        index.mark_committed(slug)
+
+    changed = [(result, paths) for result, paths in zip(results, files) if result['changed']]
+    commits = 0
+    if changed:
+        # 変更のあった記事をまとめてステージ・コミット
+        print(f"🔄 {len(changed)}件の記事をコミット中（{commit_mode}、{backend.name}）...")
+        if commit_mode == 'per-article':
+            plan = [(f"Add article: {result['title']}", paths) for result, paths in changed]
+        else:
+            all_files = list(dict.fromkeys(path for _, paths in changed for path in paths))
+            if len(changed) == 1:
+                plan = [(f"Add article: {changed[0][0]['title']}", all_files)]
+            else:
+                titles = '\n'.join(f"- {result['title']}" for result, _ in changed)
+                plan = [(f"Add {len(changed)} articles\n\n{titles}", all_files)]
+        commits = backend.commit(plan)
+
+        index.add_commit()
+        for article, result in zip(rendered, results):
+            if result['changed']:
+                index.record(result['slug'], Path(result['file_path']), article['text'])
+    elif results:
+        print("⏭️  すべての記事に変更がありません")
+    index.save()
+    return backend, results, commits, ahead
+
+
+def load_batch_file(batch_file: str) -> List[Dict]:
+    """
+    一括投稿用のJSONファイルを読み込む
+
+    ファイルは記事の配列。各記事は title と content（または content_file）を持ち、
+    emoji / type / topics / published / slug を省略可能。content_file は
+    JSONファイルからの相対パスで指定できる。本文中の画像の相対パスは content_file
+    （content の場合はJSONファイル）のディレクトリが基準になる。
+    """
+    import json
+
+    batch_path = Path(batch_file)
+    articles = []
+    for item in json.loads(batch_path.read_text(encoding='utf-8')):
+        article = dict(item)
+        if 'type' in article:
+            article['article_type'] = article.pop('type')
+        content_file = article.pop('content_file', None)
+        if content_file:
+            content_path = batch_path.parent / content_file
+            article['content'] = content_path.read_text(encoding='utf-8')
+            article.setdefault('image_base_dir', str(content_path.parent))
+        else:
+            article.setdefault('image_base_dir', str(batch_path.parent))
+        if not article.get('title') or article.get('content') is None:
+            raise ValueError(f'title と content（または content_file）が必要です: {item}')
+        articles.append(article)
+    return articles
 
 
 def main():
@@ -297,7 +604,7 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='GitHub連携でZennに記事を投稿')
-    parser.add_argument('--title', type=str, required=True, help='記事のタイトル')
+    parser.add_argument('--title', type=str, help='記事のタイトル')
     parser.add_argument('--content', type=str, help='記事の本文（直接指定）')
     parser.add_argument('--content-file', type=str, help='記事の本文ファイルパス')
     parser.add_argument('--emoji', type=str, default='📝', help='記事の絵文字アイコン')
@@ -305,13 +612,40 @@ def main():
     parser.add_argument('--topics', type=str, nargs='+', help='トピック（タグ）のリスト（スペース区切り、最大5個）')
     parser.add_argument('--draft', action='store_true', help='下書きとして保存（公開しない）')
     parser.add_argument('--slug', type=str, help='記事のスラッグ（省略時は自動生成）')
+    parser.add_argument('--batch', type=str, help='複数記事を一括投稿するJSONファイル（プッシュは1回）')
+    parser.add_argument('--commit-mode', type=str, choices=['single', 'per-article'],
+                        help='一括投稿時のコミット単位（デフォルト: 環境変数 ZENN_BATCH_COMMIT または single）')
+    parser.add_argument('--git-backend', type=str, choices=['cli', 'plumbing'],
+                        help='gitの操作方法（デフォルト: 環境変数 ZENN_GIT_BACKEND または cli）')
+    parser.add_argument('--defer-push', action='store_true',
+                        help='コミット後すぐに終了し、バックグラウンドでプッシュする（ZENN_PUSH_MODE=deferred と同じ）')
     parser.add_argument('--dry-run', action='store_true', help='実際には投稿しない')
 
     args = parser.parse_args()
 
-    # 本文の取得
+    if args.batch:
+        try:
+            result = post_to_zenn_github_batch(
+                load_batch_file(args.batch),
+                commit_mode=args.commit_mode,
+                dry_run=args.dry_run,
+                defer_push=True if args.defer_push else None,
+                git_backend=args.git_backend
+            )
+            print(f"✅ {len(result['articles'])}件の記事を投稿しました（コミット: {result['commits']}件）")
+        except Exception as e:
+            print(f"❌ エラー: {e}")
+            sys.exit(1)
+        return
+
+    if not args.title:
+        parser.error('--title または --batch を指定してください')
+
+    # 本文の取得（本文中の画像の相対パスは本文ファイルのディレクトリが基準）
+    image_base_dir = None
     if args.content_file:
         content = Path(args.content_file).read_text(encoding='utf-8')
+        image_base_dir = str(Path(args.content_file).parent)
     elif args.content:
         content = args.content
     else:
@@ -326,7 +660,10 @@ def main():
             topics=args.topics,
             published=not args.draft,
             slug=args.slug,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            defer_push=True if args.defer_push else None,
+            git_backend=args.git_backend,
+            image_base_dir=image_base_dir
         )
 
         if result['success']:
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn連携リポジトリのバックグラウンドプッシュ
+記事はローカルにコミットしてすぐに戻り、未プッシュのコミットはバックグラウンドの
+プッシュ担当プロセスがまとめて1回でプッシュする（失敗時は間隔を空けて再試行）
+
+使用例:
+  python zenn_platform/push_queue.py status
+  python main.py --zenn-status
+"""
+
+import os
+import sys
+import io
+import subprocess
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+from dotenv import load_dotenv
+
+# Windows環境での標準出力エンコーディング設定
+if sys.platform == 'win32':
+    if not isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    if not isinstance(sys.stderr, io.TextIOWrapper):
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# プロジェクトルートのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from local_cache import get_cache_dir, load_json, save_json
+from zenn_platform.article_index import ArticleIndex, record_push
+from zenn_platform.repo_lock import FileLock, PushLock, RepoLockTimeout
+
+# 環境変数読み込み
+load_dotenv()
+
+# プッシュ担当プロセスが生きているとみなす最終応答からの時間（秒）
+HEARTBEAT_TIMEOUT = 30
+
+# 待機中に応答時刻を更新する間隔（秒）
+HEARTBEAT_INTERVAL = 5
+
+# 状態ファイルのロックの最大待機時間（秒）
+STATE_LOCK_TIMEOUT = 30
+
+
+def is_deferred_push_enabled() -> bool:
+    """環境変数 ZENN_PUSH_MODE が deferred の場合はプッシュをバックグラウンドで行う"""
+    return os.getenv('ZENN_PUSH_MODE', 'sync').lower() == 'deferred'
+
+
+def get_push_delay() -> float:
+    """最初のプッシュまでの待機時間（秒）。この間のコミットは1回のプッシュにまとめる"""
+    return float(os.getenv('ZENN_PUSH_DELAY', '2'))
+
+
+def get_retry_settings() -> Dict:
+    """プッシュ失敗時の再試行設定（初回の待機秒数・最大待機秒数・最大試行回数）"""
+    return {
+        'base': float(os.getenv('ZENN_PUSH_RETRY_BASE', '5')),
+        'max': float(os.getenv('ZENN_PUSH_RETRY_MAX', '300')),
+        'attempts': int(os.getenv('ZENN_PUSH_MAX_ATTEMPTS', '8'))
+    }
+
+
+def get_state_path() -> Path:
+    """プッシュ状態ファイルのパス（リポジトリのパスごとに記録）"""
+    return get_cache_dir('zenn') / 'push_state.json'
+
+
+def get_log_path() -> Path:
+    """プッシュ担当プロセスのログファイルのパス"""
+    return get_cache_dir('zenn') / 'push.log'
+
+
+def _repo_key(repo_path: Path) -> str:
+    return str(Path(repo_path).resolve())
+
+
+def _load_state(repo_path: Path) -> Dict:
+    return load_json(get_state_path(), default={}).get(_repo_key(repo_path), {})
+
+
+def _state_lock() -> FileLock:
+    """
+    状態ファイルのロック
+
+    投稿中のプロセス（リポジトリ・プッシュのロック内）からも呼ぶため、それらのロックとは別のファイルを使う
+    """
+    return FileLock(get_cache_dir('zenn') / 'push_state.lock', timeout=STATE_LOCK_TIMEOUT)
+
+
+def _update_state(repo_path: Path, **values) -> Dict:
+    # 投稿中のプロセスとプッシュ担当プロセスの更新が互いに上書きしないよう、
+    # 読み込みから書き込みまでをロックする（書き込みは save_json で一時ファイルから置き換える）
+    with _state_lock():
+        states = load_json(get_state_path(), default={})
+        state = states.setdefault(_repo_key(repo_path), {})
+        state.update(values)
+        state['heartbeat'] = time.time()
+        save_json(get_state_path(), states)
+    return state
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def _git(repo_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ['git'] + list(args),
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        errors='replace'
+    )
+
+
+def count_unpushed(repo_path: Path) -> int:
+    """
+    どのリモートにもプッシュされていないコミットの数
+
+    Raises:
+        Exception: gitコマンドが失敗した場合
+    """
+    result = _git(repo_path, 'rev-list', '--count', 'HEAD', '--not', '--remotes')
+    if result.returncode != 0:
+        raise Exception(f"git rev-list失敗: {result.stderr}")
+    return int(result.stdout.strip() or 0)
+
+
+def _is_pusher_alive(state: Dict) -> bool:
+    return state.get('status') == 'running' and time.time() - state.get('heartbeat', 0) < HEARTBEAT_TIMEOUT
+
+
+def _sleep(repo_path: Path, seconds: float) -> None:
+    """応答時刻を更新しながら待機（待機中も生きていることを示す）"""
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, HEARTBEAT_INTERVAL))
+        _update_state(repo_path)
+
+
+def schedule_push(repo_path: Path) -> bool:
+    """
+    未プッシュのコミットをバックグラウンドでプッシュするよう依頼
+
+    プッシュ担当プロセスが動いていればそのプロセスが続けてプッシュするため、
+    新しいプロセスは起動しない
+
+    Returns:
+        bool: 新しくプッシュ担当プロセスを起動したかどうか
+    """
+    repo_path = Path(repo_path)
+    if _is_pusher_alive(_load_state(repo_path)):
+        print("⏳ バックグラウンドのプッシュにまとめます")
+        return False
+
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+
+    with open(get_log_path(), 'a', encoding='utf-8') as log:
+        process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), 'worker', str(repo_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            close_fds=True,
+            **kwargs
+        )
+
+    # プロセスが状態を書き込む前に次の投稿が来ても二重に起動しないよう先に記録
+    _update_state(repo_path, status='running', pid=process.pid, started_at=_now())
+    print("⏳ バックグラウンドでプッシュします（状態確認: python main.py --zenn-status）")
+    return True
+
+
+def run_pusher(repo_path: Path, delay: Optional[float] = None) -> bool:
+    """
+    未プッシュのコミットがなくなるまでプッシュを繰り返す（プッシュ担当プロセスの本体）
+
+    待機中・プッシュ中に追加されたコミットも次のプッシュにまとめる。
+    失敗した場合は待機時間を倍にしながら再試行する。
+
+    Args:
+        repo_path: Zenn連携リポジトリのパス
+        delay: 最初のプッシュまでの待機時間（秒、省略時は ZENN_PUSH_DELAY）
+
+    Returns:
+        bool: すべてのコミットをプッシュできたかどうか
+    """
+    repo_path = Path(repo_path)
+    retry = get_retry_settings()
+    attempt = 0
+
+    _update_state(repo_path, status='running', pid=os.getpid(), next_retry_at=None)
+    _sleep(repo_path, get_push_delay() if delay is None else delay)
+
+    while True:
+        pending = count_unpushed(repo_path)
+        if pending == 0:
+            _update_state(repo_path, status='idle', pid=None, pending=0)
+            # 終了を記録する直前にコミットされた記事を取りこぼさないよう再確認
+            if count_unpushed(repo_path) == 0:
+                return True
+            _update_state(repo_path, status='running', pid=os.getpid())
+            continue
+
+        print(f"[{_now()}] ⬆️  {pending}件のコミットをプッシュ中: {repo_path}", flush=True)
+        _update_state(repo_path, pending=pending)
+        try:
+            # 投稿中のプロセスのプッシュと重ならないようにする（コミットは待たない）
+            with PushLock(repo_path):
+                commit = ArticleIndex(repo_path).commits
+                result = _git(repo_path, 'push')
+            if result.returncode == 0:
+                # 投稿中のプロセスが内容が同じ記事の再投稿でgitを実行せずに済むよう記録
+                record_push(repo_path, commit)
+        except RepoLockTimeout as e:
+            result = subprocess.CompletedProcess(['git', 'push'], 1, '', str(e))
+
+        if result.returncode == 0:
+            print(f"[{_now()}] ✅ プッシュ完了", flush=True)
+            attempt = 0
+            _update_state(
+                repo_path,
+                last_push_at=_now(),
+                last_pushed=pending,
+                last_error=None,
+                attempts=0,
+                next_retry_at=None
+            )
+            continue
+
+        attempt += 1
+        error = result.stderr.strip()
+        print(f"[{_now()}] ❌ プッシュ失敗（{attempt}回目）: {error}", flush=True)
+        if attempt >= retry['attempts']:
+            _update_state(repo_path, status='failed', pid=None, last_error=error, attempts=attempt, next_retry_at=None)
+            return False
+
+        wait = min(retry['base'] * 2 ** (attempt - 1), retry['max'])
+        _update_state(
+            repo_path,
+            last_error=error,
+            attempts=attempt,
+            next_retry_at=(datetime.now() + timedelta(seconds=wait)).isoformat(timespec='seconds')
+        )
+        _sleep(repo_path, wait)
+
+
+def get_push_status(repo_path: Path) -> Dict:
+    """
+    プッシュの状態を取得
+
+    Returns:
+        {
+            'status': 'running' / 'idle' / 'failed' / 'stopped'（プロセスが応答しない）,
+            'pending': int（未プッシュのコミット数、取得できない場合はNone）,
+            'last_push_at', 'last_pushed', 'last_error', 'attempts', 'next_retry_at'
+        }
+    """
+    repo_path = Path(repo_path)
+    state = dict(_load_state(repo_path))
+    status = state.get('status', 'idle')
+    if status == 'running' and not _is_pusher_alive(state):
+        status = 'stopped'
+    state['status'] = status
+
+    try:
+        state['pending'] = count_unpushed(repo_path)
+    except Exception:
+        state['pending'] = None
+    state['repo_path'] = str(repo_path)
+    return state
+
+
+def print_push_status(repo_path: Path) -> Dict:
+    """プッシュの状態を表示"""
+    state = get_push_status(repo_path)
+    labels = {
+        'running': '🔄 プッシュ中',
+        'idle': '✅ 待機中',
+        'failed': '❌ 失敗（次の投稿で再試行します）',
+        'stopped': '⚠️  停止（次の投稿で再開します）'
+    }
+    print(f"📦 Zennリポジトリ: {state['repo_path']}")
+    print(f"  状態: {labels.get(state['status'], state['status'])}")
+    pending = state['pending']
+    print(f"  未プッシュのコミット: {pending if pending is not None else '不明'}件")
+    if state.get('last_push_at'):
+        print(f"  最終プッシュ: {state['last_push_at']}（{state.get('last_pushed', 0)}件）")
+    if state.get('last_error'):
+        print(f"  直近のエラー（{state.get('attempts', 0)}回目）: {state['last_error']}")
+    if state.get('next_retry_at') and state['status'] == 'running':
+        print(f"  次の再試行: {state['next_retry_at']}")
+    return state
+
+
+def main():
+    """コマンドラインインターフェース"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Zenn連携リポジトリのバックグラウンドプッシュ')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    status_parser = subparsers.add_parser('status', help='プッシュの状態を表示')
+    status_parser.add_argument('repo_path', nargs='?', help='リポジトリのパス（省略時は ZENN_GITHUB_REPO_PATH）')
+
+    push_parser = subparsers.add_parser('push', help='未プッシュのコミットを今すぐプッシュ（完了まで待つ）')
+    push_parser.add_argument('repo_path', nargs='?', help='リポジトリのパス（省略時は ZENN_GITHUB_REPO_PATH）')
+
+    worker_parser = subparsers.add_parser('worker', help='プッシュ担当プロセス（内部用）')
+    worker_parser.add_argument('repo_path')
+
+    args = parser.parse_args()
+
+    repo_path = args.repo_path or os.getenv('ZENN_GITHUB_REPO_PATH')
+    if not repo_path:
+        parser.error('リポジトリのパスを指定するか、ZENN_GITHUB_REPO_PATHを.envに設定してください')
+
+    if args.command == 'status':
+        print_push_status(Path(repo_path))
+    elif args.command == 'push':
+        sys.exit(0 if run_pusher(Path(repo_path), delay=0) else 1)
+    else:
+        sys.exit(0 if run_pusher(Path(repo_path)) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zenn連携リポジトリの排他制御
+複数のプロセス・スレッドが同じリポジトリに投稿する場合に、記事インデックス・記事ファイル・
+gitの更新を1つずつ順番に行う（.git/index.lock の競合によるコミット失敗を防ぐ）。
+プッシュはコミットと別のロックで1つずつ行い、プッシュ中も次の投稿がコミットできるようにする
+
+ロックはOSのファイルロックを使うため、プロセスが異常終了しても自動的に解放される
+"""
+
+import os
+import sys
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+
+from local_cache import get_cache_dir
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+# ロックの確認間隔（秒）
+POLL_INTERVAL = 0.1
+
+
+class RepoLockTimeout(TimeoutError):
+    """ロックを取得できないまま待機時間を過ぎた"""
+
+
+def get_lock_timeout() -> float:
+    """ロックの最大待機時間（秒、環境変数 ZENN_REPO_LOCK_TIMEOUT、デフォルト: 300）"""
+    return float(os.getenv('ZENN_REPO_LOCK_TIMEOUT', '300'))
+
+
+def get_lock_path(repo_path: Path, kind: str = 'repo') -> Path:
+    """ロックファイルのパス（リポジトリのパス・ロックの種類ごとに別ファイル）"""
+    key = hashlib.sha1(str(Path(repo_path).resolve()).encode('utf-8')).hexdigest()[:12]
+    return get_cache_dir('zenn') / f'{kind}-{key}.lock'
+
+
+def _try_lock(file) -> bool:
+    try:
+        if sys.platform == 'win32':
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(file) -> None:
+    if sys.platform == 'win32':
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class FileLock:
+    """
+    ロックファイルによる排他制御（with文で使う）
+
+    使用例:
+        with FileLock(get_cache_dir('zenn') / 'push_state.lock', timeout=30):
+            ...  # 状態ファイルの読み込み・更新
+    """
+
+    # 待機を始めたときに表示するメッセージ（Noneの場合は表示しない）
+    waiting_message: Optional[str] = None
+
+    def __init__(self, path: Path, timeout: Optional[float] = None):
+        self.path = Path(path)
+        self.timeout = get_lock_timeout() if timeout is None else timeout
+        self._file = None
+
+    def _timeout_message(self) -> str:
+        return f'ロックを取得できません（{self.timeout:.0f}秒待機）: {self.path}'
+
+    def acquire(self) -> None:
+        """
+        ロックを取得（他のプロセス・スレッドが保持している間は待機）
+
+        Raises:
+            RepoLockTimeout: 待機時間内に取得できなかった場合
+        """
+        # スレッドごとに別々に開く（同じプロセス内のスレッド間でも排他になる）
+        file = open(self.path, 'a+')
+        deadline = time.monotonic() + self.timeout
+        waiting = False
+
+        while not _try_lock(file):
+            if time.monotonic() >= deadline:
+                file.close()
+                raise RepoLockTimeout(self._timeout_message())
+            if not waiting and self.waiting_message:
+                print(self.waiting_message)
+            waiting = True
+            time.sleep(POLL_INTERVAL)
+
+        self._file = file
+
+    def release(self) -> None:
+        """ロックを解放"""
+        if self._file is None:
+            return
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class RepoLock(FileLock):
+    """
+    リポジトリ単位のロック（with文で使う）
+
+    使用例:
+        with RepoLock(repo_path):
+            ...  # 記事ファイルの書き込み・コミット
+    """
+
+    waiting_message = "⏳ 他の投稿がリポジトリを更新中のため待機しています..."
+
+    def __init__(self, repo_path: Path, timeout: Optional[float] = None):
+        self.repo_path = Path(repo_path)
+        super().__init__(get_lock_path(self.repo_path), timeout)
+
+    def _timeout_message(self) -> str:
+        return f'リポジトリのロックを取得できません（{self.timeout:.0f}秒待機）: {self.repo_path}'
+
+
+class PushLock(FileLock):
+    """
+    リポジトリ単位のプッシュのロック（with文で使う）
+
+    同じブランチへのプッシュが重なってリモートの参照の更新が失敗するのを防ぐ。
+    RepoLock とは別のファイルのため、プッシュ中も他の投稿はコミットできる
+    """
+
+    def __init__(self, repo_path: Path, timeout: Optional[float] = None):
+        self.repo_path = Path(repo_path)
+        super().__init__(get_lock_path(self.repo_path, 'push'), timeout)
+
+    def _timeout_message(self) -> str:
+        return f'プッシュのロックを取得できません（{self.timeout:.0f}秒待機）: {self.repo_path}'